@@ -33,25 +33,14 @@ classes = (
 
 
 def prepare():
-    from addon_utils import enable
-    addons = [
-        'io_import_images_as_planes',
-        'io_import_dxf',
-        'io_scene_obj',  # 3.1 and heigher obj io
-        'io_scene_fbx',
-        'io_scene_gltf2',
-        'io_curve_svg',
-        'io_mesh_stl',
-        'io_mesh_ply',
-        'io_anim_bvh',
-        # 'node_wrangler', # use to set up pbr textures
+    """only record the bundled addon of each default importer/exporter,
+    they are enabled the first time their operator is used (ops.core.ensure_addon)"""
+    from .imexporter.default_importer import importer_addons
+    from .imexporter.default_exporter import exporter_addons
+    from .ops.core import ADDON_DEPENDS
 
-    ]
-    for addon in addons:
-        try:
-            enable(addon)
-        except ModuleNotFoundError:
-            pass
+    ADDON_DEPENDS.update(importer_addons)
+    ADDON_DEPENDS.update(exporter_addons)
 
 
 def register():
@@ -71,6 +60,9 @@ def unregister():
         except Exception as e:
             print(e)
 
+    from .clipboard.helper import stop_helpers
+    stop_helpers()
+
 
 if __name__ == '__main__':
     register()
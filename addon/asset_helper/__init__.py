@@ -1,5 +1,5 @@
 from . import ops_mark_asset, op_resize_image, ops_render_asset_pv, ops_set_preview, ops_snap_shot, op_batch_set, \
-    op_pop_editor
+    op_pop_editor, op_convert_bip
 
 classes = (
     ops_mark_asset,
@@ -9,6 +9,7 @@ classes = (
     ops_snap_shot,
     op_batch_set,
     op_pop_editor,
+    op_convert_bip,
 
 )
 
@@ -0,0 +1,75 @@
+import bpy
+import os
+from ...ops.profiler import profile_operator
+
+
+@profile_operator
+class SPIO_OT_convert_folder_to_bip(bpy.types.Operator):
+    bl_idname = "spio.convert_folder_to_bip"
+    bl_label = "Convert Folder to BIP"
+    bl_description = "Convert the png/jpg images of a folder to .bip files next to them, previews load them without Pillow"
+    bl_options = {'INTERNAL'}
+
+    directory: bpy.props.StringProperty(subtype='DIR_PATH')
+
+    resolution: bpy.props.EnumProperty(name='Resolution', items=[
+        ('128', '128', ''),
+        ('256', '256', ''),
+        ('512', '512', ''),
+    ], default='256')
+
+    overwrite: bpy.props.BoolProperty(name='Overwrite',
+                                      description='Convert images that already have an up to date .bip file',
+                                      default=False)
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        from ...ui.t3dn_bip.utils import support_pillow, get_python_executable
+        from ...ui.t3dn_bip.converter import folder_jobs, convert_files
+
+        if not support_pillow():
+            self.report({'ERROR'}, 'Pillow is needed to read png/jpg images')
+            return {'CANCELLED'}
+
+        directory = bpy.path.abspath(self.directory)
+        if not os.path.isdir(directory):
+            self.report({'ERROR'}, f'Folder not found: {directory}')
+            return {'CANCELLED'}
+
+        jobs = folder_jobs(directory, overwrite=self.overwrite)
+        if len(jobs) == 0:
+            self.report({'INFO'}, 'No image to convert')
+            return {'FINISHED'}
+
+        size = int(self.resolution)
+        wm = context.window_manager
+        wm.progress_begin(0, len(jobs))
+
+        errors = 0
+        try:
+            results = convert_files(jobs, image_size=(size, size), executable=get_python_executable())
+            for i, (src, dst, error) in enumerate(results):
+                if error:
+                    errors += 1
+                    print(f'Convert image "{os.path.basename(src)}" failed:', error)
+                wm.progress_update(i + 1)
+        finally:
+            wm.progress_end()
+
+        if errors:
+            self.report({'WARNING'}, f'{len(jobs) - errors} images converted, {errors} failed (see console)')
+        else:
+            self.report({'INFO'}, f'{len(jobs)} images converted')
+
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(SPIO_OT_convert_folder_to_bip)
+
+
+def unregister():
+    bpy.utils.unregister_class(SPIO_OT_convert_folder_to_bip)
@@ -2,8 +2,10 @@ import bpy
 import os
 from subprocess import run
 from ...preferences.prefs import get_pref
+from ...ops.profiler import profile_operator
 
 
+@profile_operator
 class SPIO_OT_batch_image_operate(bpy.types.Operator):
     bl_idname = "spio.batch_image_operate"
     bl_label = "Batch Image Operate"
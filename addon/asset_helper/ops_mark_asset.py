@@ -4,6 +4,8 @@ import bpy
 from bpy.props import BoolProperty, StringProperty, EnumProperty, IntProperty, CollectionProperty
 from bpy.types import PropertyGroup
 
+from ...ops.profiler import profile_operator
+
 mark_list = []
 
 
@@ -64,6 +66,7 @@ class ObjectProps(bpy.types.PropertyGroup):
     icon: StringProperty(name="Icon", default="OBJECT_DATA")
 
 
+@profile_operator
 class SPIO_OT_mark_helper(bpy.types.Operator):
     """Mark Helper"""
     bl_label = 'Mark Helper'
@@ -2,6 +2,7 @@ import bpy
 import os
 from ...preferences.prefs import get_pref
 from ...ui.t3dn_bip import previews
+from ...ops.profiler import profile_operator
 
 # Image items
 ####################
@@ -77,6 +78,12 @@ def enum_thumbnails_from_dir(directory, context):
     return image_preview.img
 
 
+def request_thumbnail_images(selected):
+    """decode the large preview of the selected item only, picking another item redraw and request it"""
+    image_preview = __tempPreview__["spio_asset_thumbnails"]
+    image_preview.request_image(selected)
+
+
 def enum_world_render_preset(self, context):
     dir = os.path.join(os.path.dirname(__file__), "hdr_scene")
     return enum_thumbnails_from_dir(dir, context)
@@ -154,6 +161,7 @@ class render_asset_preview:
         subbox.alignment = 'RIGHT'
         subbox.label(text='Style')
         subbox.template_icon_view(self, "scene", scale=6.5, scale_popup=4, show_labels=False)
+        request_thumbnail_images(self.scene)
         subbox.separator(factor=2)
 
         if hasattr(self, 'displacement'):
@@ -176,6 +184,7 @@ class render_asset_preview:
 
 
 # render world asset preview
+@profile_operator
 class SPIO_OI_render_world_asset_preview(render_asset_preview, bpy.types.Operator):
     bl_idname = "spio.render_world_asset_preview"
     bl_label = "Render World Asset Preview"
@@ -219,6 +228,7 @@ class SPIO_OI_render_world_asset_preview(render_asset_preview, bpy.types.Operato
 
 
 # render material asset preview
+@profile_operator
 class SPIO_OI_render_material_asset_preview(render_asset_preview, bpy.types.Operator):
     bl_idname = "spio.render_material_asset_preview"
     bl_label = "Render Material Asset Preview"
@@ -279,6 +289,7 @@ class SPIO_MT_asset_browser_menu(bpy.types.Menu):
 
         layout.separator()
         layout.operator('spio.batch_image_operate', icon='RENDERLAYERS')
+        layout.operator('spio.convert_folder_to_bip', icon='FILE_IMAGE')
         layout.separator()
         layout.operator('spio.mark_helper', icon='ASSET_MANAGER')
 
@@ -290,7 +301,8 @@ def asset_browser(self, context):
 
 
 def register():
-    img_preview = previews.new(max_size=(512, 512))
+    # pickers list icons, large images are decoded when the picker is drawn
+    img_preview = previews.new(max_size=(512, 512), image_on_demand=True)
     img_preview.img_dir = ""
     img_preview.img = ()
     __tempPreview__["spio_asset_thumbnails"] = img_preview
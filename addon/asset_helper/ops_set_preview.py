@@ -3,10 +3,12 @@ import os.path
 import bpy
 from bpy.props import BoolProperty, StringProperty, EnumProperty, IntProperty
 from .ops_mark_asset import redraw_window
+from ...ops.profiler import profile_operator
 
 import bpy
 
 
+@profile_operator
 class SPIO_OT_set_preview_to_selected_assets(bpy.types.Operator):
     bl_idname = "spio.set_preview_to_selected_assets"
     bl_label = "Set Preview to Selected Assets"
@@ -3,10 +3,12 @@ import os.path
 import bpy
 from bpy.props import BoolProperty, StringProperty, EnumProperty, IntProperty
 from .ops_mark_asset import redraw_window
+from ...ops.profiler import profile_operator
 
 
 # code from https://github.com/johnnygizmo/asset_snapshot/blob/main/__init__.py
 
+@profile_operator
 class SPIO_OT_asset_snap_shot(bpy.types.Operator):
     """Snapshot Active Object"""
     bl_label = 'Snapshot from Active and Set Preview'
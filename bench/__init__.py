@@ -0,0 +1,5 @@
+'''Benchmarks, not imported by the addon. Run from the addon folder:
+
+    python -m bench --help        headless pure python hot paths, against a fake bpy (stub_bpy)
+    python -m bench.e2e --help    end-to-end import/export in background blender
+'''
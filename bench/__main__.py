@@ -0,0 +1,92 @@
+'''Run the headless benchmarks
+
+    python -m bench                         # all cases, results in bench_results.json
+    python -m bench -k match --quick        # cases with "match" in the name, smaller inputs
+    python -m bench --compare old.json      # print the speed ratio to an earlier run
+'''
+import argparse
+import json
+import platform
+import sys
+import time
+
+from .stub_bpy import load_addon
+
+MIN_TIME = 1.0  # seconds of timing per case
+MIN_RUNS = 3
+
+
+def time_case(run, min_time):
+    run()  # warm up: imports, caches
+    runs = 0
+    total = 0
+    best = None
+    while total < min_time or runs < MIN_RUNS:
+        start = time.perf_counter()
+        run()
+        duration = time.perf_counter() - start
+        total += duration
+        runs += 1
+        best = duration if best is None else min(best, duration)
+
+    return runs, total, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench', description='Super IO headless benchmarks')
+    parser.add_argument('-k', dest='filter', default='', help='only run cases with this text in the name')
+    parser.add_argument('--quick', action='store_true', help='smaller inputs and shorter timing')
+    parser.add_argument('--output', default='bench_results.json', help='machine readable results')
+    parser.add_argument('--compare', default=None, help='results of an earlier run')
+    args = parser.parse_args(argv)
+
+    addon = load_addon()
+    addon.new_pref()
+
+    from .cases import CASES, cleanup
+
+    previous = dict()
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)['results']
+
+    results = dict()
+    print(f'{"case":<26}{"ops/s":>12}{"items/s":>14}{"best ms":>11}{"runs":>7}')
+    for name, setup in CASES.items():
+        if args.filter not in name: continue
+
+        try:
+            run, items = setup(addon, args.quick)
+            runs, total, best = time_case(run, MIN_TIME / 4 if args.quick else MIN_TIME)
+        finally:
+            cleanup()
+        result = {
+            'ops_per_sec': runs / total,
+            'items_per_sec': runs * items / total,
+            'mean_s': total / runs,
+            'best_s': best,
+            'runs': runs,
+            'items': items,
+        }
+        results[name] = result
+
+        line = f'{name:<26}{result["ops_per_sec"]:>12.1f}{result["items_per_sec"]:>14.0f}' \
+               f'{best * 1000:>11.3f}{runs:>7}'
+        if name in previous:
+            line += f'   x{result["ops_per_sec"] / previous[name]["ops_per_sec"]:.2f}'
+        print(line)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'results': results,
+        }, f, indent=2)
+
+    print(f'\nresults: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+'''Benchmark cases
+
+Each case is a setup function that return (callable, items per call), the callable is timed.
+Folders from new_temp_dir are removed by cleanup once the case is timed.
+'''
+import os
+import tempfile
+
+from . import synthetic
+
+PASTE_FILES = 10000
+CONFIGS = 500
+TEXTURES = 1000
+
+CASES = dict()  # name: setup
+TEMP_DIRS = list()  # TemporaryDirectory of the running case
+
+
+def case(name):
+    def wrapper(setup):
+        CASES[name] = setup
+        return setup
+
+    return wrapper
+
+
+def new_temp_dir():
+    temp_dir = tempfile.TemporaryDirectory(prefix='spio_bench_')
+    TEMP_DIRS.append(temp_dir)
+
+    return temp_dir.name
+
+
+def cleanup():
+    while TEMP_DIRS:
+        TEMP_DIRS.pop().cleanup()
+
+
+def new_configs(addon, count=CONFIGS):
+    data_config_prop = addon.module('preferences.data_config_prop')
+    return synthetic.config_items(data_config_prop.ConfigItemProperty, data_config_prop.OperatorProperty, count)
+
+
+@case('config_index_build')
+def config_index_build(addon, quick):
+    core = addon.module('ops.core')
+    config_list = new_configs(addon)
+
+    return lambda: core.ConfigIndex(config_list), len(config_list)
+
+
+@case('config_helper_lookup')
+def config_helper_lookup(addon, quick):
+    core = addon.module('ops.core')
+    addon.new_pref(config_list=new_configs(addon))
+
+    def run():
+        for ext in synthetic.EXTENSIONS:
+            core.ConfigHelper(check_use=True, filter=ext, io_type='IMPORT')
+
+    return run, len(synthetic.EXTENSIONS)
+
+
+@case('match_classify')
+def match_classify(addon, quick):
+    core = addon.module('ops.core')
+    config_index = core.ConfigIndex(new_configs(addon))
+    index_list = config_index.lookup('IMPORT', 'obj', check_use=True)
+    file_list = synthetic.file_names(PASTE_FILES // 10 if quick else PASTE_FILES)
+
+    def run():
+        config_index.matchers.clear()  # compile the rules every time, as after a config edit
+        config_index.get_matcher(index_list).classify(file_list)
+
+    return run, len(file_list)
+
+
+@case('config_item_match_files')
+def config_item_match_files(addon, quick):
+    core = addon.module('ops.core')
+    items = [core.ConfigItemHelper(item) for item in new_configs(addon, 50)]
+    file_list = synthetic.file_names(PASTE_FILES // 10)
+
+    def run():
+        for item in items:
+            item.get_match_files(file_list)
+
+    return run, len(items) * len(file_list)
+
+
+@case('convert_value')
+def convert_value(addon, quick):
+    core = addon.module('ops.core')
+    values = ['1', '0.01', '-2.5', 'True', 'False', 'OPTION_A', '1e3', '', 'forward_axis', '-.2'] * 1000
+
+    def run():
+        for value in values:
+            core.convert_value(value)
+
+    return run, len(values)
+
+
+@case('principled_tag_match')
+def principled_tag_match(addon, quick):
+    op_image_io = addon.module('ops.op_image_io')
+    prefs = addon.module('preferences.prefs')
+    tags = prefs.NWPrincipledPreferences()
+    file_names = synthetic.texture_names(TEXTURES)
+
+    def run():
+        op_image_io.match_files_to_socket_names(synthetic.socket_names(tags), file_names)
+
+    return run, len(file_names)
+
+
+@case('bip_load_file')
+def bip_load_file(addon, quick):
+    utils = addon.module('ui.t3dn_bip.utils')
+    temp_dir = new_temp_dir()
+    filepath = os.path.join(temp_dir, 'preview.bip')
+    with open(filepath, 'wb') as f:
+        f.write(synthetic.bip2_bytes(image_size=(256, 256)))
+
+    return lambda: utils.load_file(filepath, (1024, 1024)), 1
+
+
+@case('clipboard_payload')
+def clipboard_payload(addon, quick):
+    watcher = addon.module('clipboard.watcher')
+    addon.new_pref(config_list=new_configs(addon))
+    temp_dir = new_temp_dir()
+    file_list = synthetic.write_files(temp_dir, synthetic.file_names(PASTE_FILES // 10 if quick else PASTE_FILES))
+
+    def run():
+        payload = watcher.ClipboardPayload(file_list)
+        payload.resolve_configs()
+
+    return run, len(file_list)
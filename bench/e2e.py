@@ -0,0 +1,162 @@
+'''End-to-end import/export throughput in background blender
+
+    python -m bench.e2e --blender /path/to/blender             # all scenarios, bench_e2e.csv
+    python -m bench.e2e --blender blender --quick -k obj        # small meshes only, scenarios with "obj"
+
+Synthetic assets are written once to --assets (meshes in pure python, textures and .blend files by blender).
+Every scenario run in a fresh `blender --background --factory-startup` with the stub clipboard backend,
+see e2e_blender.py for what is measured.
+'''
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from .meshes import WRITERS
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCH_DIR)
+BLENDER_SCRIPT = os.path.join(BENCH_DIR, 'e2e_blender.py')
+
+TRIANGLES = [1_000, 100_000, 1_000_000, 5_000_000]
+QUICK_TRIANGLES = [1_000, 100_000]
+MESH_FORMATS = ['obj', 'ply', 'stl', 'glb']
+EXPORT_FORMATS = ['obj', 'ply', 'stl', 'fbx', 'gltf']
+TEXTURE_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'exr': 'OPEN_EXR'}
+TEXTURE_MAPS = ['basecolor', 'roughness', 'metallic', 'normal', 'ao']
+BLENDS = [(10, 100_000), (100, 1_000_000)]  # (objects, triangles)
+QUICK_BLENDS = [(10, 100_000)]
+
+CSV_FIELDS = ['scenario', 'blender', 'status', 'wall_s', 'files', 'input_mb', 'objects', 'images',
+              'peak_rss_mb', 'rss_before_mb', 'undo_growth_mb', 'error']
+
+
+def size_label(triangles):
+    return f'{triangles // 1_000_000}m' if triangles >= 1_000_000 else f'{triangles // 1_000}k'
+
+
+def write_meshes(asset_dir, triangle_counts):
+    paths = dict()
+    for ext, writer in WRITERS.items():
+        for triangles in triangle_counts:
+            path = os.path.join(asset_dir, f'grid_{size_label(triangles)}.{ext}')
+            if not os.path.isfile(path):
+                print(f'write {path}')
+                writer(path, triangles)
+            paths[ext, triangles] = path
+
+    return paths
+
+
+def run_blender(blender, mode, spec, timeout):
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump(spec, f)
+        spec_path = f.name
+
+    env = dict(os.environ, SPIO_CLIPBOARD_BACKEND='stub')
+    args = [blender, '--background', '--factory-startup', '--python', BLENDER_SCRIPT, '--', mode, spec_path]
+    try:
+        subprocess.run(args, env=env, timeout=timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    finally:
+        os.remove(spec_path)
+
+
+def generate_blender_assets(blender, asset_dir, texture_size, blends):
+    textures = list()
+    for ext, file_format in TEXTURE_FORMATS.items():
+        for name in TEXTURE_MAPS:
+            path = os.path.join(asset_dir, f'bench_{texture_size}_{name}.{ext}')
+            if not os.path.isfile(path):
+                textures.append({'path': path, 'format': file_format, 'size': [texture_size, texture_size]})
+
+    blend_specs = list()
+    for objects, triangles in blends:
+        path = os.path.join(asset_dir, f'objects_{objects}_{size_label(triangles)}.blend')
+        if not os.path.isfile(path):
+            blend_specs.append({'path': path, 'objects': objects, 'triangles': triangles})
+
+    if textures or blend_specs:
+        print(f'generate {len(textures)} textures, {len(blend_specs)} blend files')
+        run_blender(blender, 'generate', {'textures': textures, 'blends': blend_specs}, timeout=1800)
+
+
+def get_scenarios(asset_dir, quick):
+    triangle_counts = QUICK_TRIANGLES if quick else TRIANGLES
+    texture_size = 512 if quick else 2048
+    blends = QUICK_BLENDS if quick else BLENDS
+    meshes = write_meshes(asset_dir, triangle_counts)
+
+    scenarios = list()
+    for (ext, triangles), path in meshes.items():
+        scenarios.append({'name': f'import_{ext}_{size_label(triangles)}', 'kind': 'import', 'files': [path]})
+
+    for ext in TEXTURE_FORMATS:
+        files = [os.path.join(asset_dir, f'bench_{texture_size}_{name}.{ext}') for name in TEXTURE_MAPS]
+        scenarios.append({'name': f'import_{ext}_textures_{texture_size}', 'kind': 'import', 'files': files,
+                          'config': {'extension': ext, 'operator_type': 'CUSTOM', 'bl_idname': 'image.open'}})
+
+    for objects, triangles in blends:
+        path = os.path.join(asset_dir, f'objects_{objects}_{size_label(triangles)}.blend')
+        scenarios.append({'name': f'import_blend_{objects}_objects_{size_label(triangles)}', 'kind': 'import',
+                          'files': [path],
+                          'config': {'extension': 'blend', 'operator_type': 'APPEND_BLEND_OBJECT'}})
+
+    for ext in EXPORT_FORMATS:
+        for triangles in triangle_counts:
+            scenarios.append({'name': f'export_{ext}_{size_label(triangles)}', 'kind': 'export',
+                              'files': [meshes['glb', triangles]], 'extension': ext})
+
+    return scenarios, texture_size, blends
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bench.e2e', description='Super IO end-to-end benchmark')
+    parser.add_argument('--blender', default=os.getenv('BLENDER', 'blender'), help='blender executable')
+    parser.add_argument('--assets', default=os.path.join(os.path.expanduser('~'), 'spio_bench_assets'),
+                        help='folder of the generated assets, kept between runs')
+    parser.add_argument('--csv', default='bench_e2e.csv', help='results')
+    parser.add_argument('-k', dest='filter', default='', help='only run scenarios with this text in the name')
+    parser.add_argument('--quick', action='store_true', help='small meshes and textures only')
+    parser.add_argument('--timeout', type=int, default=1800, help='seconds per scenario')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.assets):
+        os.makedirs(args.assets)
+
+    scenarios, texture_size, blends = get_scenarios(args.assets, args.quick)
+    scenarios = [s for s in scenarios if args.filter in s['name']]
+    generate_blender_assets(args.blender, args.assets, texture_size, blends)
+
+    print(f'{"scenario":<34}{"status":>10}{"wall s":>10}{"peak MB":>10}{"undo MB":>10}')
+    with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+
+        for scenario in scenarios:
+            output = os.path.join(tempfile.gettempdir(), f'spio_bench_{scenario["name"]}_{os.getpid()}.json')
+            spec = dict(scenario, addon_dir=ADDON_DIR, output=output)
+
+            start = time.perf_counter()
+            try:
+                run_blender(args.blender, 'scenario', spec, args.timeout)
+                with open(output, 'r', encoding='utf-8') as result:
+                    row = json.load(result)
+                os.remove(output)
+            except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+                row = {'scenario': scenario['name'], 'status': 'FAILED',
+                       'error': f'{type(e).__name__}: {e} ({time.perf_counter() - start:.1f}s)'}
+
+            writer.writerow(row)
+            f.flush()
+            print(f'{row["scenario"]:<34}{row["status"]:>10}{row.get("wall_s", ""):>10}'
+                  f'{row.get("peak_rss_mb", ""):>10}{row.get("undo_growth_mb", ""):>10}')
+
+    print(f'\nresults: {args.csv}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,272 @@
+'''Run inside blender by bench.e2e, one process per scenario
+
+    blender --background --factory-startup --python e2e_blender.py -- generate spec.json
+    blender --background --factory-startup --python e2e_blender.py -- scenario spec.json
+
+A scenario enable the addon from the repo, push its files to the stub clipboard
+(SPIO_CLIPBOARD_BACKEND=stub), then time wm.super_import or spio.export_model.
+The result json has the wall time, the peak RSS and the undo memory growth. Undo memory is measured as the
+growth of an uncompressed .blend of the session: it is what a global (memfile) undo step hold.
+'''
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return windows_peak_rss_mb()
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on mac, kilobytes on linux
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def windows_peak_rss_mb():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + \
+                   [(name, ctypes.c_size_t) for name in (
+                       'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage', 'QuotaPagedPoolUsage',
+                       'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+
+    return counters.PeakWorkingSetSize / 1024 / 1024
+
+
+def session_size():
+    """bytes of the session written as an uncompressed .blend, the size of a memfile undo step"""
+    path = os.path.join(tempfile.gettempdir(), f'spio_bench_undo_{os.getpid()}.blend')
+    bpy.ops.wm.save_as_mainfile(filepath=path, copy=True, compress=False, check_existing=False)
+    size = os.path.getsize(path)
+    os.remove(path)
+
+    return size
+
+
+def get_view3d_override():
+    """window and area to run the operators from, None when background blender has no window
+
+    Without an override context.area is None, config imports then match configs of every area.
+    """
+    for window in bpy.context.window_manager.windows:
+        area = max(window.screen.areas, key=lambda a: a.width * a.height, default=None)
+        if area is None: continue
+
+        area.type = 'VIEW_3D'
+        region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        return {'window': window, 'screen': window.screen, 'area': area, 'region': region}
+
+
+def call_op(op, override, *args, **kwargs):
+    if override is None:
+        return op(*args, **kwargs)
+    if hasattr(bpy.context, 'temp_override'):
+        with bpy.context.temp_override(**override):
+            return op(*args, **kwargs)
+
+    return op(override, *args, **kwargs)
+
+
+def enable_addon(addon_dir):
+    import addon_utils
+
+    sys.path.insert(0, os.path.dirname(addon_dir))
+    module_name = os.path.basename(addon_dir)
+    addon_utils.enable(module_name, default_set=True)
+
+    return module_name, bpy.context.preferences.addons[module_name].preferences
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+
+def add_config(pref, config):
+    from importlib import import_module
+
+    item = pref.config_list.add()
+    item.name = 'bench'
+    item.io_type = 'IMPORT'
+    item.extension = config['extension']
+    item.operator_type = config['operator_type']
+    if config['operator_type'] == 'CUSTOM':
+        item.bl_idname = config['bl_idname']
+        item.context = 'EXEC_DEFAULT'
+    # match every file, matched files are imported without the popup menu
+    item.match_rule = 'REGEX'
+    item.match_value = '.'
+
+    module_name = pref.__module__.split('.')[0]
+    import_module(f'{module_name}.preferences.utils').tag_config_update()
+
+
+def run_import(module_name, spec, override):
+    from importlib import import_module
+    Clipboard = import_module(f'{module_name}.clipboard.clipboard').Clipboard
+
+    Clipboard().push_to_clipboard(spec['files'])  # also start the helper, not timed
+    bpy.context.window_manager.clipboard = ''
+
+    start = time.perf_counter()
+    result = call_op(bpy.ops.wm.super_import, override, 'INVOKE_DEFAULT')
+    wall = time.perf_counter() - start
+
+    return wall, result
+
+
+def prepare_export(module_name, spec):
+    """import the model to export and select it, before the baseline"""
+    from importlib import import_module
+    importer = import_module(f'{module_name}.imexporter.default_importer').get_importer(cpp_obj_importer=True)
+    get_op_by_idname = import_module(f'{module_name}.ops.core').get_op_by_idname
+
+    for filepath in spec['files']:
+        op = get_op_by_idname(importer.get(filepath.split('.')[-1].lower()))
+        op(filepath=filepath)
+
+    meshes = [obj for obj in bpy.context.view_layer.objects if obj.type == 'MESH']
+    for obj in meshes:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = meshes[0]
+
+
+def run_export(module_name, spec, override):
+    from importlib import import_module
+    Clipboard = import_module(f'{module_name}.clipboard.clipboard').Clipboard
+
+    start = time.perf_counter()
+    result = call_op(bpy.ops.spio.export_model, override, 'EXEC_DEFAULT', extension=spec['extension'])
+    wall = time.perf_counter() - start
+
+    # exported files are pushed to the stub clipboard
+    for path in Clipboard().backend().pull():
+        if os.path.isfile(path): os.remove(path)
+
+    return wall, result
+
+
+def scenario(spec):
+    module_name, pref = enable_addon(spec['addon_dir'])
+    pref.cpp_obj_importer = True
+    pref.cpp_obj_exporter = True
+    pref.extend_export_menu = True
+    pref.post_open_dir = False
+
+    clear_scene()
+    if spec.get('config'):
+        add_config(pref, spec['config'])
+    if spec['kind'] == 'export':
+        prepare_export(module_name, spec)
+
+    override = get_view3d_override()
+    gc.collect()
+    rss_before = peak_rss_mb()
+    size_before = session_size()
+    objects_before = len(bpy.data.objects)
+    images_before = len(bpy.data.images)
+
+    error = ''
+    try:
+        if spec['kind'] == 'import':
+            wall, result = run_import(module_name, spec, override)
+        else:
+            wall, result = run_export(module_name, spec, override)
+        status = ','.join(sorted(result))
+    except Exception as e:
+        wall, status, error = 0, 'ERROR', str(e)
+        if override is None:
+            error = f'no window to run from (background blender has no area): {error}'
+
+    row = {
+        'scenario': spec['name'],
+        'blender': bpy.app.version_string,
+        'status': status,
+        'wall_s': round(wall, 4),
+        'files': len(spec['files']),
+        'input_mb': round(sum(os.path.getsize(path) for path in spec['files']) / 1024 / 1024, 3),
+        'objects': len(bpy.data.objects) - objects_before,
+        'images': len(bpy.data.images) - images_before,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_before_mb': round(rss_before, 1),
+        'undo_growth_mb': round((session_size() - size_before) / 1024 / 1024, 3),
+        'error': error,
+    }
+
+    with open(spec['output'], 'w', encoding='utf-8') as f:
+        json.dump(row, f)
+
+
+def generate(spec):
+    import numpy as np
+
+    for texture in spec.get('textures', []):
+        width, height = texture['size']
+        image = bpy.data.images.new(os.path.basename(texture['path']), width, height, alpha=True,
+                                    float_buffer=texture['format'] == 'OPEN_EXR')
+        x = np.linspace(0, 1, width, dtype=np.float32)
+        y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+        pixels = np.empty((height, width, 4), dtype=np.float32)
+        pixels[..., 0] = x
+        pixels[..., 1] = y
+        pixels[..., 2] = (np.sin(x * 40) * np.cos(y * 40) + 1) / 2
+        pixels[..., 3] = 1
+        image.pixels.foreach_set(pixels.ravel())
+
+        image.filepath_raw = texture['path']
+        image.file_format = texture['format']
+        image.save()
+        bpy.data.images.remove(image)
+
+    for blend in spec.get('blends', []):
+        clear_scene()
+        side = max(2, int((blend['triangles'] / blend['objects'] / 2) ** 0.5) + 1)
+        grid = np.stack(np.meshgrid(np.arange(side), np.arange(side)), -1).reshape(-1, 2) / (side - 1)
+        verts = np.zeros((side * side, 3), dtype=np.float32)
+        verts[:, :2] = grid
+        quads = np.arange(side * side).reshape(side, side)[:-1, :-1].ravel()
+        faces = np.stack([quads, quads + 1, quads + side + 1, quads + side], -1)
+        verts, faces = verts.tolist(), faces.tolist()
+
+        objects = set()
+        for i in range(blend['objects']):
+            mesh = bpy.data.meshes.new(f'grid_{i}')
+            mesh.from_pydata(verts, [], faces)
+            mesh.update()
+
+            obj = bpy.data.objects.new(f'grid_{i}', mesh)
+            obj.location = (i % 10) * 1.2, (i // 10) * 1.2, 0
+            objects.add(obj)
+
+        bpy.data.libraries.write(blend['path'], objects, fake_user=True)
+
+
+def main(args):
+    mode, spec_path = args[0], args[1]
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+
+    if mode == 'generate':
+        generate(spec)
+    else:
+        scenario(spec)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -0,0 +1,139 @@
+'''Pure python writers of grid meshes, for the end-to-end benchmark assets
+
+A grid of n x n quads split in two triangles, so any triangle count can be written without blender.
+'''
+import json
+import math
+import struct
+from array import array
+
+CHUNK = 65536  # faces formatted per write
+
+
+def grid(triangles):
+    """(vertex count per side, quads per side) of a grid with at least `triangles` triangles"""
+    quads = max(1, math.ceil(math.sqrt(triangles / 2)))
+    return quads + 1, quads
+
+
+def grid_vertices(side):
+    step = 1 / (side - 1)
+    for y in range(side):
+        for x in range(side):
+            yield x * step, y * step, math.sin(x * step * 6.283) * math.cos(y * step * 6.283) * 0.05
+
+
+def grid_triangles(side, quads):
+    for y in range(quads):
+        row = y * side
+        for x in range(quads):
+            a = row + x
+            b = a + 1
+            c = a + side
+            d = c + 1
+            yield a, b, d
+            yield a, d, c
+
+
+def write_obj(filepath, triangles):
+    side, quads = grid(triangles)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(f'# spio bench grid {quads}x{quads}\no grid\n')
+        f.writelines(f'v {x:.6f} {y:.6f} {z:.6f}\n' for x, y, z in grid_vertices(side))
+
+        lines = list()
+        for a, b, c in grid_triangles(side, quads):
+            lines.append(f'f {a + 1} {b + 1} {c + 1}\n')
+            if len(lines) == CHUNK:
+                f.writelines(lines)
+                lines.clear()
+        f.writelines(lines)
+
+
+def write_ply(filepath, triangles):
+    side, quads = grid(triangles)
+    face_count = quads * quads * 2
+    header = ('ply\nformat binary_little_endian 1.0\n'
+              f'element vertex {side * side}\nproperty float x\nproperty float y\nproperty float z\n'
+              f'element face {face_count}\nproperty list uchar int vertex_indices\nend_header\n')
+
+    face = struct.Struct('<Biii')
+    with open(filepath, 'wb') as f:
+        f.write(header.encode('ascii'))
+        f.write(array('f', (v for vertex in grid_vertices(side) for v in vertex)).tobytes())
+
+        chunk = list()
+        for tri in grid_triangles(side, quads):
+            chunk.append(face.pack(3, *tri))
+            if len(chunk) == CHUNK:
+                f.write(b''.join(chunk))
+                chunk.clear()
+        f.write(b''.join(chunk))
+
+
+def write_stl(filepath, triangles):
+    side, quads = grid(triangles)
+    vertices = list(grid_vertices(side))
+    face = struct.Struct('<12fH')
+
+    with open(filepath, 'wb') as f:
+        f.write(b'spio bench grid'.ljust(80, b' '))
+        f.write(struct.pack('<I', quads * quads * 2))
+
+        chunk = list()
+        for a, b, c in grid_triangles(side, quads):
+            chunk.append(face.pack(0, 0, 1, *vertices[a], *vertices[b], *vertices[c], 0))
+            if len(chunk) == CHUNK:
+                f.write(b''.join(chunk))
+                chunk.clear()
+        f.write(b''.join(chunk))
+
+
+def write_glb(filepath, triangles):
+    side, quads = grid(triangles)
+    positions = array('f', (v for vertex in grid_vertices(side) for v in vertex))
+    indices = array('I', (i for tri in grid_triangles(side, quads) for i in tri))
+    if struct.pack('=I', 1) != struct.pack('<I', 1):
+        positions.byteswap()
+        indices.byteswap()
+
+    position_bytes = positions.tobytes()
+    index_bytes = indices.tobytes()
+    binary = position_bytes + index_bytes
+
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'spio bench'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{'mesh': 0, 'name': 'grid'}],
+        'meshes': [{'primitives': [{'attributes': {'POSITION': 0}, 'indices': 1}]}],
+        'buffers': [{'byteLength': len(binary)}],
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': len(position_bytes), 'target': 34962},
+            {'buffer': 0, 'byteOffset': len(position_bytes), 'byteLength': len(index_bytes), 'target': 34963},
+        ],
+        'accessors': [
+            {'bufferView': 0, 'componentType': 5126, 'count': side * side, 'type': 'VEC3',
+             'min': [min(positions[i::3]) for i in range(3)], 'max': [max(positions[i::3]) for i in range(3)]},
+            {'bufferView': 1, 'componentType': 5125, 'count': len(indices), 'type': 'SCALAR'},
+        ],
+    }
+
+    json_bytes = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_bytes += b' ' * (-len(json_bytes) % 4)
+    binary += b'\x00' * (-len(binary) % 4)
+
+    with open(filepath, 'wb') as f:
+        f.write(struct.pack('<III', 0x46546C67, 2, 12 + 8 + len(json_bytes) + 8 + len(binary)))
+        f.write(struct.pack('<II', len(json_bytes), 0x4E4F534A))
+        f.write(json_bytes)
+        f.write(struct.pack('<II', len(binary), 0x004E4942))
+        f.write(binary)
+
+
+WRITERS = {
+    'obj': write_obj,
+    'ply': write_ply,
+    'stl': write_stl,
+    'glb': write_glb,
+}
@@ -0,0 +1,285 @@
+'''Minimal fake bpy, enough to import the addon modules that hold pure python hot paths
+
+    from bench.stub_bpy import load_addon
+    addon = load_addon()
+    core = addon.module('ops.core')
+
+The addon is loaded as the package ADDON_NAME without running its __init__ files,
+so only the modules a benchmark import (and their imports) are executed.
+'''
+import importlib
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+
+ADDON_NAME = 'super_io'
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Stub():
+    '''Any attribute, call or item of a stub is another stub'''
+
+    def __init__(self, name='stub'):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith('__'): raise AttributeError(name)
+        stub = Stub(f'{self._name}.{name}')
+        object.__setattr__(self, name, stub)
+        return stub
+
+    def __call__(self, *args, **kwargs):
+        return Stub(f'{self._name}()')
+
+    def __getitem__(self, key):
+        return Stub(f'{self._name}[{key!r}]')
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f'<Stub {self._name}>'
+
+
+class StubStruct():
+    '''Base of every bpy.types class'''
+    bl_rna = Stub('bl_rna')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('__'): raise AttributeError(name)
+        # property defined by annotation: default value
+        for klass in type(self).__mro__:
+            prop = getattr(klass, '__annotations__', {}).get(name)
+            if prop is not None:
+                return prop_default(prop)
+
+        return Stub(f'{type(self).__name__}.{name}')
+
+    def report(self, type, message):
+        pass
+
+
+def prop_default(prop):
+    function, kwargs = prop
+    if function == 'CollectionProperty':
+        return list()
+    elif function == 'PointerProperty':
+        return kwargs['type']()
+    elif 'default' in kwargs:
+        return kwargs['default']
+
+    return {
+        'BoolProperty': False,
+        'IntProperty': 0,
+        'FloatProperty': 0.0,
+        'StringProperty': '',
+        'EnumProperty': '',
+    }.get(function)
+
+
+def make_props():
+    props = ModuleType('bpy.props')
+    for name in ('BoolProperty', 'IntProperty', 'FloatProperty', 'StringProperty', 'EnumProperty',
+                 'CollectionProperty', 'PointerProperty', 'FloatVectorProperty', 'IntVectorProperty',
+                 'BoolVectorProperty'):
+        # same shape as blender's deferred property: (function, keywords)
+        setattr(props, name, lambda _name=name, **kwargs: (_name, kwargs))
+
+    return props
+
+
+def make_types():
+    types = ModuleType('bpy.types')
+    classes = dict()
+
+    def __getattr__(name):
+        if name.startswith('__'): raise AttributeError(name)
+        if name not in classes:
+            classes[name] = type(name, (StubStruct,), {'__module__': 'bpy.types'})
+        return classes[name]
+
+    types.__getattr__ = __getattr__
+    return types
+
+
+def make_utils():
+    utils = ModuleType('bpy.utils')
+    previews = ModuleType('bpy.utils.previews')
+    previews.new = lambda: dict()
+    previews.remove = lambda collection: None
+    previews.ImagePreviewCollection = dict
+    utils.previews = previews
+
+    utils.register_class = lambda cls: None
+    utils.unregister_class = lambda cls: None
+    utils.user_resource = lambda resource_type, path='', create=False: os.path.join(os.path.expanduser('~'), path)
+    utils.script_path_user = lambda: os.path.expanduser('~')
+
+    return utils, previews
+
+
+def make_app(version):
+    app = ModuleType('bpy.app')
+    app.__path__ = []  # so "from bpy.app.handlers import persistent" resolve as a package
+    app.version = version
+    app.version_string = '.'.join(str(v) for v in version)
+    app.binary_path = 'blender'
+    app.binary_path_python = sys.executable
+    app.background = True
+    app.translations = Stub('bpy.app.translations')
+    app.handlers = ModuleType('bpy.app.handlers')
+    app.handlers.persistent = lambda func: func
+    for name in ('load_pre', 'load_post', 'load_factory_preferences_post', 'depsgraph_update_post', 'save_pre',
+                 'undo_post', 'redo_post'):
+        setattr(app.handlers, name, [])
+
+    timers = ModuleType('bpy.app.timers')
+    timers.register = lambda function, first_interval=0, persistent=False: None
+    timers.unregister = lambda function: None
+    timers.is_registered = lambda function: False
+    app.timers = timers
+
+    return app, timers
+
+
+def make_path():
+    path = ModuleType('bpy.path')
+    path.abspath = lambda p, start=None, library=None: os.path.abspath(p[2:] if p.startswith('//') else p)
+    path.relpath = lambda p, start=None: p
+    path.basename = lambda p: os.path.basename(p[2:] if p.startswith('//') else p)
+    path.display_name = lambda name, has_ext=True: name
+    return path
+
+
+class Preferences():
+    '''bpy.context.preferences, the addon preferences are set by load_addon'''
+
+    def __init__(self):
+        self.addon_prefs = dict()
+        self.addons = self
+        self.filepaths = SimpleNamespace(save_version=1)
+        self.view = SimpleNamespace(use_translate_interface=False)
+
+    def get(self, name):
+        prefs = self.addon_prefs.get(name)
+        return SimpleNamespace(preferences=prefs) if prefs is not None else None
+
+
+class Context(Stub):
+    def __init__(self):
+        super().__init__('bpy.context')
+        self.preferences = Preferences()
+        self.window_manager = SimpleNamespace(clipboard='', windows=[])
+
+
+def install(version=(3, 6, 0)):
+    '''put the fake blender modules in sys.modules, return the bpy module'''
+    if isinstance(sys.modules.get('bpy'), ModuleType) and getattr(sys.modules['bpy'], '__stub__', False):
+        return sys.modules['bpy']
+
+    bpy = ModuleType('bpy')
+    bpy.__stub__ = True
+    bpy.__path__ = []  # so "import bpy.utils.previews" resolve as a package
+
+    bpy.props = make_props()
+    bpy.types = make_types()
+    bpy.utils, previews = make_utils()
+    bpy.app, timers = make_app(version)
+    bpy.path = make_path()
+    bpy.context = Context()
+    bpy.data = Stub('bpy.data')
+    bpy.ops = Stub('bpy.ops')
+    bpy.msgbus = Stub('bpy.msgbus')
+
+    mathutils = ModuleType('mathutils')
+    mathutils.Vector = lambda values=(0, 0, 0): tuple(values)
+
+    bpy_extras = ModuleType('bpy_extras')
+    io_utils = ModuleType('bpy_extras.io_utils')
+    io_utils.ImportHelper = type('ImportHelper', (), {})
+    io_utils.ExportHelper = type('ExportHelper', (), {})
+    bpy_extras.io_utils = io_utils
+
+    addon_utils = ModuleType('addon_utils')
+    addon_utils.enable = lambda module_name, default_set=False, persistent=False: None
+    addon_utils.check = lambda module_name: (False, False)
+
+    rna_keymap_ui = ModuleType('rna_keymap_ui')
+    rna_keymap_ui.draw_kmi = lambda *args: None
+
+    sys.modules.update({
+        'bpy': bpy,
+        'bpy.props': bpy.props,
+        'bpy.types': bpy.types,
+        'bpy.utils': bpy.utils,
+        'bpy.utils.previews': previews,
+        'bpy.app': bpy.app,
+        'bpy.app.timers': timers,
+        'bpy.app.handlers': bpy.app.handlers,
+        'bpy.path': bpy.path,
+        'mathutils': mathutils,
+        'bpy_extras': bpy_extras,
+        'bpy_extras.io_utils': io_utils,
+        'addon_utils': addon_utils,
+        'rna_keymap_ui': rna_keymap_ui,
+    })
+
+    return bpy
+
+
+class Addon():
+    def __init__(self, bpy):
+        self.bpy = bpy
+
+    def module(self, name):
+        """import a module of the addon, 'ops.core' for example"""
+        return importlib.import_module(f'{ADDON_NAME}.{name}')
+
+    def set_pref(self, prefs):
+        self.bpy.context.preferences.addon_prefs[ADDON_NAME] = prefs
+
+    def new_pref(self, **values):
+        """addon preferences with the default value of every property, then the given values"""
+        pref_class = self.module('preferences.prefs').SPIO_Preference
+        pref = pref_class()
+        for key, value in values.items():
+            setattr(pref, key, value)
+
+        self.set_pref(pref)
+        return pref
+
+
+def load_addon(version=(3, 6, 0)):
+    bpy = install(version)
+
+    if ADDON_NAME not in sys.modules:
+        # empty packages, the __init__ of the addon register everything in blender
+        for root, dirs, files in os.walk(ADDON_DIR):
+            dirs[:] = [d for d in dirs if d not in {'bench', '__pycache__', 'third_party_addons'}]
+            if '__init__.py' not in files: continue
+
+            rel = os.path.relpath(root, ADDON_DIR)
+            name = ADDON_NAME if rel == '.' else f'{ADDON_NAME}.{rel.replace(os.sep, ".")}'
+            package = ModuleType(name)
+            package.__path__ = [root]
+            package.__package__ = name
+            package.__file__ = os.path.join(root, '__init__.py')
+            sys.modules[name] = package
+
+            if '.' in name:
+                parent, child = name.rsplit('.', 1)
+                setattr(sys.modules[parent], child, package)
+
+        sys.modules[ADDON_NAME].__folder_name__ = ADDON_NAME
+        sys.modules[ADDON_NAME].bl_info = {'version': (0, 0, 0)}
+
+    return Addon(bpy)
@@ -0,0 +1,137 @@
+'''Synthetic inputs of the benchmarks, seeded so every run get the same data'''
+import os
+import random
+import zlib
+
+SEED = 7
+
+EXTENSIONS = ['obj', 'fbx', 'glb', 'stl', 'ply', 'png', 'jpg', 'blend', 'usd', 'abc']
+WORDS = ['rock', 'tree', 'wall', 'brick', 'metal', 'wood', 'floor', 'chair', 'lamp', 'car', 'door', 'crate',
+         'barrel', 'fence', 'roof', 'tile', 'grass', 'sand', 'cliff', 'pipe']
+TEXTURE_TAGS = ['diffuse', 'diff', 'albedo', 'base', 'col', 'color', 'rough', 'roughness', 'gloss', 'metal',
+                'metallic', 'nor', 'normal', 'nrm', 'bump', 'disp', 'displacement', 'height', 'ao', 'ambient',
+                'occlusion', 'spec', 'specular', 'emission', 'emit', 'alpha', 'opacity', 'sss', 'preview']
+
+
+def file_names(count, seed=SEED):
+    """paste of `count` files, mostly obj, named like asset exports"""
+    rand = random.Random(seed)
+    names = list()
+    for i in range(count):
+        ext = 'obj' if rand.random() < 0.7 else rand.choice(EXTENSIONS)
+        parts = [rand.choice(WORDS) for _ in range(rand.randint(1, 3))]
+        prefix = rand.choice(['SM_', 'SK_', 'LOD_', 'HP_', ''])
+        suffix = rand.choice(['_high', '_low', '_lod0', '_lod1', ''])
+        names.append(f'/assets/{rand.choice(WORDS)}/{prefix}{"_".join(parts)}{suffix}_{i:05d}.{ext}')
+
+    return names
+
+
+def config_values(count, seed=SEED):
+    """(name, extension, match rule, match value) of `count` import configs"""
+    rand = random.Random(seed)
+    rules = ['NONE', 'STARTSWITH', 'ENDSWITH', 'IN', 'REGEX']
+    configs = list()
+    for i in range(count):
+        rule = rules[i % len(rules)]
+        ext = 'obj' if rand.random() < 0.5 else rand.choice(EXTENSIONS)
+        word = rand.choice(WORDS)
+        value = {
+            'NONE': '',
+            'STARTSWITH': rand.choice(['SM_', 'SK_', 'LOD_', 'HP_']) + word,
+            'ENDSWITH': rand.choice(['_high', '_low', '_lod0', '_lod1']),
+            'IN': word,
+            'REGEX': rf'{word}_\w+_0{rand.randint(0, 9)}',
+        }[rule]
+        configs.append((f'config_{i:03d}', ext, rule, value))
+
+    return configs
+
+
+def config_items(item_class, operator_property_class, count, seed=SEED):
+    """preferences config list items"""
+    items = list()
+    for name, ext, rule, value in config_values(count, seed):
+        item = item_class()
+        item.name = name
+        item.extension = ext
+        item.match_rule = rule
+        item.match_value = value
+        item.io_type = 'IMPORT'
+        item.context_area = 'VIEW_3D'
+        item.context = 'EXEC_DEFAULT'
+        item.color_tag = 'COLOR_01'
+        item.operator_type = 'DEFAULT_OBJ'
+        item.bl_idname = ''
+        item.use_config = True
+
+        prop = operator_property_class()
+        prop.name = 'global_scale'
+        prop.value = '0.01'
+        item.prop_list = [prop]
+        items.append(item)
+
+    return items
+
+
+def texture_names(count, seed=SEED):
+    """file names of a texture folder with `count` images"""
+    rand = random.Random(seed)
+    names = list()
+    for i in range(count):
+        material = ''.join(w.title() for w in rand.sample(WORDS, 2))
+        tag = rand.choice(TEXTURE_TAGS)
+        res = rand.choice(['1k', '2k', '4k', '8k'])
+        sep = rand.choice(['_', '-', '.'])
+        names.append(f'{material}{sep}{tag}{sep}{res}.{i:03d}.{rand.choice(["png", "jpg", "exr", "tif"])}')
+
+    return names
+
+
+def socket_names(tags):
+    """socket table of SPIO_OT_create_principled_set_up_material"""
+    return [
+        ['Displacement', tags.displacement.split(' '), None],
+        ['Base Color', tags.base_color.split(' '), None],
+        ['Subsurface Color', tags.sss_color.split(' '), None],
+        ['Metallic', tags.metallic.split(' '), None],
+        ['Specular', tags.specular.split(' '), None],
+        ['Roughness', tags.rough.split(' ') + tags.gloss.split(' '), None],
+        ['Normal', tags.normal.split(' ') + tags.bump.split(' '), None],
+        ['Transmission', tags.transmission.split(' '), None],
+        ['Emission', tags.emission.split(' '), None],
+        ['Alpha', tags.alpha.split(' '), None],
+        ['Ambient Occlusion', tags.ambient_occlusion.split(' '), None],
+    ]
+
+
+def bip2_bytes(image_size=(256, 256), icon_size=(32, 32), seed=SEED):
+    """a BIP2 file with an icon and an image of noisy RGBA pixels"""
+    rand = random.Random(seed)
+
+    def pixels(size):
+        # noisy but compressible, like a real preview
+        row = bytes(rand.randrange(256) for _ in range(size[0] * 4))
+        return row * size[1]
+
+    icon = zlib.compress(pixels(icon_size))
+    image = zlib.compress(pixels(image_size))
+
+    header = b'BIP2' + (2).to_bytes(1, 'big')
+    for size, data in ((icon_size, icon), (image_size, image)):
+        header += size[0].to_bytes(2, 'big') + size[1].to_bytes(2, 'big') + len(data).to_bytes(4, 'big')
+
+    return header + icon + image
+
+
+def write_files(directory, names):
+    """empty files, for code that stat the paste"""
+    paths = list()
+    for name in names:
+        path = os.path.join(directory, name.strip('/').replace('/', '_'))
+        with open(path, 'wb'):
+            pass
+        paths.append(path)
+
+    return paths
+
@@ -3,24 +3,14 @@ from __future__ import annotations
 import subprocess
 import os
 import sys
+from abc import ABC, abstractmethod
 
 from locale import getdefaultlocale
 
-import time
 import bpy
 
-TEMP_DIR = ''
-IMAGE_CREATE_TIME_COST = 1  # seconds
-
-
-def get_dir():
-    global TEMP_DIR
-    if TEMP_DIR == '':
-        TEMP_DIR = os.path.join(os.path.expanduser('~'), 'spio_temp')
-        if not "spio_temp" in os.listdir(os.path.expanduser('~')):
-            os.makedirs(TEMP_DIR)
-
-    return TEMP_DIR
+from .helper import HelperError, get_helper
+from .temp_store import get_dir, get_staging_path, store_file, evict_async, set_pushed_paths
 
 
 class CheckStringFile():
@@ -56,24 +46,22 @@ class CheckStringFile():
 
 class Clipboard():
     def __init__(self, file_urls=None):
-        if sys.platform not in {'win32', 'darwin'}:
+        self.backend = get_backend()
+        if self.backend is None:
             raise EnvironmentError
 
     def pull_files_from_clipboard(self, force_unicode):
-        file_list = []
+        file_list = None
 
-        if sys.platform == 'win32':
+        if self.backend is PowerShellClipboard:
+            # native read is the fastest, only fallback to the helper when decode failed
             clipboard = WinTypeClipboard()
             file_list = clipboard.pull(force_unicode)
 
             del clipboard
 
-            if file_list is None:
-                clipboard = PowerShellClipboard()
-                file_list = clipboard.pull()
-
-        elif sys.platform == 'darwin':
-            clipboard = MacClipboard()
+        if file_list is None:
+            clipboard = self.backend()
             file_list = clipboard.pull()
 
         # user is copying files
@@ -91,54 +79,48 @@ class Clipboard():
         # user is copying image bytes
         image_path = self.pull_image_from_clipboard()  # create image from clipboard
 
-        # check file exist (if image is not exist, return [])
-        if not os.path.isfile(image_path):
-            return file_list
-
-        # check image create time(pull pixel from clipboard time) is smaller than IMAGE_CREATE_TIME_COST
-        if time.time() - os.path.getmtime(image_path) < IMAGE_CREATE_TIME_COST:
+        # same pixels always give the same file, the image in blender (if any) is still valid
+        if image_path:
             file_list.append(image_path)
-            # reload image before it import (if already reload)
-            if os.path.basename(image_path) in bpy.data.images:
-                bpy.data.images[os.path.basename(image_path)].reload()
-            else:
-                for img in bpy.data.images:
-                    if not img.library and not img.packed_file and img.source not in {'VIEWER',
-                                                                                      'GENERATED'}:
-                        path = os.path.abspath(img.filepath)
-                        if path == image_path:
-                            img.reload()
-                            break
 
         return file_list
 
     def push_to_clipboard(self, paths):
-        if sys.platform == 'win32':
-            clipboard = PowerShellClipboard()
-        elif sys.platform == 'darwin':
-            clipboard = MacClipboard()
-
+        clipboard = self.backend()
         clipboard.push_to_clipboard(paths)
+        set_pushed_paths(paths)
 
     def push_pixel_to_clipboard(self, path):
-        if sys.platform == 'win32':
-            clipboard = PowerShellClipboard()
-        elif sys.platform == 'darwin':
-            clipboard = MacClipboard()
-
+        clipboard = self.backend()
         clipboard.push_pixel_to_clipboard(path)
+        set_pushed_paths([path])
 
     def pull_image_from_clipboard(self):
-        if sys.platform == 'win32':
-            clipboard = PowerShellClipboard()
-        elif sys.platform == 'darwin':
-            clipboard = MacClipboard()
+        """save clipboard pixels into the content addressed temp store, return None if no image"""
+        staging_path = get_staging_path()
+        if os.path.isfile(staging_path): os.remove(staging_path)
+
+        clipboard = self.backend()
+        clipboard.pull_image_from_clipboard(staging_path)
+
+        if not os.path.isfile(staging_path): return
+        # mac create an empty file when there is no image
+        if os.path.getsize(staging_path) == 0:
+            os.remove(staging_path)
+            return
+
+        image_path = store_file(staging_path)
+        evict_async(keep=[image_path])
 
-        return clipboard.pull_image_from_clipboard()
+        return image_path
 
 
 class MacClipboard():
 
+    def change_count(self):
+        """not supported, the clipboard watcher is disabled on mac"""
+        return None
+
     def pull(self, force_unicode=False):
         self.file_urls = []
         from .darwin import _native as pasteboard
@@ -174,10 +156,7 @@ class MacClipboard():
             args += ["-e", command]
         return args
 
-    def pull_image_from_clipboard(self, save_name='spio_from_clipboard.png'):
-        ts = time.strftime('%Y_%m_%d_%H_%M_%S', time.localtime())
-        filepath = os.path.join(get_dir(), ts + '.' + save_name)
-
+    def pull_image_from_clipboard(self, filepath):
         commands = [
             "set pastedImage to "
             f'(open for access POSIX file "{filepath}" with write permission)',
@@ -192,9 +171,51 @@ class MacClipboard():
         return filepath
 
 
-class PowerShellClipboard:
-    def get_args(self, script):
-        powershell_args = [
+class HelperClipboard(ABC):
+    """Clipboard backend that send commands to a long-lived helper process"""
+    helper_name = None
+
+    @abstractmethod
+    def get_helper_args(self):
+        """command line that start the helper process"""
+
+    def request(self, cmd, **args):
+        try:
+            return get_helper(self.helper_name, self.get_helper_args).request(cmd, **args)
+        except HelperError as e:
+            print(f'SPIO clipboard: {e}')
+            return dict()
+
+    def pull(self, force_unicode=False):
+        res = self.request('pull_files')
+
+        files = res.get('files') or []
+        # powershell turn single item array into string
+        if isinstance(files, str): files = [files]
+
+        self.file_urls = [file for file in files if file != '']
+        return self.file_urls
+
+    def change_count(self):
+        return self.request('change_count').get('count')
+
+    def push_to_clipboard(self, paths):
+        self.request('push_files', paths=list(paths))
+
+    def push_pixel_to_clipboard(self, path):
+        self.request('push_image', path=path)
+
+    def pull_image_from_clipboard(self, filepath):
+        self.request('pull_image', filepath=filepath)
+
+        return filepath
+
+
+class PowerShellClipboard(HelperClipboard):
+    helper_name = 'powershell'
+
+    def get_helper_args(self):
+        return [
             os.path.join(
                 os.getenv("SystemRoot"),
                 "System32",
@@ -205,89 +226,27 @@ class PowerShellClipboard:
             "-NoProfile",
             "-NoLogo",
             "-NonInteractive",
+            "-STA",
+            "-ExecutionPolicy",
+            "Bypass",
             "-WindowStyle",
             "Hidden",
+            "-File",
+            os.path.join(os.path.dirname(__file__), 'win32', 'spio_helper.ps1'),
         ]
-        script = (
-                "$OutputEncoding = "
-                "[System.Console]::OutputEncoding = "
-                "[System.Console]::InputEncoding = "
-                "[System.Text.Encoding]::UTF8; "
-                + "$PSDefaultParameterValues['*:Encoding'] = 'utf8'; "
-                + script
-        )
-        args = powershell_args + ["& { " + script + " }"]
-        return args
-
-    def push_pixel_to_clipboard(self, path):
-        script = (
-            "Add-Type -Assembly System.Windows.Forms; "
-            "Add-Type -Assembly System.Drawing; "
-            f"$image = [Drawing.Image]::FromFile('{path}'); "
-            "$imageStream = New-Object System.IO.MemoryStream; "
-            "$image.Save($imageStream, [System.Drawing.Imaging.ImageFormat]::Png); "
-            "$dataObj = New-Object System.Windows.Forms.DataObject('Bitmap', $image); "
-            "$dataObj.SetData('PNG', $imageStream); "
-            "[System.Windows.Forms.Clipboard]::SetDataObject($dataObj, $true); "
-        )
-
-        self.execute_powershell(script)
-
-    def push_to_clipboard(self, paths):
-        join_s = ""
-
-        for path in paths:
-            join_s += f", '{path}'"
-
-        script = (
-            f"$filelist = {join_s};"
-            "$col = New-Object Collections.Specialized.StringCollection; "
-            "foreach($file in $filelist){$col.add($file)}; "
-            "Add-Type -Assembly System.Windows.Forms; "
-            "[System.Windows.Forms.Clipboard]::SetFileDropList($col); "
-        )
-
-        self.execute_powershell(script)
 
-    def pull(self):
-        script = (
-            "Add-Type -AssemblyName System.Windows.Forms; "
-            "$files = Get-Clipboard -Format FileDropList; "
-            "if ($files) { $files.fullname }"
-        )
-
-        popen, stdout, stderr = self.execute_powershell(script)
-
-        self.file_urls = stdout.split('\n')
-        self.file_urls[:] = [file for file in self.file_urls if file != '']
-
-        return self.file_urls
+    def change_count(self):
+        # cheap enough to call on every watcher tick, no need to ask the helper
+        import ctypes
+        return ctypes.windll.user32.GetClipboardSequenceNumber()
 
-    def pull_image_from_clipboard(self, save_name='spio_from_clipboard.png'):
-        ts = time.strftime('%Y_%m_%d_%H_%M_%S', time.localtime())
-        filepath = os.path.join(get_dir(), ts + '.' + save_name)
 
-        if sys.platform == 'win32':
-            image_script = (
-                "$image = Get-Clipboard -Format Image; "
-                f"if ($image) {{ $image.Save('{filepath}'); Write-Output 0 }}"
-            )
+class StubClipboard(HelperClipboard):
+    """In-memory clipboard run by a python stand-in helper, for platforms without a real backend"""
+    helper_name = 'stub'
 
-            popen, stdout, stderr = self.execute_powershell(image_script)
-
-            # print(filepath, stdout, stderr)
-        return filepath
-
-    def execute_powershell(self, script):
-        parms = {
-            'args': self.get_args(script),
-            'encoding': 'utf-8',
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE,
-        }
-        popen = subprocess.Popen(**parms)
-        stdout, stderr = popen.communicate()
-        return popen, stdout, stderr
+    def get_helper_args(self):
+        return [sys.executable, os.path.join(os.path.dirname(__file__), 'stub_helper.py')]
 
 
 class WinTypeClipboard:
@@ -348,3 +307,16 @@ class WinTypeClipboard:
             pass
         finally:
             self.CloseClipboard()
+
+
+backends = {
+    'win32': PowerShellClipboard,
+    'darwin': MacClipboard,
+    'stub': StubClipboard,
+}
+
+
+def get_backend():
+    """get clipboard backend class, env SPIO_CLIPBOARD_BACKEND can override the platform one"""
+    name = os.getenv('SPIO_CLIPBOARD_BACKEND') or sys.platform
+    return backends.get(name)
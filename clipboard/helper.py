@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import atexit
+import json
+import subprocess
+import sys
+import threading
+
+from queue import Queue, Empty
+
+HELPER_TIMEOUT = 10  # seconds to wait for a single response
+
+
+class HelperError(Exception):
+    pass
+
+
+class ClipboardHelper():
+    """Long-lived helper process speaking line-delimited json over stdin/stdout
+
+    request: {"id": 1, "cmd": "pull_files", "args": {}}
+    response: {"id": 1, "ok": true, "result": {...}, "error": null}
+    """
+
+    def __init__(self, args, timeout=HELPER_TIMEOUT):
+        self.args = args
+        self.timeout = timeout
+
+        self.popen = None
+        self.responses = None
+        self.request_id = 0
+        self.lock = threading.Lock()
+
+    def is_alive(self):
+        return self.popen is not None and self.popen.poll() is None
+
+    def start(self):
+        parms = {
+            'args': self.args,
+            'encoding': 'utf-8',
+            'stdin': subprocess.PIPE,
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.DEVNULL,
+            'bufsize': 1,
+        }
+        if sys.platform == 'win32':
+            parms['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+        self.popen = subprocess.Popen(**parms)
+        self.responses = Queue()
+
+        # read in a thread so that a stuck helper can not block blender forever
+        reader = threading.Thread(target=self._read_loop, args=(self.popen, self.responses), daemon=True)
+        reader.start()
+
+    @staticmethod
+    def _read_loop(popen, responses):
+        for line in popen.stdout:
+            line = line.strip()
+            if line == '': continue
+            try:
+                responses.put(json.loads(line))
+            except ValueError:
+                pass  # ignore anything the helper prints that is not a response
+
+        responses.put(None)  # helper closed its stdout
+
+    def stop(self):
+        if self.popen is None: return
+
+        try:
+            if self.popen.poll() is None:
+                self.popen.stdin.write(json.dumps({'id': 0, 'cmd': 'quit', 'args': {}}) + '\n')
+                self.popen.stdin.flush()
+                self.popen.wait(timeout=1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.popen.kill()
+        finally:
+            self.popen = None
+            self.responses = None
+
+    def _send(self, cmd, args):
+        self.request_id += 1
+        request_id = self.request_id
+
+        self.popen.stdin.write(json.dumps({'id': request_id, 'cmd': cmd, 'args': args}) + '\n')
+        self.popen.stdin.flush()
+
+        while True:
+            try:
+                response = self.responses.get(timeout=self.timeout)
+            except Empty:
+                raise HelperError(f'Helper did not answer "{cmd}" in {self.timeout} s')
+
+            if response is None:
+                raise HelperError('Helper process exited')
+            # skip stale answer from a previous request that timed out
+            if response.get('id') == request_id:
+                return response
+
+    def request(self, cmd, **args):
+        """send a command, restart the helper once if it is dead or stuck"""
+        with self.lock:
+            for attempt in range(2):
+                if not self.is_alive():
+                    self.start()
+                try:
+                    response = self._send(cmd, args)
+                    break
+                except (OSError, ValueError, HelperError) as e:
+                    self.stop()
+                    if attempt == 1:
+                        raise HelperError(str(e))
+
+        if not response.get('ok'):
+            raise HelperError(response.get('error') or f'Helper failed to run "{cmd}"')
+
+        return response.get('result') or dict()
+
+
+# one helper per backend for the whole blender session
+HELPERS = {}
+
+
+def get_helper(name, args_factory):
+    helper = HELPERS.get(name)
+    if helper is None:
+        helper = ClipboardHelper(args_factory())
+        HELPERS[name] = helper
+
+    return helper
+
+
+def stop_helpers():
+    for helper in HELPERS.values():
+        helper.stop()
+    HELPERS.clear()
+
+
+atexit.register(stop_helpers)
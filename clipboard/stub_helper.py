@@ -0,0 +1,91 @@
+"""Stand-in clipboard helper speaking the same protocol as win32/spio_helper.ps1
+
+Keep an in-memory clipboard so the helper protocol can be run on any platform:
+    SPIO_CLIPBOARD_BACKEND=stub
+"""
+
+import json
+import os
+import shutil
+import sys
+
+state = {
+    'files': [],
+    'image': None,  # path of the png that hold the clipboard pixels
+    'count': 0,  # bump on every push, like the system clipboard sequence number
+}
+
+
+def pull_files(args):
+    return {'files': list(state['files'])}
+
+
+def push_files(args):
+    state['files'] = list(args.get('paths', []))
+    state['image'] = None
+    state['count'] += 1
+    return {}
+
+
+def pull_image(args):
+    if state['image'] is None or not os.path.isfile(state['image']):
+        return {'saved': False}
+
+    shutil.copyfile(state['image'], args['filepath'])
+    return {'saved': True}
+
+
+def push_image(args):
+    state['image'] = args['path']
+    state['files'] = []
+    state['count'] += 1
+    return {}
+
+
+def change_count(args):
+    return {'count': state['count']}
+
+
+def ping(args):
+    return {'pid': os.getpid()}
+
+
+commands = {
+    'ping': ping,
+    'change_count': change_count,
+    'pull_files': pull_files,
+    'push_files': push_files,
+    'pull_image': pull_image,
+    'push_image': push_image,
+}
+
+
+def send_response(request_id, ok, result=None, error=None):
+    response = {'id': request_id, 'ok': ok, 'result': result, 'error': error}
+    sys.stdout.write(json.dumps(response) + '\n')
+    sys.stdout.flush()
+
+
+def main():
+    for line in sys.stdin:
+        if line.strip() == '': continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            cmd = request.get('cmd')
+
+            if cmd == 'quit':
+                send_response(request_id, True, {})
+                break
+            if cmd not in commands:
+                raise ValueError(f'Unknown command: {cmd}')
+
+            send_response(request_id, True, commands[cmd](request.get('args') or {}))
+        except Exception as e:
+            send_response(request_id, False, error=str(e))
+
+
+if __name__ == '__main__':
+    main()
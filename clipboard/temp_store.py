@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+
+import bpy
+
+TEMP_DIR = ''
+HASH_PREFIX = 'spio_clip_'  # content addressed files, never rewritten once stored
+PUSHED_PATHS = set()  # files of the last push to the clipboard, other apps may still paste them
+
+
+def get_dir():
+    global TEMP_DIR
+    if TEMP_DIR == '':
+        TEMP_DIR = os.path.join(os.path.expanduser('~'), 'spio_temp')
+        if not "spio_temp" in os.listdir(os.path.expanduser('~')):
+            os.makedirs(TEMP_DIR)
+
+    return TEMP_DIR
+
+
+def get_staging_path(ext='png'):
+    """a per-process path for the backend to write into before the content is hashed"""
+    return os.path.join(get_dir(), f'.spio_staging_{os.getpid()}.{ext}')
+
+
+def hash_file(filepath, chunk_size=1 << 20):
+    h = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def store_file(filepath, ext='png'):
+    """move the file into the store under its content hash, return the stored path.
+    if the same content is already stored, the new file is dropped and the old one reused"""
+    digest = hash_file(filepath)
+    stored_path = os.path.join(get_dir(), f'{HASH_PREFIX}{digest[:20]}.{ext}')
+
+    if os.path.isfile(stored_path):
+        os.remove(filepath)
+        touch(stored_path)  # mark as recently used for eviction
+    else:
+        os.replace(filepath, stored_path)
+
+    return stored_path
+
+
+def is_stored_file(filepath):
+    return (os.path.basename(filepath).startswith(HASH_PREFIX) and
+            os.path.dirname(os.path.abspath(filepath)) == os.path.abspath(get_dir()))
+
+
+def find_image_by_path(filepath):
+    """find the image datablock that load this file"""
+    filepath = os.path.abspath(filepath)
+    image = bpy.data.images.get(os.path.basename(filepath))
+    if image and not image.library and os.path.abspath(bpy.path.abspath(image.filepath)) == filepath:
+        return image
+
+    for img in bpy.data.images:
+        if not img.library and not img.packed_file and img.source not in {'VIEWER', 'GENERATED'}:
+            if os.path.abspath(bpy.path.abspath(img.filepath)) == filepath:
+                return img
+
+
+# Eviction
+#########################
+
+EVICT_THREAD = None
+
+
+def touch(path):
+    """update mtime, which is used as last use time by the eviction"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def get_entry_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    size = 0
+    for root, dirs, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+    return size
+
+
+def is_protected(path, protected):
+    if path in protected: return True
+    # folder that contain a protected file (extracted zip etc.)
+    prefix = path + os.sep
+    return any(p.startswith(prefix) for p in protected)
+
+
+def evict(temp_dir, max_bytes, max_age, protected):
+    """remove least recently used entries of the temp dir until it fit the budget
+
+    Args:
+        max_bytes: byte budget of the whole dir, 0 for no limit
+        max_age: seconds since last use, 0 for no limit
+        protected: set of normalized abs paths that can not be removed
+
+    Returns:
+        list of removed paths
+    """
+    entries = []
+    total = 0
+    for entry in os.scandir(temp_dir):
+        path = os.path.normcase(os.path.abspath(entry.path))
+        if entry.name.startswith('.spio_staging_'): continue
+        try:
+            size = get_entry_size(entry.path)
+            last_use = entry.stat().st_mtime
+        except OSError:
+            continue
+
+        total += size
+        if is_protected(path, protected): continue
+        entries.append((last_use, size, entry.path))
+
+    entries.sort()  # oldest first
+    now = time.time()
+    removed = []
+
+    for last_use, size, path in entries:
+        too_old = max_age and now - last_use > max_age
+        too_big = max_bytes and total > max_bytes
+        if not (too_old or too_big): continue
+
+        # store_file may have reused the file since the scan
+        try:
+            if os.stat(path).st_mtime > last_use: continue
+        except OSError:
+            continue
+
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError:
+            continue
+
+        total -= size
+        removed.append(path)
+
+    return removed
+
+
+def set_pushed_paths(paths):
+    """remember the files put on the clipboard, they replace the ones of the previous push"""
+    PUSHED_PATHS.clear()
+    PUSHED_PATHS.update(os.path.normcase(os.path.abspath(path)) for path in paths)
+
+
+def get_protected_paths():
+    """files still in use, need to run on main thread"""
+    protected = set(PUSHED_PATHS)
+
+    for img in bpy.data.images:
+        if img.library or img.packed_file or img.source in {'VIEWER', 'GENERATED'}: continue
+        protected.add(os.path.normcase(os.path.abspath(bpy.path.abspath(img.filepath))))
+
+    from .watcher import WATCHER
+    if WATCHER is not None and WATCHER.payload is not None:
+        for path in WATCHER.payload.stats.keys():
+            protected.add(os.path.normcase(os.path.abspath(path)))
+
+    return protected
+
+
+def evict_async(keep=()):
+    """run eviction off the main thread with the budget from preferences
+
+    Args:
+        keep: extra paths to protect, like files that are just written
+    """
+    global EVICT_THREAD
+
+    from ..preferences.utils import get_pref
+    pref = get_pref()
+    if not pref.use_temp_eviction: return
+    if EVICT_THREAD is not None and EVICT_THREAD.is_alive(): return
+
+    args = (get_dir(),
+            pref.temp_max_size * 1024 * 1024,
+            pref.temp_max_age * 24 * 3600,
+            get_protected_paths() | {os.path.normcase(os.path.abspath(path)) for path in keep})
+
+    EVICT_THREAD = threading.Thread(target=evict, args=args, daemon=True)
+    EVICT_THREAD.start()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+import threading
+
+from stat import S_ISDIR
+
+from queue import Queue, Empty
+
+import bpy
+
+from .clipboard import get_backend
+
+WATCH_INTERVAL = 0.5  # seconds between two clipboard change count polls
+STOP_TIMEOUT = 1  # seconds to wait for the worker thread on stop
+
+
+class ClipboardPayload():
+    """Everything Super Import need to know about the copied files"""
+
+    def __init__(self, file_list, change_count=None):
+        self.change_count = change_count
+
+        self.file_list = []  # files to import, missing file are kept and reported
+        self.dir_list = []
+        self.missing_list = []
+        self.stats = dict()  # path: os.stat_result, None if missing
+        self.ext_groups = dict()  # ext: [files]
+        self.ext = None  # main extension
+
+        # config match, only resolve on main thread
+        self.configs = None
+        self.config_index = None
+
+        self.build(file_list)
+
+    def build(self, file_list):
+        for file_path in file_list:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                stat = None
+            self.stats[file_path] = stat
+
+            if stat is not None and S_ISDIR(stat.st_mode):
+                self.dir_list.append(file_path)  # add dir list for batch import folder's files
+                continue
+            elif stat is None:
+                self.missing_list.append(file_path)
+
+            # pass extra file
+            extension = file_path.split('.')[-1].lower()
+            if extension in {'mtl'}:
+                continue
+
+            self.file_list.append(file_path)
+            self.ext_groups.setdefault(extension, []).append(file_path)
+
+        # set the main ext, first one win if the count is the same
+        if len(self.ext_groups) != 0:
+            self.ext = max(self.ext_groups, key=lambda ext: len(self.ext_groups[ext]))
+
+    def is_empty(self):
+        return len(self.stats) == 0
+
+    def resolve_configs(self):
+        """match import configs for the main extension, need to run on main thread"""
+        from ..ops.core import ConfigHelper, get_config_index
+
+        # the index is rebuilt when user edit configs
+        config_index = get_config_index()
+        if self.configs is None or self.config_index is not config_index:
+            self.configs = ConfigHelper(check_use=True, filter=self.ext, io_type='IMPORT')
+            self.config_index = config_index
+
+        return self.configs
+
+
+class ClipboardWatcher():
+    """Poll the clipboard change count in a worker thread and keep a ready payload.
+    bpy.app.timers pick the payload up and resolve configs on the main thread.
+    Files are pulled through the helper process, the worker thread never open the clipboard in blender"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+        self.payload = None
+
+        self.results = Queue()
+        self.stop_signal = None  # one event per worker thread, a stopped thread never wake up again
+        self.thread = None
+        # timers compare by identity, keep a single bound method
+        self.timer_func = self.timer
+
+    def start(self):
+        self.stop_signal = threading.Event()
+        self.thread = threading.Thread(target=self._watch_loop, args=(self.stop_signal,), daemon=True)
+        self.thread.start()
+
+        if not bpy.app.timers.is_registered(self.timer_func):
+            bpy.app.timers.register(self.timer_func, first_interval=WATCH_INTERVAL, persistent=True)
+
+    def stop(self):
+        if self.thread is not None:
+            self.stop_signal.set()
+            # a thread stuck in a helper request exit once it returns, its signal is set
+            self.thread.join(timeout=STOP_TIMEOUT)
+            self.thread = None
+        self.payload = None
+
+        if bpy.app.timers.is_registered(self.timer_func):
+            bpy.app.timers.unregister(self.timer_func)
+
+    def pull(self):
+        return self.backend().pull()
+
+    def _watch_loop(self, stop_signal):
+        last_count = None
+
+        while not stop_signal.wait(WATCH_INTERVAL):
+            try:
+                count = self.backend().change_count()
+                if count is None or count == last_count: continue
+
+                last_count = count
+                payload = ClipboardPayload(self.pull(), change_count=count)
+                if stop_signal.is_set(): break
+                self.results.put(payload)
+            except Exception as e:
+                print(f'SPIO clipboard watcher: {e}')
+
+    def timer(self):
+        payload = None
+        while True:
+            try:
+                payload = self.results.get(block=False)
+            except Empty:
+                break
+
+        if payload is not None:
+            payload.resolve_configs()
+            self.payload = payload
+
+        return WATCH_INTERVAL
+
+    def get_payload(self):
+        """return the payload only if the clipboard did not change since it was built"""
+        payload = self.payload
+        if payload is None or payload.is_empty(): return None
+
+        try:
+            if self.backend().change_count() != payload.change_count: return None
+        except Exception:
+            return None
+
+        payload.resolve_configs()  # re-match if user edit configs
+
+        return payload
+
+
+WATCHER = None
+
+
+def start_watcher():
+    global WATCHER
+
+    backend = get_backend()
+    # watcher need a backend that can tell if the clipboard change
+    if backend is None or backend().change_count() is None: return
+
+    if WATCHER is None:
+        WATCHER = ClipboardWatcher(backend)
+        WATCHER.start()
+
+
+def stop_watcher():
+    global WATCHER
+
+    if WATCHER is not None:
+        WATCHER.stop()
+        WATCHER = None
+
+
+def get_payload():
+    if WATCHER is None: return None
+
+    return WATCHER.get_payload()
+
@@ -0,0 +1,80 @@
+# Super IO clipboard helper
+# Started once per blender session, read one json request per line from stdin
+# and write one json response per line to stdout
+
+$ErrorActionPreference = 'Stop'
+
+$utf8 = New-Object System.Text.UTF8Encoding $false
+[Console]::InputEncoding = $utf8
+[Console]::OutputEncoding = $utf8
+
+Add-Type -AssemblyName System.Windows.Forms
+Add-Type -AssemblyName System.Drawing
+Add-Type -Namespace SPIO -Name User32 -MemberDefinition '[DllImport("user32.dll")] public static extern uint GetClipboardSequenceNumber();'
+
+function Send-Response($id, $ok, $result, $err) {
+    $response = @{ id = $id; ok = $ok; result = $result; error = $err }
+    [Console]::Out.WriteLine(($response | ConvertTo-Json -Compress -Depth 4))
+    [Console]::Out.Flush()
+}
+
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($null -eq $line) { break }
+    if ($line.Trim() -eq '') { continue }
+
+    $id = $null
+    try {
+        $request = $line | ConvertFrom-Json
+        $id = $request.id
+        $params = $request.args
+        $result = @{}
+
+        switch ($request.cmd) {
+            'ping' {
+                $result.pid = $PID
+            }
+            'change_count' {
+                $result.count = [SPIO.User32]::GetClipboardSequenceNumber()
+            }
+            'pull_files' {
+                $files = [System.Windows.Forms.Clipboard]::GetFileDropList()
+                $result.files = @($files)
+            }
+            'push_files' {
+                $col = New-Object System.Collections.Specialized.StringCollection
+                foreach ($file in $params.paths) { [void]$col.Add($file) }
+                [System.Windows.Forms.Clipboard]::SetFileDropList($col)
+            }
+            'pull_image' {
+                $image = [System.Windows.Forms.Clipboard]::GetImage()
+                $result.saved = $false
+                if ($image) {
+                    $image.Save($params.filepath, [System.Drawing.Imaging.ImageFormat]::Png)
+                    $image.Dispose()
+                    $result.saved = $true
+                }
+            }
+            'push_image' {
+                $image = [System.Drawing.Image]::FromFile($params.path)
+                $imageStream = New-Object System.IO.MemoryStream
+                $image.Save($imageStream, [System.Drawing.Imaging.ImageFormat]::Png)
+                $dataObj = New-Object System.Windows.Forms.DataObject('Bitmap', $image)
+                $dataObj.SetData('PNG', $imageStream)
+                [System.Windows.Forms.Clipboard]::SetDataObject($dataObj, $true)
+            }
+            'quit' {
+                Send-Response $id $true $result $null
+                exit 0
+            }
+            default {
+                throw "Unknown command: $($request.cmd)"
+            }
+        }
+
+        Send-Response $id $true $result $null
+    }
+    catch {
+        Send-Response $id $false $null $_.Exception.Message
+    }
+}
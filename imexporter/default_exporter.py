@@ -145,6 +145,15 @@ exporter_extend = {
     'svg': 'wm.gpencil_export_svg',
 }
 
+# operator idname: bundled addon that register it, enabled on first use
+exporter_addons = {
+    'export_scene.obj': 'io_scene_obj',
+    'export_scene.fbx': 'io_scene_fbx',
+    'export_scene.gltf': 'io_scene_gltf2',
+    'export_mesh.stl': 'io_mesh_stl',
+    'export_mesh.ply': 'io_mesh_ply',
+}
+
 exporter_ops_props = {
     'obj': {
         'use_selection': True
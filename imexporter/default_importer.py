@@ -24,6 +24,20 @@ importer = {
     'bvh': 'import_anim.bvh',
 }
 
+# operator idname: bundled addon that register it, enabled on first use
+importer_addons = {
+    'import_image.to_plane': 'io_import_images_as_planes',
+    'import_scene.obj': 'io_scene_obj',  # 3.1 and heigher obj io
+    'import_scene.fbx': 'io_scene_fbx',
+    'import_scene.gltf': 'io_scene_gltf2',
+    'import_scene.x3d': 'io_scene_x3d',
+    'import_curve.svg': 'io_curve_svg',
+    'import_scene.dxf': 'io_import_dxf',
+    'import_mesh.stl': 'io_mesh_stl',
+    'import_mesh.ply': 'io_mesh_ply',
+    'import_anim.bvh': 'io_anim_bvh',
+}
+
 
 def get_importer(cpp_obj_importer=True):
     im = importer.copy()
@@ -39,3 +39,21 @@ def post_process_blend_file(asset,scripts_file_name = 'script_export_blend.py'):
     #     args.append(p)
 
     execute_blender(args).wait()  # Wait for completion.
+
+
+def start_import_worker(spec_path):
+    """
+    Import the files listed in the spec json with a background blender, the result is saved as a .blend.
+    Returns the object to watch for completion.
+    """
+    args = [
+        bpy.app.binary_path,
+        "--background",
+        "--factory-startup",
+        "--python",
+        os.path.join(os.path.dirname(__file__), 'script_import_worker.py'),
+        "--",
+        spec_path,
+    ]
+
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -0,0 +1,50 @@
+import json
+import sys
+
+import bpy
+
+
+def main(args):
+    if len(args) == 0: return
+
+    with open(args[0], 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+
+    # factory startup scene, keep only what is imported
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+
+    # factory startup may not have the importer addon enabled
+    if spec.get('addon'):
+        import addon_utils
+        addon_utils.enable(spec['addon'])
+
+    bl_idname = spec['bl_idname']
+    op_callable = getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
+
+    imported = 0
+    errors = []
+    file_objects = {}  # filepath: names of the objects it created, for the import cache
+    for filepath in spec['files']:
+        src_objects = set(bpy.data.objects)
+        try:
+            op_callable(filepath=filepath, **spec['args'])
+            imported += 1
+        except Exception as e:
+            errors.append(f'{filepath}: {e}')
+            continue
+        file_objects[filepath] = [obj.name for obj in bpy.data.objects if obj not in src_objects]
+
+    bpy.context.preferences.filepaths.save_version = 0  # No backup blends needed
+    bpy.ops.wm.save_as_mainfile(filepath=spec['output'])
+
+    with open(spec['output'] + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'imported': imported, 'errors': errors, 'objects': file_objects}, f)
+
+
+if __name__ == "__main__":
+    if "--" not in sys.argv:
+        argv = []  # as if no args are passed
+    else:
+        argv = sys.argv[sys.argv.index("--") + 1:]  # get all args after "--"
+    main(argv)
@@ -1,6 +1,7 @@
 import bpy
 from . import (op_blend_export, op_node_export, op_model_export, op_model_import, ops_super_export, ops_super_import,
-               ops_blend_import, ops_config_io, op_image_io, op_get_plugin, op_read_preset)
+               ops_blend_import, ops_config_io, op_image_io, op_get_plugin, op_read_preset, dynamic_io,
+               op_import_job, import_cache, latency_stats, profiler)
 
 classes = (
     op_blend_export,
@@ -13,8 +14,12 @@ classes = (
     ops_config_io,
     op_image_io,
     op_get_plugin,
-    op_read_preset
-
+    op_read_preset,
+    dynamic_io,
+    op_import_job,
+    import_cache,
+    latency_stats,
+    profiler,
 )
 
 
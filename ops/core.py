@@ -14,12 +14,20 @@ def viewlayer_fix_291(self, context):
     return context.view_layer.depsgraph if bpy.app.version >= (2, 91, 0) else context.view_layer
 
 
-class MeasureTime():
-    def __enter__(self):
-        return time.time()
+def get_trace_dir():
+    trace_dir = get_pref().trace_dir
+    if trace_dir == '':
+        return os.path.join(os.path.expanduser('~'), 'spio_trace')
 
-    def __exit__(self, type, value, traceback):
-        pass
+    return bpy.path.abspath(trace_dir)
+
+
+def trace_invocation(name):
+    """root span of an operator run, the duration is used for report time"""
+    from .tracer import Invocation
+    pref = get_pref()
+
+    return Invocation(name, enabled=pref.use_trace, trace_dir=get_trace_dir() if pref.use_trace else None)
 
 
 def is_float(s) -> bool:
@@ -46,7 +54,30 @@ def convert_value(value):
         return value
 
 
+ADDON_DEPENDS = dict()  # operator idname: bundled addon that register it, recorded at register
+
+
+def ensure_addon(bl_idname):
+    """enable the bundled addon of an operator when it is needed, instead of at register
+
+    Checked on every call, the user may disable the addon after it was enabled here.
+    """
+    module = ADDON_DEPENDS.get(bl_idname)
+    if module is None: return
+
+    from addon_utils import check, enable
+    if check(module)[1]: return
+
+    from .tracer import span
+    with span('enable addon', addon=module):
+        try:
+            enable(module)
+        except ModuleNotFoundError:
+            pass
+
+
 def get_op_by_idname(bl_idname):
+    ensure_addon(bl_idname)
     return getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
 
 
@@ -57,38 +88,134 @@ def remove_prefix(s, prefix):
         return s.removeprefix(prefix)
 
 
+MULTI_FILE_OPS = dict()  # operator idname: if it take a files + directory list
+
+
+def is_multi_file_op(op_callable):
+    idname = op_callable.idname_py()
+    if idname not in MULTI_FILE_OPS:
+        try:
+            props = op_callable.get_rna_type().properties
+            MULTI_FILE_OPS[idname] = ('directory' in props and 'files' in props and
+                                      getattr(props['files'], 'fixed_type', None) is not None and
+                                      props['files'].fixed_type.identifier == 'OperatorFileListElement')
+        except (AttributeError, KeyError):
+            MULTI_FILE_OPS[idname] = False
+
+    return MULTI_FILE_OPS[idname]
+
+
+def get_import_calls(ops_args, file_list, multi_file=False, max_files=0):
+    """split the files into operator calls, one call per directory if the operator take a file list
+
+    Returns:
+        list of (args, files)
+    """
+    calls = list()
+
+    if multi_file and len(file_list) > 1:
+        dir_files = dict()
+        for filepath in file_list:
+            dir_files.setdefault(os.path.dirname(filepath), []).append(filepath)
+
+        for directory, files in dir_files.items():
+            chunks = [files[i:i + max_files] for i in range(0, len(files), max_files)] if max_files else [files]
+            for chunk in chunks:
+                args = dict(ops_args)
+                # some importers get the dir from filepath instead of directory
+                args['filepath'] = chunk[0]
+                args['directory'] = directory
+                args['files'] = [{'name': os.path.basename(filepath)} for filepath in chunk]
+                calls.append((args, chunk))
+    else:
+        for filepath in file_list:
+            args = dict(ops_args)
+            args['filepath'] = filepath
+            calls.append((args, [filepath]))
+
+    return calls
+
+
+def call_import_op(op_callable, ops_args, file_list, op_context=None, path_type='IMPORT_DEFAULT'):
+    """import the files with as few operator calls as the operator allow
+
+    Returns:
+        list of error messages
+    """
+    errors = list()
+
+    from .tracer import span
+    from .latency_stats import measure
+
+    for args, files in get_import_calls(ops_args, file_list, is_multi_file_op(op_callable)):
+        try:
+            with span(op_callable.idname_py(), files=len(files)), measure(op_callable.idname_py(), files, path_type):
+                if op_context:
+                    op_callable(op_context, **args)
+                else:
+                    op_callable(**args)
+        except Exception as e:
+            errors.append(str(e))
+
+    return errors
+
+
 from ..imexporter.default_importer import get_importer
 from ..imexporter.lib_blend import default_blend_lib
 from ..imexporter.default_addon import importer_addon
 
 
 class ConfigItemHelper():
-    '''This class accept the item from config helper, and access the specific item settings'''
+    '''This class accept the item from config helper, and access the specific item settings.
+    Values are copied and the operator is resolved once, so the helper can be kept in the config index'''
 
     def __init__(self, item):
-        self.item = item
-
+        config = dict()
         for key in item.__annotations__.keys():
-            value = getattr(item, key)
             if key != 'prop_list':
-                self.__setattr__(key, value)
-            # prop list
-            ops_config = dict()
-            if len(item.prop_list) != 0:
-                for prop_index, prop_item in enumerate(item.prop_list):
-                    prop, value = prop_item.name, prop_item.value
-                    # skip if the prop is not filled
-                    if prop == '' or value == '': continue
-                    ops_config[prop] = convert_value(value)
-            self.__setattr__('prop_list', ops_config)
+                config[key] = getattr(item, key)
+        # prop list
+        ops_config = dict()
+        for prop_item in item.prop_list:
+            prop, value = prop_item.name, prop_item.value
+            # skip if the prop is not filled
+            if prop == '' or value == '': continue
+            ops_config[prop] = convert_value(value)
+        config['prop_list'] = ops_config
+
+        self.config = config  # plain dict, used for json export
+        for key, value in config.items():
+            self.__setattr__(key, value)
+
+        self.operator = None  # (op_callable, ops_args, op_context), resolve on first call
+
+    def is_qualified(self):
+        if self.name == '' or self.extension == '': return False
+
+        if self.operator_type == 'CUSTOM' and self.bl_idname == '': return False
+
+        return True
 
     def is_config_item_poll(self, context_area_type):
-        if get_pref().experimental:
-            return self.item.context_area == bpy.context.area.type
+        """context_area_type is None without an area (background blender), every config match it"""
+        if get_pref().experimental and context_area_type is not None:
+            return self.context_area == context_area_type
 
         return True
 
     def get_operator_and_args(self):
+        if self.operator is None:
+            try:
+                self.operator = self.resolve_operator()
+            except (AttributeError, KeyError, TypeError) as e:
+                print(f'SPIO config "{self.name}": {e}')
+                self.operator = (None, dict(), None)
+
+        op_callable, ops_args, op_context = self.operator
+        # caller will set filepath, never touch the cached args
+        return op_callable, dict(ops_args or {}), op_context
+
+    def resolve_operator(self):
         from ..imexporter.default_exporter import get_exporter, get_exporter_ops_props
         # get exporter by preferences
         default_exporter = get_exporter(cpp_obj_exporter=get_pref().cpp_obj_exporter,
@@ -105,7 +232,7 @@ class ConfigItemHelper():
         if operator_type == 'CUSTOM':
             # custom operator
             bl_idname = self.bl_idname
-            op_callable = getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
+            op_callable = get_op_by_idname(bl_idname)
             ops_args = self.prop_list
             op_context = self.context
 
@@ -147,90 +274,102 @@ class ConfigItemHelper():
         return op_callable, ops_args, op_context
 
     def get_match_files(self, file_list):
-        match_rule = self.match_rule
-        match_value = self.match_value
+        if self.match_rule == 'NONE': return list()
 
-        if match_rule == 'NONE':
-            match_files = list()
-        elif match_rule == 'STARTSWITH':
-            match_files = [file for file in file_list if os.path.basename(file).startswith(match_value)]
-        elif match_rule == 'ENDSWITH':
-            match_files = [file for file in file_list if
-                           os.path.basename(file).removesuffix('.' + self.ext).endswith(match_value)]
-        elif match_rule == 'IN':
-            match_files = [file for file in file_list if match_value in os.path.basename(file)]
-        elif match_rule == 'REGEX':
-            import re
-            match_files = [file for file in file_list if re.search(match_value, os.path.basename(file))]
+        from .match_rule import RuleMatcher
+        matcher = RuleMatcher([(0, self.match_rule, self.match_value, self.extension)])
+        return list(matcher.classify(file_list).keys())
 
-        return match_files
 
+class ConfigIndex():
+    '''Compiled config list, only rebuilt when a config or an io preference is changed'''
 
-class ConfigHelper():
-    '''This class is to check config in the whole preferences
-    and also to export config to json file/import json file as config'''
+    def __init__(self, pref_config):
+        self.items = []  # ConfigItemHelper, same order as the preferences config list
+        self.keys = dict()  # (io_type, extension, context_area): [config list index]
+        self.matchers = dict()  # tuple of config list index: RuleMatcher
 
-    def __init__(self, check_use=False, filter=None, io_type="IMPORT"):
-        pref_config = get_pref().config_list
+        for config_list_index, item in enumerate(pref_config):
+            helper = ConfigItemHelper(item)
+            self.items.append(helper)
 
-        config_list = dict()
-        index_list = []
+            if not helper.is_qualified(): continue
+            # None key to look up configs of any extension / any area
+            for ext in (helper.extension, None):
+                for area in (helper.context_area, None):
+                    self.keys.setdefault((helper.io_type, ext, area), []).append(config_list_index)
 
-        for config_list_index, item in enumerate(pref_config):
-            # config dict
-            config = dict()
-            # TODO need to clean up later
-            for key in item.__annotations__.keys():
-                value = getattr(item, key)
-                if key != 'prop_list':
-                    config[key] = value
-                # prop list
-                ops_config = dict()
-                if len(item.prop_list) != 0:
-                    for prop_index, prop_item in enumerate(item.prop_list):
-                        prop, value = prop_item.name, prop_item.value
-                        # skip if the prop is not filled
-                        if prop == '' or value == '': continue
-                        ops_config[prop] = convert_value(value)
-                config['prop_list'] = ops_config
-
-            if io_type == 'IMPORT' and self.is_import_config(config, check_use, filter):
-                # check config dict
-                index_list.append(config_list_index)
-                config_list[item.name] = config
-
-            elif io_type == 'EXPORT' and self.is_export_config(config, check_use):
-                index_list.append(config_list_index)
-                config_list[item.name] = config
-
-            elif io_type == 'ALL' and self.is_config_qualified(config, check_use):
-                index_list.append(config_list_index)
-                config_list[item.name] = config
-
-        self.config_list = config_list
-        self.index_list = index_list
+    def lookup(self, io_type, extension=None, context_area=None, check_use=False):
+        index_list = self.keys.get((io_type, extension, context_area), [])
+        if check_use:
+            return [index for index in index_list if self.items[index].use_config]
 
-    def is_config_qualified(self, config, check_use):
-        if check_use and not config.get('use_config'): return False
+        return list(index_list)
 
-        if config.get('name') == '' or config.get('extension') == '': return False
+    def get_matcher(self, index_list):
+        """match rules of these configs compiled together, the last config win if a file match more than one"""
+        key = tuple(index_list)
+        matcher = self.matchers.get(key)
+        if matcher is None:
+            from .match_rule import RuleMatcher
+            rules = [(index, self.items[index].match_rule, self.items[index].match_value, self.items[index].extension)
+                     for index in key if self.items[index].match_rule != 'NONE']
+            matcher = RuleMatcher(rules)
+            self.matchers[key] = matcher
 
-        if config.get('operator_type') == 'CUSTOM' and config.get('bl_idname') == '': return False
+        return matcher
 
-        return True
 
-    def is_import_config(self, config, check_use, filter, io_type="IMPORT"):
-        return (
-                self.is_config_qualified(config, check_use) and
-                filter and config.get('extension') == filter and
-                config.get('io_type') == io_type
-        )
+CONFIG_INDEX = None
+CONFIG_INDEX_KEY = None
+
+
+def get_config_index():
+    global CONFIG_INDEX, CONFIG_INDEX_KEY
+    from ..preferences.utils import get_config_version
+
+    pref = get_pref()
+    # operators are resolved with these preferences
+    # a preferences revert replace the config list (new pointer) without any update callback
+    key = (get_config_version(), pref.config_list.as_pointer() if hasattr(pref.config_list, 'as_pointer') else 0,
+           len(pref.config_list),
+           pref.cpp_obj_importer, pref.cpp_obj_exporter, pref.extend_export_menu)
+
+    if CONFIG_INDEX is None or key != CONFIG_INDEX_KEY:
+        from .tracer import span
+        with span('config compile', configs=len(pref.config_list)):
+            CONFIG_INDEX = ConfigIndex(pref.config_list)
+        CONFIG_INDEX_KEY = key
+
+    return CONFIG_INDEX
+
+
+class ConfigHelper():
+    '''This class is to check config in the whole preferences
+    and also to export config to json file/import json file as config'''
+
+    def __init__(self, check_use=False, filter=None, io_type="IMPORT"):
+        config_index = get_config_index()
+
+        if io_type == 'IMPORT':
+            index_list = config_index.lookup('IMPORT', filter, check_use=check_use) if filter else []
+        elif io_type == 'EXPORT':
+            index_list = config_index.lookup('EXPORT', check_use=check_use)
+        else:
+            index_list = sorted(config_index.lookup('IMPORT', check_use=check_use) +
+                                config_index.lookup('EXPORT', check_use=check_use))
+
+        self.config_index = config_index
+        self.items = config_index.items
+        self.index_list = index_list
+        self.config_list = {self.items[index].name: self.items[index].config for index in index_list}
 
-    def is_export_config(self, config, check_use, io_type="EXPORT"):
-        return (
-                self.is_config_qualified(config, check_use) and
-                config.get('io_type') == io_type
-        )
+    def get_item(self, index):
+        """return the compiled ConfigItemHelper of the config list index"""
+        return self.items[index]
+
+    def get_matcher(self, index_list):
+        return self.config_index.get_matcher(index_list)
 
     def is_empty(self):
         return len(self.config_list) == 0
@@ -336,15 +475,20 @@ class PopupExportMenu():
 
 
 class PopupImportMenu():
-    def __init__(self, file_list, dir_list, context):
+    def __init__(self, file_list, dir_list, context, payload_id=None):
         self.file_list = file_list
         self.dir_list = dir_list
         self.context = context
 
+        # operators of the menu get the paths by this id
+        if payload_id is None:
+            from .payload import popup_payload
+            payload_id = popup_payload(files=list(file_list), dirs=list(dir_list))
+        self.payload_id = payload_id
+
     def default_image_menu(self, return_menu=False):
         context = self.context
-        join_paths = '$$'.join(self.file_list)
-        join_dirs = '$$'.join(self.dir_list)
+        payload_id = self.payload_id
 
         def draw_statistics(cls, context):
             layout = cls.layout
@@ -357,27 +501,27 @@ class PopupImportMenu():
                 layout.operator_context = "INVOKE_DEFAULT"
                 # only one blend need to deal with
                 col = layout.column()
-                if join_paths != '':
+                if len(self.file_list) != 0:
                     op = col.operator('spio.import_image_as_reference')
-                    op.files = join_paths
+                    op.payload = payload_id
 
                     op = col.operator('spio.import_image_as_plane')
-                    op.files = join_paths
+                    op.payload = payload_id
 
                     col.separator()
                     # col.label(text='Hold Alt to import as asset')
                     op = col.operator('spio.import_image_as_world')
-                    op.files = join_paths
+                    op.payload = payload_id
 
                     op = col.operator('spio.import_image_as_light_gobos')
-                    op.files = join_paths
+                    op.payload = payload_id
 
                     op = col.operator('spio.import_image_as_parallax_material')
-                    op.files = join_paths
+                    op.payload = payload_id
 
-                if join_dirs != '':
+                if len(self.dir_list) != 0:
                     op = col.operator('spio.import_pbr_folders_as_materials')
-                    op.dirs = join_dirs
+                    op.payload = payload_id
 
                 draw_statistics(cls, context)
 
@@ -395,17 +539,17 @@ class PopupImportMenu():
                 draw_statistics(cls, context)
                 # only one blend need to deal with
                 col = layout.column()
-                if join_paths != '':
+                if len(self.file_list) != 0:
                     op = col.operator('spio.import_image_as_nodes')
-                    op.files = join_paths
+                    op.payload = payload_id
 
                     if context.area.ui_type == 'ShaderNodeTree':
                         col = layout.column()
                         op = col.operator('spio.import_image_pbr_setup')
-                        op.files = join_paths
+                        op.payload = payload_id
 
                         # op = col.operator('spio.import_pbr_zip')
-                        # op.files = join_paths
+                        # op.payload = payload_id
 
             if return_menu:
                 return draw_node_editor_menu
@@ -423,13 +567,13 @@ class PopupImportMenu():
                 col = layout.column()
                 # col.label(text='Hold Alt to import as asset')
                 op = col.operator('spio.import_image_as_world')
-                op.files = join_paths
+                op.payload = payload_id
 
                 op = col.operator('spio.import_image_as_light_gobos')
-                op.files = join_paths
+                op.payload = payload_id
 
                 op = col.operator('spio.import_image_as_parallax_material')
-                op.files = join_paths
+                op.payload = payload_id
 
                 col.separator()
                 op = col.operator('spio.set_preview_to_selected_assets')
@@ -445,7 +589,7 @@ class PopupImportMenu():
         context = self.context
 
         path = self.file_list[0]
-        join_paths = '$$'.join(self.file_list)
+        payload_id = self.payload_id
 
         def draw_statistics(cls, context):
             layout = cls.layout
@@ -486,12 +630,12 @@ class PopupImportMenu():
                 col = layout.column()
                 op = col.operator('spio.batch_import_blend', text=f'Batch Open')
                 op.action = 'OPEN'
-                op.files = join_paths
+                op.payload = payload_id
 
                 for subpath, lib in default_blend_lib.items():
                     op = col.operator('spio.batch_import_blend', text=f'Batch Append {subpath}')
                     op.action = 'APPEND'
-                    op.files = join_paths
+                    op.payload = payload_id
                     op.sub_path = subpath
                     op.data_type = lib
 
@@ -499,7 +643,7 @@ class PopupImportMenu():
                 for subpath, lib in default_blend_lib.items():
                     op = col.operator('spio.batch_import_blend', text=f'Batch Link {subpath}')
                     op.action = 'LINK'
-                    op.files = join_paths
+                    op.payload = payload_id
                     op.sub_path = subpath
                     op.data_type = lib
 
@@ -517,6 +661,54 @@ class PopupImportMenu():
 import sys
 
 
+def get_gltf_sidecar_files(filepath):
+    """buffers and images that a .gltf file refer to"""
+    import json
+    from urllib.parse import unquote
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    files = []
+    for item in data.get('buffers', []) + data.get('images', []):
+        uri = item.get('uri')
+        if not uri or uri.startswith('data:'): continue
+        files.append(os.path.join(os.path.dirname(filepath), unquote(uri)))
+
+    return files
+
+
+def get_export_manifest(filepath, op_args, start_time):
+    """files written by an exporter call, the main file and its sidecars
+
+    Args:
+        filepath: the filepath pass to the exporter
+        op_args: the exporter args, to know if sidecars are written
+        start_time: time before calling the exporter, older sidecars are left from other exports
+    """
+    if not os.path.isfile(filepath): return []
+
+    manifest = [filepath]
+    stem, ext = os.path.splitext(filepath)
+    ext = ext.lower()
+
+    sidecars = []
+    if ext == '.obj':
+        sidecars.append(stem + '.mtl')
+    elif ext == '.gltf' and op_args.get('export_format') != 'GLTF_EMBEDDED':
+        sidecars.extend(get_gltf_sidecar_files(filepath))
+
+    for path in sidecars:
+        try:
+            # 1s for file system mtime resolution
+            if os.path.getmtime(path) >= start_time - 1:
+                manifest.append(path)
+        except OSError:
+            pass
+
+    return manifest
+
+
 class PostProcess():
 
     def fix_blend(self, filepath, scripts_file_name):
@@ -524,19 +716,14 @@ class PostProcess():
         from ..imexporter.execute_blend import post_process_blend_file
         post_process_blend_file(filepath, scripts_file_name)
 
-    def open_dir(self, temp_dir):
-        if get_pref().post_open_dir:
-            bpy.ops.wm.path_open(filepath=temp_dir)
-
-    @staticmethod
-    def get_update_files(src_file, temp_dir):
-        new_files = [file for file in os.listdir(temp_dir)]
+    def clean_temp(self, manifest):
+        from ..clipboard.temp_store import evict_async
+        evict_async(keep=manifest)
 
-        extra_files = [os.path.join(temp_dir, file) for file in new_files if
-                       file not in src_file or src_file.get(file) != os.path.getmtime(
-                           os.path.join(temp_dir, file))]
-
-        return extra_files
+    def open_dir(self, manifest, export_dir):
+        """open the folder of the written files, the export folder if the manifest found none"""
+        if get_pref().post_open_dir:
+            bpy.ops.wm.path_open(filepath=os.path.dirname(manifest[0]) if len(manifest) != 0 else export_dir)
 
     def copy_to_clipboard(self, paths, op):
         """Win only now, need to test mac"""
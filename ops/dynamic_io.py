@@ -9,16 +9,18 @@ from bpy.props import (EnumProperty,
                        IntProperty,
                        BoolProperty)
 
-from .core import get_pref, MeasureTime, PostProcess
+from .core import get_pref, PostProcess, get_export_manifest, get_config_index, trace_invocation
+from .tracer import span
+from .latency_stats import measure, get_path_type
+from .profiler import profile_operator
+from .op_import_job import run_import
+from .payload import acquire_payload, release_payload, release_popup, clear_payloads
+from ..clipboard.temp_store import get_dir
 
 
 class IO_Base(bpy.types.Operator):
     """IO template"""
 
-    # dependant class
-    #################
-    dep_classes = []  # for easier manage, helpful for batch register and un register
-
     # data
     #################
     clipboard = None  # clipboard data
@@ -40,17 +42,8 @@ class IO_Base(bpy.types.Operator):
         self.ext = None
         self.use_custom_config = False
 
-    def register_dep_classes(self):
-        for cls in self.dep_classes:
-            bpy.utils.register_class(cls)
-
-    def unregister_dep_classes(self):
-        for cls in self.dep_classes:
-            bpy.utils.unregister_class(cls)
-
-    def report_time(self, start_time):
-        if get_pref().report_time: self.report({"INFO"},
-                                               f'{self.bl_label} Cost {round(time.time() - start_time, 5)} s')
+    def report_time(self, duration):
+        if get_pref().report_time: self.report({"INFO"}, f'{self.bl_label} Cost {round(duration, 5)} s')
 
     # Import Method
     def import_blend_default(self, context):
@@ -72,50 +65,85 @@ class IO_Base(bpy.types.Operator):
         pass
 
 
-class DynamicImport:
-    # define exec
+def get_config_item(config_index):
+    items = get_config_index().items
+    if 0 <= config_index < len(items):
+        return items[config_index]
+
+
+@profile_operator
+class DynamicImport(bpy.types.Operator):
+    """Import with config"""
+    bl_idname = 'wm.spio_config_import'
+    bl_label = 'Import with Config'
+    bl_options = {'INTERNAL'}
+
+    # registered once, the config and the paste are passed in as properties
+    config_index: IntProperty()
+    payload: StringProperty()
+
+    @classmethod
+    def description(cls, context, properties):
+        ITEM = get_config_item(properties.config_index)
+        return ITEM.description if ITEM else ''
+
     def execute(self, context):
         # use pre-define index to call config
-        ITEM = self.ITEM
+        ITEM = get_config_item(self.config_index)
+        payload = acquire_payload(self.payload)
+        release_popup()
+        if ITEM is None or payload is None:
+            self.report({"ERROR"}, 'Config or clipboard data is no longer available, please paste again')
+            return {"CANCELLED"}
+
+        try:
+            self.import_files(ITEM, payload['paste_files'], payload['match_files'])
+        finally:
+            release_payload(self.payload)
 
+        return {"FINISHED"}
+
+    def import_files(self, ITEM, file_list, match_files):
         op_callable, ops_args, op_context = ITEM.get_operator_and_args()
 
         if op_callable:
-            with MeasureTime() as start_time:
-                for file_path in self.file_list:
-                    if file_path in self.match_file_op_dict: continue
-                    ops_args['filepath'] = file_path
-                    try:
-                        if op_context:
-                            op_callable(op_context, **ops_args)
-                        else:
-                            op_callable(**ops_args)
-                    except Exception as e:
-                        self.report({"ERROR"}, str(e))
-
-                if get_pref().report_time: self.report({"INFO"},
-                                                       f'{self.bl_label} Cost {round(time.time() - start_time, 5)} s')
+            with trace_invocation(ITEM.name) as invocation:
+                import_list = [file_path for file_path in file_list if file_path not in match_files]
+                for error in run_import(ITEM.name, op_callable, ops_args, import_list, op_context,
+                                        get_path_type(ITEM.operator_type)):
+                    self.report({"ERROR"}, error)
+
+            if get_pref().report_time: self.report({"INFO"}, f'{ITEM.name} Cost {round(invocation.duration, 5)} s')
         else:
             self.report({"ERROR"}, f'{op_callable} Error!!!')
 
-        return {"FINISHED"}
 
+@profile_operator
+class DynamicExport(bpy.types.Operator):
+    """Export with config"""
+    bl_idname = 'wm.spio_config_export'
+    bl_label = 'Export with Config'
+    bl_options = {'INTERNAL'}
 
-class DynamicExport:
+    config_index: IntProperty()
+    batch_mode: BoolProperty(default=False, options={'SKIP_SAVE'})
 
     @classmethod
     def poll(self, context):
         return context.active_object is not None and len(context.selected_objects) != 0
 
+    @classmethod
+    def description(cls, context, properties):
+        ITEM = get_config_item(properties.config_index)
+        return ITEM.description if ITEM else ''
+
     def get_temp_dir(self):
         temp_dir = self.ITEM.temporary_directory
         if temp_dir == '':
             temp_dir = bpy.path.abspath(bpy.context.preferences.filepaths.temporary_directory)
             if temp_dir == '':
                 # win temp file
-                temp_dir = os.path.join(os.path.expanduser('~'), 'spio_temp')
-                if not "spio_temp" in os.listdir(os.path.expanduser('~')):
-                    os.makedirs(temp_dir)
+                temp_dir = get_dir()
         else:
             temp_dir = bpy.path.abspath(temp_dir)
             if not os.path.exists(temp_dir):
@@ -127,10 +155,13 @@ class DynamicExport:
         paths = []
         temp_dir = self.get_temp_dir()
         filepath = os.path.join(temp_dir, context.active_object.name + f'.{self.extension}').replace('\\', '/')
-        paths.append(filepath)
 
         op_args.update({'filepath': filepath})
-        op_callable(**op_args)
+        start_time = time.time()
+        with span(op_callable.idname_py(), filepath=filepath), \
+                measure(op_callable.idname_py(), [filepath], path_type='EXPORT'):
+            op_callable(**op_args)
+        paths.extend(get_export_manifest(filepath, op_args, start_time))
 
         return paths
 
@@ -143,14 +174,17 @@ class DynamicExport:
 
         for obj in selected_objects:
             filepath = os.path.join(temp_dir, obj.name + f'.{self.extension}').replace('\\', '/')
-            paths.append(filepath)
 
             bpy.ops.object.select_all(action='DESELECT')
             context.view_layer.objects.active = obj
             obj.select_set(True)
 
             op_args.update({'filepath': filepath})
-            op_callable(**op_args)
+            start_time = time.time()
+            with span(op_callable.idname_py(), filepath=filepath), \
+                measure(op_callable.idname_py(), [filepath], path_type='EXPORT'):
+                op_callable(**op_args)
+            paths.extend(get_export_manifest(filepath, op_args, start_time))
 
         context.view_layer.objects.active = src_active
 
@@ -162,22 +196,22 @@ class DynamicExport:
 
     def execute(self, context):
         # use pre-define index to call config
-        ITEM = self.ITEM
+        ITEM = get_config_item(self.config_index)
+        if ITEM is None:
+            self.report({"ERROR"}, 'Config is no longer available')
+            return {"CANCELLED"}
+
+        self.ITEM = ITEM
+        self.extension = ITEM.extension
 
         op_callable, op_args, op_context = ITEM.get_operator_and_args()
 
         if op_callable:
-            temp_dir = self.get_temp_dir()
-            # set dict for checking overwrite obj time
-            src_file = dict()
-            for file in os.listdir(temp_dir):
-                src_file[file] = os.path.getmtime(os.path.join(temp_dir, file))
-
-            with MeasureTime() as start_time:
+            with trace_invocation(ITEM.name) as invocation:
                 if self.batch_mode:
                     paths = self.export_batch(context, op_callable, op_args)
                     self.report({'INFO'},
-                                f'{len(paths)} {self.extension} files has been copied to Clipboard')
+                                f'{len(paths)} files ({self.extension} and sidecars) has been copied to Clipboard')
 
                 else:
                     paths = self.export_single(context, op_callable, op_args)
@@ -186,12 +220,26 @@ class DynamicExport:
 
                 # Pref
                 POST = PostProcess()
-                POST.copy_to_clipboard(paths=PostProcess.get_update_files(src_file, temp_dir), op=self)
-                POST.open_dir(temp_dir)
+                with span('clipboard push', files=len(paths)):
+                    POST.copy_to_clipboard(paths=paths, op=self)
+                with span('post process'):
+                    POST.open_dir(paths, self.get_temp_dir())
+                    POST.clean_temp(paths)
 
-                if get_pref().report_time: self.report({"INFO"},
-                                                       f'{self.bl_label} Cost {round(time.time() - start_time, 5)} s')
+            if get_pref().report_time: self.report({"INFO"}, f'{ITEM.name} Cost {round(invocation.duration, 5)} s')
         else:
             self.report({"ERROR"}, f'{op_callable} Error!!!')
 
         return {"FINISHED"}
+
+
+def register():
+    bpy.utils.register_class(DynamicImport)
+    bpy.utils.register_class(DynamicExport)
+
+
+def unregister():
+    bpy.utils.unregister_class(DynamicImport)
+    bpy.utils.unregister_class(DynamicExport)
+
+    clear_payloads()
@@ -0,0 +1,220 @@
+'''Cache the objects that an importer create from a file, as a .blend library
+
+A paste of the same file with the same importer and args append from the library instead of parsing again.
+'''
+import hashlib
+import json
+import os
+
+import bpy
+
+from ..clipboard.temp_store import hash_file, touch, get_entry_size, evict
+from .core import get_gltf_sidecar_files
+
+HASH_MEMO = dict()  # (path, size, mtime): content hash, so unchanged files are not read again
+HASH_MEMO_SIZE = 1024  # oldest hashes are dropped above it
+
+
+def get_file_hash(filepath):
+    stat = os.stat(filepath)
+    memo_key = (filepath, stat.st_size, stat.st_mtime_ns)
+    digest = HASH_MEMO.get(memo_key)
+    if digest is None:
+        digest = hash_file(filepath)
+        if len(HASH_MEMO) >= HASH_MEMO_SIZE:
+            HASH_MEMO.pop(next(iter(HASH_MEMO)))
+        HASH_MEMO[memo_key] = digest
+
+    return digest
+
+
+def get_obj_sidecar_files(filepath):
+    """.mtl files that an .obj file use, and the texture maps of them"""
+    directory = os.path.dirname(filepath)
+    mtl_files = []
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if line.startswith('mtllib'):
+                mtl_files.extend(os.path.join(directory, name) for name in line.split()[1:])
+
+    files = list(mtl_files)
+    for mtl in mtl_files:
+        try:
+            with open(mtl, 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    words = line.split()
+                    if len(words) > 1 and words[0].lower().startswith(('map_', 'bump', 'disp', 'refl')):
+                        files.append(os.path.join(os.path.dirname(mtl), words[-1]))
+        except OSError:
+            pass
+
+    return files
+
+
+def get_sidecar_stats(filepath):
+    """(path, size, mtime) of the files an importer read next to the main file, missing files included"""
+    ext = os.path.splitext(filepath)[1].lower()
+    try:
+        if ext == '.obj':
+            files = get_obj_sidecar_files(filepath)
+        elif ext == '.gltf':
+            files = get_gltf_sidecar_files(filepath)
+        else:
+            files = []
+    except (OSError, ValueError):
+        files = []
+
+    stats = []
+    for file in files:
+        try:
+            stat = os.stat(file)
+        except OSError:
+            stats.append((file, None, None))
+        else:
+            stats.append((file, stat.st_size, stat.st_mtime_ns))
+
+    return stats
+
+
+def scan_size():
+    """timer to scan the cache size, the panel draw only read the scanned value"""
+    get_import_cache().get_size()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+class ImportCache():
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.size = None  # bytes, scanned on first use
+
+    def get_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        return self.cache_dir
+
+    def get_key(self, filepath, bl_idname, ops_args):
+        args = {key: value for key, value in ops_args.items() if key not in {'filepath', 'directory', 'files'}}
+        data = json.dumps([get_file_hash(filepath), get_sidecar_stats(filepath), bl_idname, args,
+                           bpy.app.version_string],
+                          sort_keys=True, default=str)
+
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.get_dir(), key + '.blend')
+
+    def load(self, bl_idname, ops_args, file_list):
+        """append cached objects to the active collection
+
+        Returns:
+            files that are not in cache, {file: appended objects}
+        """
+        misses = list()
+        loaded = dict()
+        for filepath in file_list:
+            try:
+                path = self.get_path(self.get_key(filepath, bl_idname, ops_args))
+            except OSError:
+                misses.append(filepath)
+                continue
+
+            if not os.path.isfile(path):
+                misses.append(filepath)
+                continue
+
+            touch(path)  # mark as recently used for eviction
+            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+                data_to.objects = data_from.objects
+
+            collection = bpy.context.collection
+            objects = [obj for obj in data_to.objects if obj is not None]
+            for obj in objects:
+                obj.use_fake_user = False  # libraries written by older versions kept it
+                collection.objects.link(obj)
+            loaded[filepath] = objects
+
+        return misses, loaded
+
+    def store(self, filepath, bl_idname, ops_args, objects):
+        if len(objects) == 0: return
+
+        try:
+            path = self.get_path(self.get_key(filepath, bl_idname, ops_args))
+        except OSError:
+            return
+
+        temp_path = path + '.tmp'
+        bpy.data.libraries.write(temp_path, set(objects))
+        os.replace(temp_path, path)
+
+        if self.size is not None:
+            self.size += os.path.getsize(path)
+
+    def get_size(self):
+        if self.size is None:
+            self.size = get_entry_size(self.get_dir())
+
+        return self.size
+
+    def get_draw_size(self):
+        """last scanned size for ui draw, None until the scan timer ran"""
+        if self.size is None and not bpy.app.timers.is_registered(scan_size):
+            bpy.app.timers.register(scan_size, first_interval=0)
+
+        return self.size
+
+    def evict(self, max_bytes):
+        """remove least recently used libraries until the cache fit the budget"""
+        if self.get_size() <= max_bytes: return
+
+        evict(self.get_dir(), max_bytes, 0, set())
+        self.size = None
+
+    def purge(self):
+        for entry in os.scandir(self.get_dir()):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+        HASH_MEMO.clear()
+        self.size = None
+
+
+IMPORT_CACHE = None
+
+
+def get_import_cache():
+    global IMPORT_CACHE
+    if IMPORT_CACHE is None:
+        IMPORT_CACHE = ImportCache(os.path.join(os.path.expanduser('~'), 'spio_cache', 'import'))
+
+    return IMPORT_CACHE
+
+
+class SPIO_OT_purge_import_cache(bpy.types.Operator):
+    """Remove every cached import result"""
+    bl_idname = 'spio.purge_import_cache'
+    bl_label = 'Purge Import Cache'
+
+    def execute(self, context):
+        cache = get_import_cache()
+        size = cache.get_size()
+        cache.purge()
+        self.report({'INFO'}, f'Import cache purged ({round(size / 1024 / 1024, 2)} MB)')
+
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(SPIO_OT_purge_import_cache)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(scan_size):
+        bpy.app.timers.unregister(scan_size)
+    bpy.utils.unregister_class(SPIO_OT_purge_import_cache)
@@ -0,0 +1,172 @@
+'''Rolling latency and throughput of every importer/exporter call, kept on disk per blender version
+
+stats.json: {blender version: {"PATH|ext|bl_idname": [[seconds, files, bytes], ...]}}
+Percentiles are of seconds per file, so calls that import many files at once compare with single file calls.
+'''
+import json
+import os
+import re
+import time
+
+import bpy
+
+MAX_SAMPLES = 200  # per key, older samples are dropped
+SAVE_DELAY = 2  # seconds, several calls of one paste are saved together
+
+STATS = None
+DIRTY = False
+
+
+def get_stats_path():
+    return os.path.join(os.path.expanduser('~'), 'spio_cache', 'stats.json')
+
+
+def get_stats():
+    global STATS
+    if STATS is None:
+        try:
+            with open(get_stats_path(), 'r', encoding='utf-8') as f:
+                STATS = json.load(f)
+        except (OSError, ValueError):
+            STATS = dict()
+
+    return STATS
+
+
+def save_stats():
+    global DIRTY
+    if not DIRTY: return
+
+    path = get_stats_path()
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(get_stats(), f)
+    os.replace(path + '.tmp', path)
+    DIRTY = False
+
+
+def get_path_type(operator_type):
+    """path of a config by its operator_type, the same importer can be called by several paths"""
+    if operator_type.startswith(('APPEND_BLEND', 'LINK_BLEND')):
+        return 'BLEND'
+    elif operator_type.startswith('EXPORT'):
+        return 'EXPORT'
+    elif operator_type.startswith('ADDONS'):
+        return 'IMPORT_ADDON'
+    elif operator_type == 'CUSTOM':
+        return 'IMPORT_CUSTOM'
+
+    return 'IMPORT_DEFAULT'
+
+
+def parse_version(version_string):
+    """(major, minor, patch) of a version string like '3.6.5' or '4.1.0 Alpha'"""
+    return tuple(int(n) for n in re.findall(r'\d+', version_string.split(' ')[0]))
+
+
+def add_sample(path_type, ext, bl_idname, seconds, files, size):
+    global DIRTY
+
+    version_stats = get_stats().setdefault(bpy.app.version_string, dict())
+    samples = version_stats.setdefault(f'{path_type}|{ext}|{bl_idname}', list())
+    samples.append([seconds, files, size])
+    del samples[:-MAX_SAMPLES]
+
+    DIRTY = True
+    if not bpy.app.timers.is_registered(save_stats):
+        bpy.app.timers.register(save_stats, first_interval=SAVE_DELAY)
+
+
+class measure():
+    '''time one importer/exporter call, the size of the files is read after the call so exports work too'''
+
+    def __init__(self, bl_idname, files, path_type='IMPORT_DEFAULT'):
+        self.bl_idname = bl_idname
+        self.files = files
+        self.path_type = path_type
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        seconds = time.perf_counter() - self.start
+        if type is not None or len(self.files) == 0: return
+
+        from .core import get_pref
+        if not get_pref().use_latency_stats: return
+
+        size = 0
+        for filepath in self.files:
+            try:
+                size += os.path.getsize(filepath)
+            except OSError:
+                pass
+
+        ext = self.files[0].split('.')[-1].lower()
+        add_sample(self.path_type, ext, self.bl_idname, seconds, len(self.files), size)
+
+
+def percentile(values, p):
+    """nearest rank of sorted values"""
+    index = max(int(round(p / 100 * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(samples):
+    seconds = sorted(sample[0] / max(sample[1], 1) for sample in samples)  # per file
+    total_time = sum(sample[0] for sample in samples) or 1e-9
+
+    return {
+        'count': len(samples),
+        'p50': percentile(seconds, 50),
+        'p95': percentile(seconds, 95),
+        'p99': percentile(seconds, 99),
+        'files_per_s': sum(sample[1] for sample in samples) / total_time,
+        'mb_per_s': sum(sample[2] for sample in samples) / 1024 / 1024 / total_time,
+    }
+
+
+def get_summary():
+    """{key: summary} of this blender version, with 'prev_p50' from the highest older version that has the key"""
+    stats = get_stats()
+    summary = {key: summarize(samples) for key, samples in stats.get(bpy.app.version_string, {}).items() if samples}
+
+    current = parse_version(bpy.app.version_string)
+    older_versions = sorted((version for version in stats if parse_version(version) < current),
+                            key=parse_version, reverse=True)
+    for version in older_versions:
+        for key, samples in stats[version].items():
+            if key in summary and 'prev_p50' not in summary[key] and samples:
+                summary[key]['prev_p50'] = summarize(samples)['p50']
+                summary[key]['prev_version'] = version
+
+    return summary
+
+
+class SPIO_OT_reset_latency_stats(bpy.types.Operator):
+    """Clear the latency stats of every blender version"""
+    bl_idname = 'spio.reset_latency_stats'
+    bl_label = 'Reset Latency Stats'
+
+    def execute(self, context):
+        global DIRTY
+        get_stats().clear()
+        DIRTY = True
+        save_stats()
+
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(SPIO_OT_reset_latency_stats)
+
+
+def unregister():
+    bpy.utils.unregister_class(SPIO_OT_reset_latency_stats)
+
+    if bpy.app.timers.is_registered(save_stats):
+        bpy.app.timers.unregister(save_stats)
+    save_stats()
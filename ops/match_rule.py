@@ -0,0 +1,170 @@
+'''Match the file names against the match rules of many configs in a single pass
+
+Literal rules share tries (STARTSWITH / ENDSWITH) and an Aho-Corasick automaton (IN),
+regex rules are joined into one alternation. Each file name is scanned once whatever the config count.
+'''
+import os
+import re
+
+# named groups / backrefs / inline flags change meaning once joined with other expressions
+UNJOINABLE_REGEX = re.compile(r'\(\?P|\(\?[aiLmsux-]|\\\d|\\g<')
+
+
+class _Trie():
+    def __init__(self):
+        self.children = [dict()]
+        self.priority = [-1]  # best rule priority ending at this node, -1 for none
+
+    def add(self, word, priority):
+        node = 0
+        for char in word:
+            nxt = self.children[node].get(char)
+            if nxt is None:
+                nxt = len(self.children)
+                self.children.append(dict())
+                self.priority.append(-1)
+                self.children[node][char] = nxt
+            node = nxt
+        self.priority[node] = max(self.priority[node], priority)
+
+    def best_prefix(self, s):
+        """best priority of the words that s starts with"""
+        best = self.priority[0]
+        node = 0
+        for char in s:
+            node = self.children[node].get(char)
+            if node is None: break
+            best = max(best, self.priority[node])
+        return best
+
+
+class _AhoCorasick():
+    def __init__(self):
+        self.trie = _Trie()
+        self.fail = None
+
+    def add(self, word, priority):
+        self.trie.add(word, priority)
+
+    def build(self):
+        children, priority = self.trie.children, self.trie.priority
+        self.fail = [0] * len(children)
+
+        queue = [0]
+        for node in queue:  # breadth first, the list grows while iterating
+            for char, nxt in children[node].items():
+                queue.append(nxt)
+                if node != 0:
+                    f = self.fail[node]
+                    while f and char not in children[f]:
+                        f = self.fail[f]
+                    self.fail[nxt] = children[f].get(char, 0)
+                # a node also output every word of its fail node
+                priority[nxt] = max(priority[nxt], priority[self.fail[nxt]])
+
+    def best_in(self, s):
+        """best priority of the words that s contains"""
+        children, priority, fail = self.trie.children, self.trie.priority, self.fail
+        best = priority[0]
+        node = 0
+        for char in s:
+            while node and char not in children[node]:
+                node = fail[node]
+            node = children[node].get(char, 0)
+            if priority[node] > best: best = priority[node]
+        return best
+
+
+class RuleMatcher():
+    '''Compile the match rules of many configs together
+
+    rules: list of (key, match_rule, match_value, extension).
+    When a file match more than one rule, the last one in the list win (same as assigning one by one)
+    '''
+
+    def __init__(self, rules):
+        self.keys = []
+
+        self.startswith = _Trie()
+        self.endswith = dict()  # extension: _Trie of reversed value
+        self.contains = _AhoCorasick()
+        regex_list = []
+
+        for priority, (key, match_rule, match_value, extension) in enumerate(rules):
+            self.keys.append(key)
+
+            if match_rule == 'STARTSWITH':
+                self.startswith.add(match_value, priority)
+            elif match_rule == 'ENDSWITH':
+                self.endswith.setdefault(extension, _Trie()).add(match_value[::-1], priority)
+            elif match_rule == 'IN':
+                self.contains.add(match_value, priority)
+            elif match_rule == 'REGEX':
+                try:
+                    re.compile(match_value)
+                except re.error as e:
+                    print(f'SPIO match rule "{match_value}" is not a valid regex: {e}')
+                    continue
+                regex_list.append((priority, match_value))
+
+        self.contains.build()
+        self.regex, self.regex_single = self.compile_regex(regex_list)
+
+    @staticmethod
+    def compile_regex(regex_list):
+        """join the regex into one alternation, tried from the highest priority.
+        Expression that can not be joined (named groups, backrefs, inline flags) are kept on their own"""
+        joinable = []
+        single = []
+        for priority, value in regex_list:
+            if UNJOINABLE_REGEX.search(value):
+                single.append((priority, re.compile(value)))
+            else:
+                joinable.append((priority, value))
+
+        if not joinable: return None, single
+
+        joinable.sort(reverse=True)
+        # each branch end with an empty named group behind a lookahead, the group name tell the rule
+        pattern = '|'.join(f'(?=.*?(?:{value}))(?P<spio_{priority}>)' for priority, value in joinable)
+        try:
+            regex = re.compile(pattern, re.DOTALL)
+        except re.error:
+            return None, single + [(priority, re.compile(value)) for priority, value in joinable]
+
+        return regex, single
+
+    def best_priority(self, name):
+        best = self.startswith.best_prefix(name)
+
+        for extension, trie in self.endswith.items():
+            stem = name[:-len(extension) - 1] if name.endswith('.' + extension) else name
+            best = max(best, trie.best_prefix(stem[::-1]))
+
+        best = max(best, self.contains.best_in(name))
+
+        if self.regex is not None:
+            res = self.regex.match(name)
+            if res:
+                best = max(best, int(res.lastgroup[len('spio_'):]))
+
+        for priority, regex in self.regex_single:
+            if priority > best and regex.search(name):
+                best = priority
+
+        return best
+
+    def match(self, filepath):
+        """return the key of the rule that win, None if no rule match"""
+        best = self.best_priority(os.path.basename(filepath))
+        return self.keys[best] if best >= 0 else None
+
+    def classify(self, file_list):
+        """return {filepath: key} for files that match a rule"""
+        match_dict = dict()
+        for file in file_list:
+            key = self.match(file)
+            if key is not None:
+                match_dict[file] = key
+
+        return match_dict
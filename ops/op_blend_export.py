@@ -57,7 +57,7 @@ class SPIO_OT_export_blend(ImageCopyDefault, bpy.types.Operator):
                     self.filepath)
         # Prefs
         POST.copy_to_clipboard(paths=[self.filepath], op=self)
-        POST.open_dir(self.filepath)
+        POST.open_dir([self.filepath], os.path.dirname(self.filepath))
 
         return {'FINISHED'}
 
@@ -4,10 +4,15 @@ import sys
 import math
 from bpy.props import StringProperty, BoolProperty, EnumProperty
 
+from ..clipboard.temp_store import is_stored_file, find_image_by_path, evict_async
+from .payload import get_payload_paths, EXPIRED_MESSAGE
+from .profiler import profile_operator
+
 
 class image_io:
     bl_options = {'UNDO_GROUPED'}
     files: StringProperty()  # list of filepath, join with$$
+    payload: StringProperty()  # paste payload id, used instead of files when set
 
     action = None
 
@@ -27,7 +32,19 @@ class image_io:
         elif context.area.type == 'FILE_BROWSER':
             return context.area.ui_type == 'ASSETS'
 
+    def get_files(self):
+        return get_payload_paths(self.payload, self.files)
+
+    def cancel_expired(self):
+        self.report({"ERROR"}, EXPIRED_MESSAGE)
+        return {"CANCELLED"}
+
     def load_image_by_path(self, path):
+        # pasted pixels are stored by content, an image that already load it is up to date
+        if is_stored_file(path):
+            image = find_image_by_path(path)
+            if image: return image
+
         src_images = list(bpy.data.images)
 
         # use built-in ops instead of bpy.data.images.load to detect sequence and UDIM
@@ -41,39 +58,51 @@ class image_io:
         return image
 
 
+@profile_operator
 class SPIO_OT_import_image_as_reference(image_io, bpy.types.Operator):
     bl_idname = "spio.import_image_as_reference"
     bl_label = "Import as Reference"
 
     def execute(self, context):
-        for filepath in self.files.split('$$'):
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
+
+        for filepath in filepaths:
             bpy.ops.object.load_reference_image(filepath=filepath)
 
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_import_image_as_plane(image_io, bpy.types.Operator):
     bl_idname = "spio.import_image_as_plane"
     bl_label = "Import as Plane"
 
     def execute(self, context):
-        filepaths = self.files.split('$$')
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
         dir = os.path.dirname(filepaths[0]) + '\\'
         files = [{"name": os.path.basename(filepath)} for filepath in
                  filepaths]
 
+        from .core import ensure_addon
+        ensure_addon('import_image.to_plane')
         bpy.ops.import_image.to_plane(files=files, directory=dir, offset=True)
 
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_import_image_as_nodes(image_io, bpy.types.Operator):
     bl_idname = "spio.import_image_as_nodes"
     bl_label = "Import as Nodes"
 
     def execute(self, context):
         location_X, location_Y = context.space_data.cursor_location
-        for filepath in self.files.split('$$'):
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
+
+        for filepath in filepaths:
             image = self.load_image_by_path(filepath)
 
             bpy.ops.node.select_all(action='DESELECT')
@@ -126,6 +155,7 @@ def get_nodes_links(context):
     return tree.nodes, tree.links
 
 
+@profile_operator
 class SPIO_OT_import_image_PBR_setup(image_io, bpy.types.Operator):
     bl_idname = "spio.import_image_pbr_setup"
     bl_label = "Import and Setup PBR (Principled)"
@@ -134,7 +164,8 @@ class SPIO_OT_import_image_PBR_setup(image_io, bpy.types.Operator):
         # from addon_utils import enable
         # enable('node_wrangler')
 
-        filepaths = self.files.split('$$')
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
         dir = os.path.dirname(filepaths[0]) + '\\'
         files = '$$'.join([os.path.basename(filepath) for filepath in filepaths])
 
@@ -151,13 +182,17 @@ class SPIO_OT_import_image_PBR_setup(image_io, bpy.types.Operator):
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_import_image_as_world(image_io, bpy.types.Operator):
     '''Hold Alt to import as asset'''
     bl_idname = "spio.import_image_as_world"
     bl_label = "Import as World"
 
     def invoke(self, context, event):
-        for filepath in self.files.split('$$'):
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
+
+        for filepath in filepaths:
             # get preset node group
             cur_dir = os.path.dirname(__file__)
             node_group_file = os.path.join(cur_dir, 'templates', "World.blend")
@@ -181,13 +216,17 @@ class SPIO_OT_import_image_as_world(image_io, bpy.types.Operator):
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_import_image_as_light_gobos(image_io, bpy.types.Operator):
     '''Hold Alt to import as asset'''
     bl_idname = "spio.import_image_as_light_gobos"
     bl_label = "Import as Light Gobos"
 
     def invoke(self, context, event):
-        for filepath in self.files.split('$$'):
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
+
+        for filepath in filepaths:
             img = self.load_image_by_path(filepath)
 
             bpy.ops.object.light_add(type='AREA')
@@ -223,13 +262,17 @@ class SPIO_OT_import_image_as_light_gobos(image_io, bpy.types.Operator):
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_import_image_as_parallax_material(image_io, bpy.types.Operator):
     '''Hold Alt to import as asset'''
     bl_idname = "spio.import_image_as_parallax_material"
     bl_label = "Import as Parallax Material"
 
     def invoke(self, context, event):
-        for filepath in self.files.split('$$'):
+        filepaths = self.get_files()
+        if len(filepaths) == 0: return self.cancel_expired()
+
+        for filepath in filepaths:
             cur_dir = os.path.dirname(__file__)
             node_group_file = os.path.join(cur_dir, 'templates', "ParallaxMapping_2022_5_9.blend")
 
@@ -302,12 +345,14 @@ class ImageCopyDefault:
             clipboard.push_to_clipboard(paths=[image_path])
 
         self.set_format(restore=True)
+        evict_async()
 
         self.report({'INFO'}, f'{active_image.name} has been copied to Clipboard')
 
         return {'FINISHED'}
 
 
+@profile_operator
 class SPIO_OT_export_pixel(ImageCopyDefault, bpy.types.Operator):
     """Export as Image Pixel"""
     bl_idname = 'spio.export_pixel'
@@ -316,6 +361,7 @@ class SPIO_OT_export_pixel(ImageCopyDefault, bpy.types.Operator):
     action = 'pixel'
 
 
+@profile_operator
 class SPIO_OT_export_image(ImageCopyDefault, bpy.types.Operator):
     """Export as Image File"""
     bl_idname = 'spio.export_image'
@@ -324,6 +370,7 @@ class SPIO_OT_export_image(ImageCopyDefault, bpy.types.Operator):
     action = 'file'
 
 
+@profile_operator
 class SPIO_OT_import_pbr_folders_as_materials(bpy.types.Operator):
     """Hold Alt to import as asset"""
     bl_idname = "spio.import_pbr_folders_as_materials"
@@ -331,9 +378,13 @@ class SPIO_OT_import_pbr_folders_as_materials(bpy.types.Operator):
     bl_options = {'UNDO_GROUPED'}
 
     dirs: StringProperty(name='Join Dirs')
+    payload: StringProperty()  # paste payload id, used instead of dirs when set
 
     def invoke(self, context, event):
-        dirs = self.dirs.split('$$')
+        dirs = get_payload_paths(self.payload, self.dirs, key='dirs')
+        if len(dirs) == 0:
+            self.report({"ERROR"}, EXPIRED_MESSAGE)
+            return {"CANCELLED"}
 
         for i, dir in enumerate(dirs):
             # add and set slot
@@ -352,6 +403,40 @@ from ..preferences.prefs import get_pref
 
 # base on node wrangler
 
+def split_into_components(fname):
+    # Split filename into components
+    # 'WallTexture_diff_2k.002.jpg' -> ['Wall', 'Texture', 'diff', 'k']
+    # Remove extension
+    fname = path.splitext(fname)[0]
+    # Remove digits
+    fname = ''.join(i for i in fname if not i.isdigit())
+    # Separate CamelCase by space
+    fname = re.sub(r"([a-z])([A-Z])", r"\g<1> \g<2>", fname)
+    # Replace common separators with SPACE
+    separators = ['_', '.', '-', '__', '--', '#']
+    for sep in separators:
+        fname = fname.replace(sep, ' ')
+
+    components = fname.split(' ')
+    components = [c.lower() for c in components]
+    return components
+
+
+def match_files_to_socket_names(socketnames, file_names):
+    """set [Socket Name, [abbreviations], None] to the first file name that contain one of the abbreviations"""
+    # each file name is split once, not once per socket
+    file_components = [(fname, set(split_into_components(fname))) for fname in file_names]
+
+    for sname in socketnames:
+        abbr = set(sname[1])
+        for fname, components in file_components:
+            # TODO: ignore basename (if texture is named "fancy_metal_nor", it will be detected as metallic map, not normal map)
+            if abbr.intersection(components):
+                sname[2] = fname
+                break
+
+
+@profile_operator
 class SPIO_OT_create_principled_set_up_material(bpy.types.Operator):
     bl_idname = "spio.create_principled_set_up_material"
     bl_label = "Principled Texture Setup"
@@ -404,25 +489,6 @@ class SPIO_OT_create_principled_set_up_material(bpy.types.Operator):
             self.report({'ERROR'}, 'No Principled BSDF node is active')
             return {'CANCELLED'}
 
-        # Helper_functions
-        def split_into__components(fname):
-            # Split filename into components
-            # 'WallTexture_diff_2k.002.jpg' -> ['Wall', 'Texture', 'diff', 'k']
-            # Remove extension
-            fname = path.splitext(fname)[0]
-            # Remove digits
-            fname = ''.join(i for i in fname if not i.isdigit())
-            # Separate CamelCase by space
-            fname = re.sub(r"([a-z])([A-Z])", r"\g<1> \g<2>", fname)
-            # Replace common separators with SPACE
-            separators = ['_', '.', '-', '__', '--', '#']
-            for sep in separators:
-                fname = fname.replace(sep, ' ')
-
-            components = fname.split(' ')
-            components = [c.lower() for c in components]
-            return components
-
         # Filter textures names for texturetypes in filenames
         # [Socket Name, [abbreviations and keyword list], Filename placeholder]
         tags = get_pref().principled_tags
@@ -444,27 +510,9 @@ class SPIO_OT_create_principled_set_up_material(bpy.types.Operator):
             ['Ambient Occlusion', tags.ambient_occlusion.split(' '), None],
         ]
 
-        def is_matches(fname, sname):
-            filenamecomponents = split_into__components(fname)
-            matches = set(sname[1]).intersection(set(filenamecomponents))
-            # TODO: ignore basename (if texture is named "fancy_metal_nor", it will be detected as metallic map, not normal map)
-            if matches:
-                sname[2] = fname
-                return True
-
         # Look through texture_types and set value as filename of first matched file
-        def match_files_to_socket_names(directory):
-            for sname in socketnames:
-                if self.files != '':
-                    for fname in self.files.split('$$'):
-                        if is_matches(fname, sname):
-                            break
-                else:
-                    for file in os.listdir(directory):
-                        if is_matches(file, sname):
-                            break
-
-        match_files_to_socket_names(self.directory)
+        file_names = self.files.split('$$') if self.files != '' else os.listdir(self.directory)
+        match_files_to_socket_names(socketnames, file_names)
         # Remove socketnames without found files
         socketnames = [s for s in socketnames if s[2]
                        and path.exists(self.directory + s[2])]
@@ -538,7 +586,7 @@ class SPIO_OT_create_principled_set_up_material(bpy.types.Operator):
                 # NORMAL NODES
                 if sname[0] == 'Normal':
                     # Test if new texture node is normal or bump map
-                    fname_components = split_into__components(sname[2])
+                    fname_components = split_into_components(sname[2])
                     match_normal = set(normal_abbr).intersection(set(fname_components))
                     match_bump = set(bump_abbr).intersection(set(fname_components))
                     if match_normal:
@@ -555,7 +603,7 @@ class SPIO_OT_create_principled_set_up_material(bpy.types.Operator):
 
                 elif sname[0] == 'Roughness':
                     # Test if glossy or roughness map
-                    fname_components = split_into__components(sname[2])
+                    fname_components = split_into_components(sname[2])
                     match_rough = set(rough_abbr).intersection(set(fname_components))
                     match_gloss = set(gloss_abbr).intersection(set(fname_components))
 
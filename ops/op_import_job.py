@@ -0,0 +1,517 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .core import get_import_calls, is_multi_file_op, call_import_op, get_pref, trace_invocation, ADDON_DEPENDS
+from .tracer import span
+from .latency_stats import measure
+from .profiler import profile_operator
+from .import_cache import get_import_cache, get_file_hash, get_sidecar_stats
+from ..imexporter.default_importer import importer, get_importer
+
+JOB_MIN_FILES = 10  # smaller paste are imported at once, larger one in the job runner
+JOB_CHUNK_FILES = 8  # max files of a single multi-file importer call in the job runner
+TIME_SLICE = 0.1  # seconds of import work before giving the ui back
+TIMER_INTERVAL = 0.01
+PREFIX_HASH_BYTES = 64 * 1024  # head and tail bytes read to tell same size files apart cheaply
+SELF_CONTAINED_EXTS = {'glb', 'fbx', 'stl', 'ply', 'blend'}  # same content is the same model
+SIDECAR_EXTS = {'obj', 'gltf'}  # same content is the same model only with the same files next to it
+
+
+def get_prefix_hash(filepath, size):
+    """hash of the head and tail of a file, equal for files that may have the same content"""
+    sha1 = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        if size <= PREFIX_HASH_BYTES * 2:
+            sha1.update(f.read())
+        else:
+            sha1.update(f.read(PREFIX_HASH_BYTES))
+            f.seek(-PREFIX_HASH_BYTES, os.SEEK_END)
+            sha1.update(f.read(PREFIX_HASH_BYTES))
+
+    return sha1.hexdigest()
+
+
+def group_by(files, get_value):
+    groups = dict()
+    for filepath in files:
+        try:
+            groups.setdefault(get_value(filepath), []).append(filepath)
+        except OSError:
+            continue
+
+    return [same_files for same_files in groups.values() if len(same_files) > 1]
+
+
+def creates_objects(op_callable):
+    """built-in model importers, the objects of a file can be instanced for its copies"""
+    return op_callable.idname_py() in set(get_importer(cpp_obj_importer=True).values()) | set(importer.values())
+
+
+def get_fingerprint(filepath):
+    """(size, folder and sidecar files) of a file, None for formats that may read unknown files next to them"""
+    ext = os.path.splitext(filepath)[1][1:].lower()
+    if ext in SELF_CONTAINED_EXTS:
+        return os.path.getsize(filepath), None
+    elif ext in SIDECAR_EXTS:
+        # the sidecars are relative to the folder, the same content elsewhere can read other files
+        return os.path.getsize(filepath), (os.path.dirname(filepath), tuple(get_sidecar_stats(filepath)))
+
+    return None
+
+
+def find_duplicates(file_list):
+    """fingerprint by size and sidecars, then head/tail hash and full content hash only for files that still match
+
+    Returns:
+        unique files in paste order, {first file: [files with the same content]}
+    """
+    fingerprint_groups = dict()
+    for filepath in file_list:
+        try:
+            fingerprint = get_fingerprint(filepath)
+        except OSError:
+            fingerprint = None
+        fingerprint_groups.setdefault(fingerprint, []).append(filepath)
+
+    duplicates = dict()
+    skip = set()
+    for fingerprint, files in fingerprint_groups.items():
+        if fingerprint is None or len(files) == 1: continue
+        size = fingerprint[0]
+
+        for prefix_files in group_by(files, lambda filepath: get_prefix_hash(filepath, size)):
+            # small files are read whole by the prefix hash already
+            if size <= PREFIX_HASH_BYTES * 2:
+                same_groups = [prefix_files]
+            else:
+                same_groups = group_by(prefix_files, get_file_hash)
+
+            for same_files in same_groups:
+                duplicates[same_files[0]] = same_files[1:]
+                skip.update(same_files[1:])
+
+    unique = [filepath for filepath in file_list if filepath not in skip]
+
+    return unique, duplicates
+
+
+def link_duplicates(objects, copy_count):
+    """linked duplicates of the objects, which share the object data and keep the parenting"""
+    for i in range(copy_count):
+        copies = {obj: obj.copy() for obj in objects}
+        for src, dst in copies.items():
+            if src.parent in copies:
+                dst.parent = copies[src.parent]
+            for collection in src.users_collection:
+                collection.objects.link(dst)
+
+
+class ImportJob():
+    """Files to import with one operator, split into calls that the runner can stop between"""
+
+    def __init__(self, label, op_callable, ops_args, file_list, op_context=None, cache=None, duplicates=None,
+                 path_type='IMPORT_DEFAULT'):
+        self.label = label
+        self.path_type = path_type  # latency stats path of the config
+        self.op_callable = op_callable
+        self.ops_args = ops_args
+        self.op_context = op_context
+        self.cache = cache
+        self.duplicates = duplicates or dict()  # first file: copies, instanced from what the first file import
+
+        # the objects of each file are needed for cache or duplicates, so those files are imported one per call
+        if cache is None:
+            batch_files = [filepath for filepath in file_list if filepath not in self.duplicates]
+            single_files = [filepath for filepath in file_list if filepath in self.duplicates]
+        else:
+            batch_files, single_files = list(), file_list
+
+        self.calls = deque(get_import_calls(ops_args, batch_files, is_multi_file_op(op_callable),
+                                            max_files=JOB_CHUNK_FILES) +
+                           get_import_calls(ops_args, single_files))
+        self.file_count = len(file_list)
+
+    def run_next(self):
+        """run the next call, return (file count, error message or None)"""
+        args, files = self.calls.popleft()
+        capture = self.cache is not None or files[0] in self.duplicates
+        src_objects = set(bpy.data.objects) if capture else None
+        try:
+            with span(self.op_callable.idname_py(), files=len(files)), \
+                    measure(self.op_callable.idname_py(), files, self.path_type):
+                if self.op_context:
+                    self.op_callable(self.op_context, **args)
+                else:
+                    self.op_callable(**args)
+        except Exception as e:
+            return len(files), f'{self.label}: {", ".join(files)}: {e}'
+
+        if capture:
+            new_objects = [obj for obj in bpy.data.objects if obj not in src_objects]
+            link_duplicates(new_objects, len(self.duplicates.get(files[0], ())))
+
+            if self.cache is not None:
+                try:
+                    self.cache.store(files[0], self.op_callable.idname_py(), self.ops_args, new_objects)
+                except (OSError, RuntimeError) as e:
+                    print(f'SPIO import cache: {e}')
+
+        return len(files), None
+
+    def run_all(self):
+        """run every call now, return error messages"""
+        errors = list()
+        while not self.is_finished():
+            count, error = self.run_next()
+            if error: errors.append(error)
+
+        return errors
+
+    def is_finished(self):
+        return len(self.calls) == 0
+
+    def remaining(self):
+        return sum(len(files) for args, files in self.calls)
+
+    def cancel(self):
+        self.calls.clear()
+
+
+class WorkerImportJob():
+    """Split the files over background blender workers, each save what it import as a .blend to append"""
+
+    def __init__(self, label, bl_idname, ops_args, file_list, worker_count, cache=None):
+        self.label = label
+        self.bl_idname = bl_idname
+        self.ops_args = ops_args
+        self.cache = cache
+        self.file_count = len(file_list)
+        self.chunks = self.split_files(file_list, worker_count)
+
+        self.temp_dir = None
+        self.workers = list()  # (popen, output, files)
+        self.started = False
+
+    @staticmethod
+    def split_files(file_list, worker_count):
+        """biggest files first, each to the worker with the least bytes so far"""
+        chunks = [[0, []] for i in range(min(worker_count, len(file_list)))]
+        for filepath in sorted(file_list, key=lambda path: os.path.getsize(path) if os.path.isfile(path) else 0,
+                               reverse=True):
+            chunk = min(chunks, key=lambda c: c[0])
+            chunk[0] += os.path.getsize(filepath) if os.path.isfile(filepath) else 0
+            chunk[1].append(filepath)
+
+        return [files for size, files in chunks if len(files) != 0]
+
+    def start(self):
+        from ..imexporter.execute_blend import start_import_worker
+
+        self.temp_dir = tempfile.mkdtemp(prefix='spio_import_')
+        for i, files in enumerate(self.chunks):
+            output = os.path.join(self.temp_dir, f'worker_{i}.blend')
+            spec_path = os.path.join(self.temp_dir, f'worker_{i}.json')
+            with open(spec_path, 'w', encoding='utf-8') as f:
+                json.dump({'bl_idname': self.bl_idname, 'addon': ADDON_DEPENDS.get(self.bl_idname),
+                           'args': self.ops_args, 'files': files, 'output': output}, f)
+
+            self.workers.append((start_import_worker(spec_path), output, files))
+
+        self.started = True
+
+    def run_next(self):
+        """append the output of a finished worker, (0, None) if all of them are still working"""
+        if not self.started: self.start()
+
+        for worker in self.workers:
+            popen, output, files = worker
+            if popen.poll() is None: continue
+
+            self.workers.remove(worker)
+            with span('append worker output', files=len(files)):
+                error = self.append_output(output, files)
+            if len(self.workers) == 0: self.clean()
+
+            return len(files), error
+
+        return 0, None
+
+    def append_output(self, output, files):
+        try:
+            with open(output + '.json', 'r', encoding='utf-8') as f:
+                status = json.load(f)
+        except (OSError, ValueError):
+            return f'{self.label}: worker failed on {", ".join(files)}'
+
+        if os.path.isfile(output):
+            with bpy.data.libraries.load(output, link=False) as (data_from, data_to):
+                names = list(data_from.objects)
+                data_to.objects = names
+
+            # appended objects may be renamed, map them by the names in the worker file
+            appended = {name: obj for name, obj in zip(names, data_to.objects) if obj is not None}
+            collection = bpy.context.collection
+            for obj in appended.values():
+                collection.objects.link(obj)
+
+            if self.cache is not None:
+                self.store_cache(appended, status.get('objects', {}))
+
+        if len(status['errors']) != 0:
+            return f'{self.label}: ' + '; '.join(status['errors'])
+
+    def store_cache(self, appended, file_objects):
+        for filepath, names in file_objects.items():
+            objects = [appended[name] for name in names if name in appended]
+            try:
+                self.cache.store(filepath, self.bl_idname, self.ops_args, objects)
+            except (OSError, RuntimeError) as e:
+                print(f'SPIO import cache: {e}')
+
+    def is_finished(self):
+        return self.started and len(self.workers) == 0
+
+    def remaining(self):
+        if not self.started: return self.file_count
+        return sum(len(files) for popen, output, files in self.workers)
+
+    def cancel(self):
+        for popen, output, files in self.workers:
+            popen.kill()
+        self.workers.clear()
+        self.started = True
+        self.clean()
+
+    def clean(self):
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
+
+JOBS = deque()
+
+
+def get_worker_count():
+    count = get_pref().import_worker_count
+    if count == 0:
+        count = max((os.cpu_count() or 2) - 1, 1)
+
+    return count
+
+
+def use_workers(op_callable, ops_args, file_list, op_context):
+    if not get_pref().use_import_workers or op_context: return False
+    if len(file_list) < JOB_MIN_FILES: return False
+    # args are passed as json to the worker
+    if not all(isinstance(value, (str, int, float, bool)) for value in ops_args.values()): return False
+
+    return creates_objects(op_callable)
+
+
+def run_import(label, op_callable, ops_args, file_list, op_context=None, path_type='IMPORT_DEFAULT'):
+    """import now for a few files, otherwise queue the import in the modal job runner
+
+    Returns:
+        list of error messages, always empty when queued (the runner report them)
+    """
+    pref = get_pref()
+    # same content is imported once, the copies are linked duplicates
+    if creates_objects(op_callable):
+        file_list, duplicates = find_duplicates(file_list)
+    else:
+        duplicates = dict()
+
+    cache = None
+    if pref.use_import_cache:
+        cache = get_import_cache()
+        # append what is cached, import the rest
+        file_list, loaded = cache.load(op_callable.idname_py(), ops_args, file_list)
+        for filepath, objects in loaded.items():
+            link_duplicates(objects, len(duplicates.get(filepath, ())))
+
+        cache.evict(pref.import_cache_max_size * 1024 * 1024)
+        if len(file_list) == 0: return list()
+
+    if len(file_list) < JOB_MIN_FILES or bpy.app.background:
+        if cache is None and len(duplicates) == 0:
+            return call_import_op(op_callable, ops_args, file_list, op_context, path_type)
+        return ImportJob(label, op_callable, ops_args, file_list, op_context, cache, duplicates,
+                         path_type).run_all()
+
+    # workers save every file in one .blend, files that have copies are imported here to get their objects
+    worker_files = [filepath for filepath in file_list if filepath not in duplicates]
+    if use_workers(op_callable, ops_args, worker_files, op_context):
+        JOBS.append(WorkerImportJob(label, op_callable.idname_py(), ops_args, worker_files, get_worker_count(),
+                                    cache))
+        file_list = [filepath for filepath in file_list if filepath in duplicates]
+
+    if len(file_list) != 0:
+        JOBS.append(ImportJob(label, op_callable, ops_args, file_list, op_context, cache, duplicates, path_type))
+    if not SPIO_OT_import_job_runner.running:
+        bpy.ops.wm.spio_import_job_runner('INVOKE_DEFAULT')
+
+    return list()
+
+
+@profile_operator
+class SPIO_OT_import_job_runner(bpy.types.Operator):
+    """Import queued files in small time slices, press Esc to cancel"""
+    bl_idname = 'wm.spio_import_job_runner'
+    bl_label = 'Super Import Jobs'
+    bl_options = {'UNDO', 'INTERNAL'}  # one undo step for the whole queue
+
+    running = False
+    timer = None  # of the running instance, removed by reset_runner when a file load drop the modal handler
+
+    def invoke(self, context, event):
+        if SPIO_OT_import_job_runner.running: return {'CANCELLED'}
+        SPIO_OT_import_job_runner.running = True
+
+        self.errors = list()
+        self.done = 0
+        self.total = sum(job.file_count for job in JOBS)
+        self.start_time = time.time()
+        # the trace only record during the timer ticks of the runner
+        self.invocation = trace_invocation(self.bl_label).start()
+        self.invocation.suspend()
+
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(TIMER_INTERVAL, window=context.window)
+        SPIO_OT_import_job_runner.timer = self.timer
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            return self.finish(context, cancelled=True)
+
+        if event.type != 'TIMER' or event.timer != self.timer:
+            return {'PASS_THROUGH'}
+
+        # jobs that are queued while running
+        self.total = self.done + sum(job.remaining() for job in JOBS)
+
+        error = None
+        self.invocation.resume()
+        try:
+            self.run_slice()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            error = f'{type(e).__name__}: {e}'
+        finally:
+            self.invocation.suspend()
+
+        # stop the runner, a raising modal would keep it marked as running forever
+        if error is not None:
+            self.errors.append(error)
+            return self.finish(context, cancelled=True)
+
+        if len(JOBS) == 0:
+            return self.finish(context)
+
+        self.update_progress(context)
+
+        return {'RUNNING_MODAL'}
+
+    def run_slice(self):
+        slice_start = time.time()
+        while len(JOBS) != 0 and time.time() - slice_start < TIME_SLICE:
+            job = JOBS[0]
+            count, error = job.run_next()
+            self.done += count
+            if error: self.errors.append(error)
+            if job.is_finished():
+                JOBS.popleft()
+            elif count == 0 and error is None:
+                break  # waiting for the workers, check again next timer
+
+    def update_progress(self, context):
+        progress = self.done / self.total if self.total else 1
+        context.window_manager.progress_update(int(progress * 100))
+
+        cost = time.time() - self.start_time
+        eta = cost / progress - cost if progress > 0 else 0
+        context.workspace.status_text_set(
+            f'Super Import {self.done}/{self.total} files, about {round(eta)} s left (Esc to cancel)')
+
+    def finish(self, context, cancelled=False):
+        """stop between two calls, the remaining jobs are dropped"""
+        SPIO_OT_import_job_runner.running = False
+        SPIO_OT_import_job_runner.timer = None
+
+        remain = sum(job.remaining() for job in JOBS)
+        cancel_jobs()
+
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+        self.invocation.resume()
+        self.invocation.stop()
+
+        cost = round(time.time() - self.start_time, 2)
+        if cancelled:
+            self.report({'WARNING'}, f'Super Import cancelled, {self.done} files imported, {remain} skipped')
+        else:
+            self.report({'INFO'}, f'Super Import {self.done} files in {cost} s')
+
+        # one summary instead of an error per file
+        if len(self.errors) != 0:
+            for error in self.errors:
+                print(f'SPIO import error: {error}')
+            self.report({'ERROR'}, f'{len(self.errors)} import call failed, see console. First: {self.errors[0]}')
+
+        # finish even when cancelled, the files imported so far need the undo push
+        return {'FINISHED'}
+
+
+def cancel_jobs():
+    for job in JOBS:
+        job.cancel()
+    JOBS.clear()
+
+
+@persistent
+def reset_runner(*args):
+    """a file load drop the modal handler of the runner without calling finish"""
+    cancel_jobs()
+    if not SPIO_OT_import_job_runner.running: return
+
+    SPIO_OT_import_job_runner.running = False
+
+    wm = bpy.context.window_manager
+    try:
+        if SPIO_OT_import_job_runner.timer is not None:
+            wm.event_timer_remove(SPIO_OT_import_job_runner.timer)
+    except (ReferenceError, RuntimeError, ValueError):
+        pass
+    SPIO_OT_import_job_runner.timer = None
+
+    wm.progress_end()
+    if bpy.context.workspace is not None:
+        bpy.context.workspace.status_text_set(None)
+
+
+def register():
+    bpy.utils.register_class(SPIO_OT_import_job_runner)
+    bpy.app.handlers.load_post.append(reset_runner)
+
+
+def unregister():
+    if reset_runner in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reset_runner)
+
+    cancel_jobs()
+    bpy.utils.unregister_class(SPIO_OT_import_job_runner)
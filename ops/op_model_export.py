@@ -1,10 +1,15 @@
 import bpy
 import os
 import sys
+import time
 
 from bpy.props import StringProperty, BoolProperty, EnumProperty
 
-from .core import get_pref, PostProcess
+from .core import get_pref, PostProcess, get_export_manifest, trace_invocation, get_op_by_idname
+from .tracer import span
+from .latency_stats import measure
+from .profiler import profile_operator
+from ..clipboard.temp_store import get_dir
 
 
 class ModeCopyDefault:
@@ -19,6 +24,7 @@ class ModeCopyDefault:
             )
 
 
+@profile_operator
 class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
     """Export Selected objects to file and copy to clipboard\nAlt to export every object to a single file"""
     bl_idname = 'spio.export_model'
@@ -32,9 +38,7 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
         temp_dir = ori_dir
         if ori_dir == '':
             # win temp file
-            temp_dir = os.path.join(os.path.expanduser('~'), 'spio_temp')
-            if not "spio_temp" in os.listdir(os.path.expanduser('~')):
-                os.makedirs(temp_dir)
+            temp_dir = get_dir()
 
         return temp_dir
 
@@ -46,13 +50,16 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
 
         for obj in selected_objects:
             filepath = os.path.join(target_dir, obj.name + f'.{self.extension}')
-            paths.append(filepath)
 
             context.view_layer.objects.active = obj
             obj.select_set(True)
 
             op_args.update({'filepath': filepath})
-            op_callable(**op_args)
+            start_time = time.time()
+            with span(op_callable.idname_py(), filepath=filepath), \
+                measure(op_callable.idname_py(), [filepath], path_type='EXPORT'):
+                op_callable(**op_args)
+            paths.extend(get_export_manifest(filepath, op_args, start_time))
             obj.select_set(False)
 
         context.view_layer.objects.active = src_active
@@ -62,10 +69,13 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
     def export_single(self, context, op_callable, op_args, target_dir):
         paths = []
         filepath = os.path.join(target_dir, context.active_object.name + f'.{self.extension}')
-        paths.append(filepath)
 
         op_args.update({'filepath': filepath})
-        op_callable(**op_args)
+        start_time = time.time()
+        with span(op_callable.idname_py(), filepath=filepath), \
+                measure(op_callable.idname_py(), [filepath], path_type='EXPORT'):
+            op_callable(**op_args)
+        paths.extend(get_export_manifest(filepath, op_args, start_time))
 
         return paths
 
@@ -74,7 +84,10 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
         return self.execute(context)
 
     def execute(self, context):
+        with trace_invocation(self.bl_label):
+            return self.export_default(context)
 
+    def export_default(self, context):
         from ..imexporter.default_exporter import get_exporter, get_exporter_ops_props
         # get exporter by preferences
         default_exporter = get_exporter(cpp_obj_exporter=get_pref().cpp_obj_exporter,
@@ -84,20 +97,16 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
         if self.extension not in default_exporter: return {"CANCELLED"}
 
         temp_dir = self.get_temp_dir()
-        # set dict for checking overwrite obj time
-        src_file = dict()
-        for file in os.listdir(temp_dir):
-            src_file[file] = os.path.getmtime(os.path.join(temp_dir, file))
 
         bl_idname = default_exporter.get(self.extension)
-        op_callable = getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
+        op_callable = get_op_by_idname(bl_idname)
 
         op_args = exporter_ops_props.get(self.extension)
 
         if self.batch_mode:
             paths = self.export_batch(context, op_callable, op_args, temp_dir)
             self.report({'INFO'},
-                        f'{len(paths)} {self.extension} files has been copied to Clipboard')
+                        f'{len(paths)} files ({self.extension} and sidecars) has been copied to Clipboard')
 
         else:
             paths = self.export_single(context, op_callable, op_args, temp_dir)
@@ -105,8 +114,11 @@ class SPIO_OT_export_model(ModeCopyDefault, bpy.types.Operator):
 
         # Pref
         POST = PostProcess()
-        POST.copy_to_clipboard(paths=PostProcess.get_update_files(src_file, temp_dir), op=self)
-        POST.open_dir(temp_dir)
+        with span('clipboard push', files=len(paths)):
+            POST.copy_to_clipboard(paths=paths, op=self)
+        with span('post process'):
+            POST.open_dir(paths, temp_dir)
+            POST.clean_temp(paths)
 
         return {'FINISHED'}
 
@@ -3,6 +3,9 @@ import bpy
 from bpy.props import StringProperty
 from ..imexporter.default_importer import get_importer
 from ..preferences.prefs import get_pref
+from .payload import get_payload_paths, EXPIRED_MESSAGE
+from .core import get_op_by_idname
+from .op_import_job import run_import
 
 
 class SPIO_OT_import_model(bpy.types.Operator):
@@ -13,6 +16,7 @@ class SPIO_OT_import_model(bpy.types.Operator):
     bl_options = {'UNDO_GROUPED'}
 
     files: StringProperty()  # list of filepath, join with$$
+    payload: StringProperty()  # paste payload id, used instead of files when set
 
     @classmethod
     def poll(_cls, context):
@@ -31,12 +35,21 @@ class SPIO_OT_import_model(bpy.types.Operator):
     def execute(self, context):
         importer = get_importer(cpp_obj_importer=get_pref().cpp_obj_importer)
 
-        for filepath in self.files.split('$$'):
+        # group by importer, each group is imported in as few calls as the importer allow
+        filepaths = get_payload_paths(self.payload, self.files)
+        if len(filepaths) == 0:
+            self.report({"ERROR"}, EXPIRED_MESSAGE)
+            return {"CANCELLED"}
+
+        op_files = dict()
+        for filepath in filepaths:
             ext = filepath.split('.')[-1]
             if ext in importer:
-                bl_idname = importer.get(ext)
-                op_callable = getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
-                op_callable(filepath=filepath)
+                op_files.setdefault(importer.get(ext), []).append(filepath)
+
+        for bl_idname, files in op_files.items():
+            for error in run_import(self.bl_label, get_op_by_idname(bl_idname), dict(), files):
+                self.report({"ERROR"}, error)
 
         return {'FINISHED'}
 
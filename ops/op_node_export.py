@@ -1,6 +1,7 @@
 import bpy
 import os
 from .op_image_io import get_active_tree, get_nodes_links
+from .profiler import profile_operator
 
 
 def enum_active_node_sockets(self, context):
@@ -24,6 +25,7 @@ def enum_uv(self, context):
     return enum_uv
 
 
+@profile_operator
 class SPIO_OT_export_shader_node_as_texture(bpy.types.Operator):
     """Select a node and export it as a texture\nSelect active object first"""
     bl_idname = "spio.export_shader_node_as_texture"
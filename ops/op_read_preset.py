@@ -2,6 +2,7 @@ import bpy
 import os
 from os.path import join
 from ..preferences.prefs import get_pref
+from ..preferences.utils import tag_config_update
 
 import re
 
@@ -50,6 +51,31 @@ def get_preset_chars(path):
     return args
 
 
+class SPIO_OT_set_preset(bpy.types.Operator):
+    """Set config properties from this preset"""
+    bl_idname = "wm.spio_set_preset"
+    bl_label = "Set Preset"
+    bl_options = {'INTERNAL'}
+
+    path: bpy.props.StringProperty(name="Preset Path")
+
+    def execute(self, context):
+        config_item = get_pref().config_list[get_pref().config_list_index]
+        args = get_preset_chars(self.path)
+        prop_list = config_item.prop_list
+
+        for key, value in args.items():
+            if key in prop_list:
+                prop_list[key].value = value
+            else:
+                prop_item = prop_list.add()
+                prop_item.name = key
+                prop_item.value = value
+
+        tag_config_update()
+        return {'FINISHED'}
+
+
 class SPIO_OT_read_preset(bpy.types.Operator):
     bl_idname = "spio.read_preset"
     bl_label = "Add from Preset"
@@ -57,60 +83,18 @@ class SPIO_OT_read_preset(bpy.types.Operator):
 
     bl_idname_input: bpy.props.StringProperty(name="ID Name")
 
-    dep_classes = []
-
     def invoke(self, context, event):
-        # clear
-        for cls in self.dep_classes:
-            bpy.utils.unregister_class(cls)
-
-        self.dep_classes.clear()
-
         preset_paths = get_presets(self.bl_idname_input)
         if len(preset_paths) == 0:
             self.report({'ERROR'}, "No preset found")
             return {'CANCELLED'}
 
-        for i, path in enumerate(preset_paths):
-            name = os.path.basename(path)
-
-            def execute(self, context):
-                config_item = get_pref().config_list[get_pref().config_list_index]
-                args = get_preset_chars(self.path)
-                prop_list = config_item.prop_list
-
-                for key, value in args.items():
-                    if key in prop_list:
-                        prop_list[key].value = value
-                    else:
-                        prop_item = prop_list.add()
-                        prop_item.name = key
-                        prop_item.value = value
-
-                return {'FINISHED'}
-
-            op_cls = type("DynOp",
-                          (bpy.types.Operator,),
-                          {"bl_idname": f'wm.spio_set_preset_{i}',
-                           "bl_label": name[:-3],  # remove .py
-                           "execute": execute,
-                           # custom pass in
-                           'path': path,
-                           },
-                          )
-
-            self.dep_classes.append(op_cls)
-
-        for cls in self.dep_classes:
-            bpy.utils.register_class(cls)
-
-        op = self
-
         def draw_preset_menu(self, context):
             layout = self.layout
             layout.label(text="Preset")
-            for cls in op.dep_classes:
-                layout.operator(cls.bl_idname)
+            for path in preset_paths:
+                name = os.path.basename(path)
+                layout.operator('wm.spio_set_preset', text=name[:-3]).path = path  # remove .py
 
         context.window_manager.popup_menu(draw_preset_menu)
 
@@ -118,8 +102,10 @@ class SPIO_OT_read_preset(bpy.types.Operator):
 
 
 def register():
+    bpy.utils.register_class(SPIO_OT_set_preset)
     bpy.utils.register_class(SPIO_OT_read_preset)
 
 
 def unregister():
+    bpy.utils.unregister_class(SPIO_OT_set_preset)
     bpy.utils.unregister_class(SPIO_OT_read_preset)
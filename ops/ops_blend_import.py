@@ -3,6 +3,8 @@ import subprocess
 import os
 
 from bpy.props import StringProperty, BoolProperty, EnumProperty
+from .payload import get_payload_paths, EXPIRED_MESSAGE
+from .latency_stats import measure
 
 
 class blenderFileDefault:
@@ -104,6 +106,7 @@ class SPIO_OT_batch_import_blend(bpy.types.Operator):
     ])
     # filepath join with $$
     files: StringProperty()
+    payload: StringProperty()  # paste payload id, used instead of files when set
 
     # property to pass in to single blend file importer
     sub_path: StringProperty()
@@ -111,11 +114,18 @@ class SPIO_OT_batch_import_blend(bpy.types.Operator):
     data_type: StringProperty()
 
     def execute(self, context):
-        for filepath in self.files.split('$$'):
+        filepaths = get_payload_paths(self.payload, self.files)
+        if len(filepaths) == 0:
+            self.report({"ERROR"}, EXPIRED_MESSAGE)
+            return {"CANCELLED"}
+
+        for filepath in filepaths:
             if self.action == 'LINK':
-                bpy.ops.spio.link_blend(filepath=filepath, data_type=self.data_type, load_all=self.load_all)
+                with measure('spio.link_blend', [filepath], path_type='BLEND'):
+                    bpy.ops.spio.link_blend(filepath=filepath, data_type=self.data_type, load_all=self.load_all)
             elif self.action == 'APPEND':
-                bpy.ops.spio.append_blend(filepath=filepath, data_type=self.data_type, load_all=self.load_all)
+                with measure('spio.append_blend', [filepath], path_type='BLEND'):
+                    bpy.ops.spio.append_blend(filepath=filepath, data_type=self.data_type, load_all=self.load_all)
             elif self.action == 'OPEN':
                 bpy.ops.spio.open_blend_extra(filepath=filepath)
 
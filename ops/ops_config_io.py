@@ -4,6 +4,7 @@ import os
 
 from bpy.props import StringProperty, BoolProperty
 from .core import get_pref
+from ..preferences.utils import tag_config_update
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 
@@ -46,6 +47,8 @@ class SPIO_OT_import_config(bpy.types.Operator, ImportHelper):
 
             self.report({"INFO"}, f'Load config from "{self.filepath}"')
 
+        tag_config_update()
+
         return {"FINISHED"}
 
 
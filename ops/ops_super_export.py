@@ -1,73 +1,45 @@
 import bpy
 
 from .dynamic_io import IO_Base
-from .core import MeasureTime, ConfigItemHelper, ConfigHelper
+from .core import ConfigHelper, trace_invocation
 from .core import is_float, get_pref, convert_value
+from .profiler import profile_operator
 
 from ..preferences.data_icon import G_ICON_ID
 
 
+@profile_operator
 class WM_OT_super_export(IO_Base, bpy.types.Operator):
     """Export to Clipboard"""
     bl_idname = 'wm.super_export'
     bl_label = 'Super Export'
 
     def invoke(self, context, event):
-        self.restore()
-        # filter user's configs
-        self.CONFIGS = ConfigHelper(check_use=True, io_type='EXPORT')
+        with trace_invocation(self.bl_label):
+            self.restore()
+            # filter user's configs
+            self.CONFIGS = ConfigHelper(check_use=True, io_type='EXPORT')
 
-        self.use_custom_config = not self.CONFIGS.is_empty()
+            self.use_custom_config = not self.CONFIGS.is_empty()
 
-        return self.export_custom_dynamic(context)
+            return self.export_custom_dynamic(context)
 
     def export_custom_dynamic(self, context):
-        # unregister_class
-        self.unregister_dep_classes()
-        self.dep_classes.clear()
-
-        # dynamic operator
+        # config operators
         ##################
-        from .dynamic_io import DynamicExport
+        popup_configs = list()
 
         if self.use_custom_config:
-
             for index in self.CONFIGS.index_list:
-                # pass in
-                config_item = get_pref().config_list[index]
-                ITEM = ConfigItemHelper(config_item)
+                ITEM = self.CONFIGS.get_item(index)
                 if not ITEM.is_config_item_poll(context.area.type): continue
 
-                op_cls = type("DynOp",
-                              (bpy.types.Operator,),
-                              {"bl_idname": f'wm.spio_config_{index}',
-                               "bl_label": ITEM.name,
-                               "bl_description": ITEM.description,
-                               "execute": DynamicExport.execute,
-                               "invoke": DynamicExport.invoke,
-                               "poll": DynamicExport.poll,
-                               # custom pass in
-                               'ITEM': ITEM,
-                               'batch_mode': False,
-                               'extension': ITEM.extension,
-                               # custom function
-                               'export_single': DynamicExport.export_single,
-                               'export_batch': DynamicExport.export_batch,
-                               'get_temp_dir': DynamicExport.get_temp_dir,
-                               },
-                              )
-
-                self.dep_classes.append(op_cls)
-
-            # register
-            self.register_dep_classes()
+                popup_configs.append((index, ITEM.name))
 
         ############################
         # pop up menu
         ############################
 
-        export_op = self
-
         def draw_custom_menu(self, context):
             layout = self.layout
             layout.operator_context = "INVOKE_DEFAULT"
@@ -78,9 +50,9 @@ class WM_OT_super_export(IO_Base, bpy.types.Operator):
             menu = None
 
             if context.area.type == 'VIEW_3D':
-                if len(export_op.dep_classes) > 0:
-                    for cls in export_op.dep_classes:
-                        layout.operator(cls.bl_idname)
+                for index, name in popup_configs:
+                    op = layout.operator('wm.spio_config_export', text=name)
+                    op.config_index = index
 
                 layout.separator()
                 menu = pop.default_blend_menu(return_menu=True)
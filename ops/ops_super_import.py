@@ -7,10 +7,15 @@ import bpy
 from bpy.props import (StringProperty)
 
 from .dynamic_io import IO_Base
-from .core import MeasureTime, ConfigItemHelper, ConfigHelper
+from .core import get_op_by_idname, trace_invocation
+from .tracer import span
+from .op_import_job import run_import
+from .latency_stats import get_path_type
+from .profiler import profile_operator
 from .core import get_pref
 
 from ..preferences.data_icon import G_ICON_ID
+from ..clipboard.temp_store import evict_async
 
 
 class SuperImport(IO_Base, bpy.types.Operator):
@@ -21,54 +26,46 @@ class SuperImport(IO_Base, bpy.types.Operator):
     # Build-in
     ############
     def invoke(self, context, event):
+        with trace_invocation(self.bl_label):
+            return self.import_from_clipboard(context)
+
+    def import_from_clipboard(self, context):
         self.restore()
 
-        from ..clipboard.clipboard import Clipboard as Clipboard
-        # get Clipboard
-        self.clipboard = Clipboard()
-        file_list = self.clipboard.pull_files_from_clipboard(force_unicode=get_pref().force_unicode)
+        from ..clipboard.watcher import ClipboardPayload, get_payload
+        # use the payload prepared by the clipboard watcher if it is still valid
+        payload = get_payload() if get_pref().use_clipboard_watcher else None
+
+        if payload is None:
+            from ..clipboard.clipboard import Clipboard as Clipboard
+            with span('clipboard pull'):
+                # get Clipboard
+                self.clipboard = Clipboard()
+                file_list = self.clipboard.pull_files_from_clipboard(force_unicode=get_pref().force_unicode)
 
-        del self.clipboard  # release clipboard
+                del self.clipboard  # release clipboard
 
-        if len(file_list) == 0:
+                payload = ClipboardPayload(file_list)
+
+        if payload.is_empty():
             self.report({"ERROR"}, "No file found in clipboard!")
             return {"CANCELLED"}
 
-        for file_path in file_list:
-            if os.path.isdir(file_path):
-                self.dir_list.append(file_path)  # add dir list for batch import folder's files
-                continue
-            elif not os.path.exists(file_path):
-                self.report({"ERROR"}, f"{file_path} not exist!")
-
-            # pass extra file
-            extension = file_path.split('.')[-1].lower()
-            if extension in {'mtl'}:
-                continue
-
-            self.file_list.append(file_path)
-        # count ext type
-        ext_list = [file.split('.')[-1].lower() for file in self.file_list]
+        for file_path in payload.missing_list:
+            self.report({"ERROR"}, f"{file_path} not exist!")
+
+        self.file_list.extend(payload.file_list)
+        self.dir_list.extend(payload.dir_list)
         # report if more than one extension is selected
-        if len(set(ext_list)) > 1:
+        if len(payload.ext_groups) > 1:
             self.report({"WARNING"}, "More than one format of file is copied!")
-            # return {"CANCELLED"}
-        ext_count_dict = dict()
-
-        for ext in ext_list:
-            if ext not in ext_count_dict:
-                ext_count_dict[ext] = 1
-            else:
-                ext_count_dict[ext] += 1
 
         # set the main ext
-        for key, value in ext_count_dict.items():
-            if (value == max(ext_count_dict.values())):
-                self.ext = key
-                break
+        self.ext = payload.ext
 
         # call for match configs
-        self.CONFIGS = ConfigHelper(check_use=True, filter=self.ext, io_type='IMPORT')
+        with span('config resolve', ext=self.ext):
+            self.CONFIGS = payload.resolve_configs()
 
         # import default if not custom config for this file extension
         if self.CONFIGS.is_empty():
@@ -85,18 +82,14 @@ class SuperImport(IO_Base, bpy.types.Operator):
         return self.import_custom_dynamic(context)
 
     def execute(self, context):
-        with MeasureTime() as start_time:
+        with trace_invocation(f'{self.bl_label} Default') as invocation:
             self.import_default(context)
-            self.report_time(start_time)
+        self.report_time(invocation.duration)
 
         return {"FINISHED"}
 
     # Import Method (Popup)
     def import_custom_dynamic(self, context):
-        # unregister_class
-        self.unregister_dep_classes()
-        self.dep_classes.clear()
-
         # no match list
         file_list = self.file_list
         dir_list = self.dir_list
@@ -105,51 +98,30 @@ class SuperImport(IO_Base, bpy.types.Operator):
         # match index :exclude from popup importer
         match_index_list = list()
 
-        for index in self.CONFIGS.index_list:
-            # set config for register
-            config_item = get_pref().config_list[index]
-            ITEM = ConfigItemHelper(config_item)
-            if not ITEM.is_config_item_poll(context.area.type): continue
+        area_type = context.area.type if context.area is not None else None
+        poll_index_list = [index for index in self.CONFIGS.index_list
+                           if self.CONFIGS.get_item(index).is_config_item_poll(area_type)]
+        # every rule is checked in one pass over each file name
+        matcher = self.CONFIGS.get_matcher(poll_index_list)
 
-            match_files = ITEM.get_match_files(file_list)
+        with span('match', files=len(file_list), configs=len(poll_index_list)):
+            match_dict = matcher.classify(file_list)
 
-            if len(match_files) > 0:
-                for file in match_files:
-                    match_file_op_dict[file] = ITEM
+        for file, index in match_dict.items():
+            match_file_op_dict[file] = self.CONFIGS.get_item(index)
+            if index not in match_index_list:
                 match_index_list.append(index)
 
-        # dynamic operator
+        # config operators
         ##################
-        from .dynamic_io import DynamicImport
         from ..imexporter.default_importer import get_importer
+        from .payload import popup_payload
 
         importer = get_importer(cpp_obj_importer=get_pref().cpp_obj_importer)
 
-        for index in self.CONFIGS.index_list:
-            if index in match_index_list: continue  # not register those match config
-            # only for register
-            config_item = get_pref().config_list[index]
-            ITEM = ConfigItemHelper(config_item)
-            if not ITEM.is_config_item_poll(context.area.type): continue
-
-            op_cls = type("DynOp",
-                          (bpy.types.Operator,),
-                          {"bl_idname": f'wm.spio_config_{index}',
-                           "bl_label": ITEM.name,
-                           "bl_description": ITEM.description,
-                           "execute": DynamicImport.execute,
-                           # custom pass in
-                           'ITEM': ITEM,
-                           'file_list': file_list,
-                           'dir_list': dir_list,
-                           'match_file_op_dict': match_file_op_dict,
-                           },
-                          )
-
-            self.dep_classes.append(op_cls)
-
-        # register
-        self.register_dep_classes()
+        # not show those match config
+        popup_configs = [(index, self.CONFIGS.get_item(index).name) for index in poll_index_list
+                         if index not in match_index_list]
 
         ############################
         # execute
@@ -157,20 +129,20 @@ class SuperImport(IO_Base, bpy.types.Operator):
 
         # first import all matching rule files
         if len(match_file_op_dict) > 0:
-            with MeasureTime() as start_time:
+            with trace_invocation('Match Import') as invocation:
+                # one import call for all the files of a config if the importer take a file list
+                item_files = dict()
                 for filepath, item_helper in match_file_op_dict.items():
-                    op_callable, ops_args, op_context = item_helper.get_operator_and_args()
-                    ops_args['filepath'] = filepath
-                    try:
-                        if op_context:
-                            op_callable(op_context, **ops_args)
-                        else:
-                            op_callable(**ops_args)
+                    item_files.setdefault(item_helper, []).append(filepath)
 
-                    except Exception as e:
-                        self.report({"ERROR"}, str(e))
+                for item_helper, files in item_files.items():
+                    op_callable, ops_args, op_context = item_helper.get_operator_and_args()
+                    if not op_callable: continue
+                    for error in run_import(item_helper.name, op_callable, ops_args, files, op_context,
+                                            get_path_type(item_helper.operator_type)):
+                        self.report({"ERROR"}, error)
 
-                if get_pref().report_time: self.report_time(start_time)
+            self.report_time(invocation.duration)
 
         # then popup menu to select the remain not matching file
         remain_list = list()
@@ -191,33 +163,34 @@ class SuperImport(IO_Base, bpy.types.Operator):
         if len(remain_list) > 0:
             # set draw menu
             from .core import PopupImportMenu
-            import_op = self
             ext = self.ext
 
+            # operators of the popup read the paste with this id
+            payload_id = popup_payload(files=remain_list, dirs=list(dir_list),
+                                       paste_files=list(file_list), match_files=set(match_file_op_dict))
+            pop = PopupImportMenu(file_list=remain_list,
+                                  dir_list=dir_list,
+                                  context=context,
+                                  payload_id=payload_id)
+
             def draw_custom_menu(self, context):
                 layout = self.layout
                 if len(match_file_op_dict) > 0:
                     layout.label(text=f'Remain {len(remain_list)} files')
 
-                if len(import_op.dep_classes) > 0:
-                    for cls in import_op.dep_classes:
-                        layout.operator(cls.bl_idname)
+                for index, name in popup_configs:
+                    op = layout.operator('wm.spio_config_import', text=name)
+                    op.config_index = index
+                    op.payload = payload_id
 
                 layout.separator()
                 # default popup
                 if ext in importer:
-                    layout.operator('spio.import_model').files = '$$'.join(
-                        remain_list)
+                    layout.operator('spio.import_model').payload = payload_id
                 elif ext == 'blend':
-                    pop = PopupImportMenu(file_list=remain_list,
-                                          dir_list=dir_list,
-                                          context=context)
                     menu = pop.default_blend_menu(return_menu=True)
                     if menu: menu(self, context)
                 else:
-                    pop = PopupImportMenu(file_list=remain_list,
-                                          dir_list=dir_list,
-                                          context=context)
                     menu = pop.default_image_menu(return_menu=True)
                     if menu: menu(self, context)
 
@@ -226,6 +199,7 @@ class SuperImport(IO_Base, bpy.types.Operator):
         return {'FINISHED'}
 
 
+@profile_operator
 class WM_OT_super_import(SuperImport):
     """Load files/models/images from clipboard"""
     bl_idname = "wm.super_import"
@@ -246,10 +220,11 @@ class WM_OT_super_import(SuperImport):
 
         ext = self.ext
         if ext in importer:
-            for file_path in self.file_list:
-                bl_idname = importer.get(ext)
-                op_callable = getattr(getattr(bpy.ops, bl_idname.split('.')[0]), bl_idname.split('.')[1])
-                op_callable(filepath=file_path)
+            op_callable = get_op_by_idname(importer.get(ext))
+            for error in run_import(ext.upper(), op_callable, dict(), self.file_list):
+                self.report({"ERROR"}, error)
+        elif context.area is None:
+            self.report({"ERROR"}, f'No area to show the {ext.upper()} import menu in')
         else:
             from .core import PopupImportMenu
 
@@ -269,8 +244,18 @@ def node_context_menu(self, context):
     layout.separator()
 
 
+def start_clipboard_watcher():
+    from ..clipboard.watcher import start_watcher
+
+    if get_pref().use_clipboard_watcher:
+        start_watcher()
+
+
 def register():
     bpy.utils.register_class(WM_OT_super_import)
+    # preferences are not ready while registering
+    bpy.app.timers.register(start_clipboard_watcher, first_interval=1)
+    bpy.app.timers.register(evict_async, first_interval=5)
 
     # Global ext
     bpy.types.Scene.spio_ext = StringProperty(name='Filter extension', default='')
@@ -280,6 +265,13 @@ def register():
 
 
 def unregister():
+    from ..clipboard.watcher import stop_watcher
+    stop_watcher()
+
+    for timer in (start_clipboard_watcher, evict_async):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+
     bpy.types.NODE_MT_context_menu.remove(node_context_menu)
 
     bpy.utils.unregister_class(WM_OT_super_import)
@@ -0,0 +1,91 @@
+'''Paste data shared by the operators of a popup
+
+Operators only get the payload id as property instead of every path joined in a string,
+so drawing the popup do not copy the whole file list into RNA.
+'''
+import uuid
+
+PAYLOADS = dict()  # payload id: Payload
+POPUP_PAYLOADS = list()  # payload ids held by the popup that is showing
+
+
+class Payload():
+    def __init__(self, data):
+        self.data = data
+        self.ref_count = 0
+
+
+def new_payload(**data):
+    """store data for operators that run later, the caller hold the first reference"""
+    payload_id = uuid.uuid4().hex[:12]
+    payload = Payload(data)
+    payload.ref_count = 1
+    PAYLOADS[payload_id] = payload
+
+    return payload_id
+
+
+def get_payload(payload_id):
+    payload = PAYLOADS.get(payload_id)
+    if payload is not None:
+        return payload.data
+
+
+def acquire_payload(payload_id):
+    """keep the payload alive until release, for work that outlive the popup"""
+    payload = PAYLOADS.get(payload_id)
+    if payload is None: return None
+
+    payload.ref_count += 1
+    return payload.data
+
+
+def release_payload(payload_id):
+    payload = PAYLOADS.get(payload_id)
+    if payload is None: return
+
+    payload.ref_count -= 1
+    if payload.ref_count <= 0:
+        del PAYLOADS[payload_id]
+
+
+def popup_payload(**data):
+    """payload held by a popup menu, released once the popup is gone"""
+    # only one popup show at a time, a new one mean the last one is closed
+    release_popup()
+
+    payload_id = new_payload(**data)
+    POPUP_PAYLOADS.append(payload_id)
+
+    return payload_id
+
+
+def release_popup():
+    """blender do not tell when a popup menu close, this is called when one of its items run or a new popup open"""
+    for payload_id in POPUP_PAYLOADS:
+        release_payload(payload_id)
+    POPUP_PAYLOADS.clear()
+
+
+EXPIRED_MESSAGE = 'Clipboard data is no longer available, please paste again'
+
+
+def get_payload_paths(payload_id, join_paths='', key='files'):
+    """paths passed to an operator, by payload id from the popup or joined with $$ from scripts
+
+    an expired payload give an empty list, callers report EXPIRED_MESSAGE
+    """
+    data = get_payload(payload_id) if payload_id else None
+    if data is not None:
+        paths = list(data.get(key, ()))
+    else:
+        paths = join_paths.split('$$') if join_paths != '' else list()
+
+    release_popup()
+
+    return paths
+
+
+def clear_payloads():
+    PAYLOADS.clear()
+    POPUP_PAYLOADS.clear()
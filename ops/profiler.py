@@ -0,0 +1,240 @@
+'''cProfile + tracemalloc capture of the next SPIO operator run, armed from the ui
+
+    @profile_operator
+    class SPIO_OT_xxx(bpy.types.Operator): ...
+
+Operators called inside a profiled run join its profile, a modal operator keeps it until it finishes.
+A file load or unregister write the profiles of modal operators that never finished and stop tracemalloc.
+Reports are written to ~/spio_profile, next to spio_temp:
+    <name>_<time>.pstats  (snakeviz / python -m pstats)
+    <name>_<time>.txt     top functions and top allocations
+'''
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from types import FunctionType
+
+import bpy
+from bpy.app.handlers import persistent
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+def get_profile_dir():
+    return os.path.join(os.path.expanduser('~'), 'spio_profile')
+
+
+class Profile():
+    def __init__(self, name):
+        self.name = name
+        self.profiler = cProfile.Profile()
+        self.holders = 0  # operator runs (or modal operators) that use this profile
+        self.depth = 0  # runs currently on the stack
+        self.start_time = time.perf_counter()
+        self.closed = False  # report written
+        self.interrupted = False  # closed before its modal operators finished
+
+        self.own_tracemalloc = not tracemalloc.is_tracing()
+        if self.own_tracemalloc:
+            tracemalloc.start(10)
+        # a fresh start has no peak yet, older pythons can not reset the peak of another tracer
+        self.exact_peak = self.own_tracemalloc or hasattr(tracemalloc, 'reset_peak')
+        if hasattr(tracemalloc, 'reset_peak'):  # python 3.9+
+            tracemalloc.reset_peak()
+
+    def enter(self):
+        if self.depth == 0:
+            try:
+                self.profiler.enable()
+            except ValueError:  # another profiler is active (python 3.12+)
+                pass
+            PROFILER.active = self
+        self.depth += 1
+
+    def exit(self, keep):
+        self.depth -= 1
+        if self.depth == 0:
+            self.profiler.disable()
+            PROFILER.active = None
+
+        if not keep:
+            self.holders -= 1
+            if self.holders == 0:
+                self.write()
+
+    def write(self):
+        if self.closed: return
+        self.closed = True
+        if self in PROFILER.open:
+            PROFILER.open.remove(self)
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self.own_tracemalloc:
+            tracemalloc.stop()
+
+        profile_dir = get_profile_dir()
+        if not os.path.isdir(profile_dir):
+            os.makedirs(profile_dir)
+
+        name = ''.join(c if c.isalnum() else '_' for c in self.name)
+        base = os.path.join(profile_dir, f'{name}_{time.strftime("%Y%m%d_%H%M%S")}')
+        self.profiler.dump_stats(base + '.pstats')
+
+        stream = io.StringIO()
+        peak_label = 'peak traced memory' if self.exact_peak else 'peak traced memory (since tracing started)'
+        if self.interrupted:
+            stream.write('Interrupted by a file load or unregister, the modal operator did not finish\n')
+        stream.write(f'{self.name}: {time.perf_counter() - self.start_time:.3f}s, '
+                     f'{peak_label} {peak / 1024 / 1024:.2f} MB\n\n')
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+
+        stream.write(f'\nTop {TOP_ALLOCATIONS} allocations (still alive at the end of the run)\n\n')
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            stream.write(f'{stat}\n')
+
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(stream.getvalue())
+
+        PROFILER.last_report = base + '.txt'
+        print(f'SPIO profile: {base}.pstats')
+
+
+class Profiler():
+    def __init__(self):
+        self.armed = False
+        self.active = None  # Profile of the run on the stack
+        self.open = []  # profiles not written yet, modal operators may hold them
+        self.last_report = None
+
+    def take(self, name):
+        """profile to use for a new operator run, None if not profiling"""
+        if self.active is not None:
+            return self.active
+        if not self.armed:
+            return None
+
+        from .core import get_pref
+        self.armed = False
+        if not get_pref().use_profiler: return None
+
+        profile = Profile(name)
+        self.open.append(profile)
+
+        return profile
+
+    def close_all(self):
+        """write the profiles that will never finish, so tracemalloc does not slow the rest of the session"""
+        for profile in list(self.open):
+            profile.interrupted = True
+            profile.profiler.disable()
+            profile.write()
+        self.active = None
+
+
+PROFILER = Profiler()
+
+
+@persistent
+def close_profiles(*args):
+    PROFILER.close_all()
+
+
+def run_profiled(self, method, *args, modal=False):
+    profile = getattr(self, '_spio_profile', None)
+    if profile is not None and profile.closed:
+        profile = None  # written on file load, the rest of the run is not profiled
+    if profile is None:
+        if not PROFILER.armed and PROFILER.active is None:
+            return method(self, *args)
+
+        profile = PROFILER.take(self.bl_label)
+        if profile is None:
+            return method(self, *args)
+        profile.holders += 1
+
+    keep = False
+    profile.enter()
+    try:
+        result = method(self, *args)
+        keep = 'RUNNING_MODAL' in result or (modal and 'PASS_THROUGH' in result)
+        return result
+    finally:
+        self._spio_profile = profile if keep else None
+        profile.exit(keep)
+
+
+def wrap_execute(execute):
+    def execute_wrapper(self, context):
+        return run_profiled(self, execute, context)
+
+    return execute_wrapper
+
+
+def wrap_event_method(method, modal):
+    def event_wrapper(self, context, event):
+        return run_profiled(self, method, context, event, modal=modal)
+
+    return event_wrapper
+
+
+def profile_operator(cls):
+    """class decorator, profile invoke/execute/modal of the operator when armed
+
+    blender check the arg count of operator functions, so the wrappers keep the exact signature
+    """
+    if isinstance(getattr(cls, 'execute', None), FunctionType):
+        cls.execute = wrap_execute(cls.execute)
+    if isinstance(getattr(cls, 'invoke', None), FunctionType):
+        cls.invoke = wrap_event_method(cls.invoke, modal=False)
+    if isinstance(getattr(cls, 'modal', None), FunctionType):
+        cls.modal = wrap_event_method(cls.modal, modal=True)
+
+    return cls
+
+
+class SPIO_OT_profile_next(bpy.types.Operator):
+    """Profile the next Super IO operator with cProfile and tracemalloc"""
+    bl_idname = 'spio.profile_next'
+    bl_label = 'Profile Next'
+
+    def execute(self, context):
+        PROFILER.armed = not PROFILER.armed
+        if PROFILER.armed:
+            self.report({'INFO'}, 'The next Super IO operator will be profiled')
+
+        return {'FINISHED'}
+
+
+class SPIO_OT_open_profile_report(bpy.types.Operator):
+    """Open the report of the last profiled operator"""
+    bl_idname = 'spio.open_profile_report'
+    bl_label = 'Open Profile Report'
+
+    @classmethod
+    def poll(cls, context):
+        return PROFILER.last_report is not None
+
+    def execute(self, context):
+        bpy.ops.wm.path_open(filepath=PROFILER.last_report)
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(SPIO_OT_profile_next)
+    bpy.utils.register_class(SPIO_OT_open_profile_report)
+    bpy.app.handlers.load_pre.append(close_profiles)
+
+
+def unregister():
+    if close_profiles in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(close_profiles)
+    PROFILER.close_all()
+
+    bpy.utils.unregister_class(SPIO_OT_profile_next)
+    bpy.utils.unregister_class(SPIO_OT_open_profile_report)
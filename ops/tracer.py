@@ -0,0 +1,139 @@
+'''Named, nested timing spans, dumped as chrome trace event json (open in chrome://tracing or ui.perfetto.dev)
+
+    with Invocation('Super Import', enabled=True, trace_dir=...) as inv:
+        with span('clipboard pull'):
+            ...
+    inv.duration
+
+Spans outside an enabled invocation cost a single check.
+'''
+import json
+import os
+import threading
+import time
+
+
+class NullSpan():
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span():
+    def __init__(self, trace, name, args):
+        self.trace = trace
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        end = time.perf_counter()
+        if type is not None:
+            self.args['error'] = str(value)
+        self.trace.add_event(self.name, self.start, end, self.args)
+
+
+class Invocation():
+    '''Root span of one operator run, always measure its own duration, record nested spans if enabled'''
+
+    def __init__(self, name, enabled=False, trace_dir=None):
+        self.name = name
+        self.enabled = enabled
+        self.trace_dir = trace_dir
+
+        self.events = list()
+        self.start_time = 0
+        self.end_time = None
+        self.trace_path = None  # written json
+        self.parent = None
+
+    @property
+    def duration(self):
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+
+    def add_event(self, name, start, end, args):
+        self.events.append({
+            'name': name,
+            'cat': 'spio',
+            'ph': 'X',
+            'ts': round((start - self.start_time) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        if self.enabled:
+            self.parent = TRACER.active
+            TRACER.active = self
+
+        return self
+
+    def suspend(self):
+        """stop recording while blender run other things, for invocations that span several event loop ticks"""
+        if self.enabled and TRACER.active is self:
+            TRACER.active = self.parent
+
+    def resume(self):
+        if self.enabled and TRACER.active is not self:
+            self.parent = TRACER.active
+            TRACER.active = self
+
+    def stop(self):
+        self.end_time = time.perf_counter()
+        if not self.enabled: return
+
+        self.add_event(self.name, self.start_time, self.end_time, {})
+        if TRACER.active is self:
+            TRACER.active = self.parent
+
+        if self.parent is not None:
+            # nested invocation (operator called by another one), keep in the outer trace
+            for event in self.events:
+                event['ts'] += round((self.start_time - self.parent.start_time) * 1e6, 3)
+            self.parent.events.extend(self.events)
+        elif self.trace_dir:
+            self.dump()
+
+    def dump(self):
+        if not os.path.isdir(self.trace_dir):
+            os.makedirs(self.trace_dir)
+
+        name = ''.join(c if c.isalnum() else '_' for c in self.name)
+        self.trace_path = os.path.join(self.trace_dir, f'{name}_{time.strftime("%Y%m%d_%H%M%S")}_{os.getpid()}.json')
+        with open(self.trace_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+
+class Tracer():
+    def __init__(self):
+        self.active = None  # Invocation that record spans
+
+    def span(self, name, **args):
+        if self.active is None: return NULL_SPAN
+        return Span(self.active, name, args)
+
+
+TRACER = Tracer()
+
+
+def span(name, **args):
+    return TRACER.span(name, **args)
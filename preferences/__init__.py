@@ -12,8 +12,14 @@ def register():
     data_keymap.register()
     prefs.register()
 
+    from .utils import register_config_handlers
+    register_config_handlers()
+
 
 def unregister():
+    from .utils import unregister_config_handlers
+    unregister_config_handlers()
+
     prefs.unregister()
     data_config_prop.unregister()
     data_config_filter_panel.unregister()
@@ -9,12 +9,12 @@ from bpy.props import (EnumProperty,
                        FloatProperty,
                        PointerProperty)
 from bpy.types import PropertyGroup
-from .utils import get_pref
+from .utils import get_pref, tag_config_update
 
 
 class OperatorProperty(PropertyGroup):
-    name: StringProperty(name='Property')
-    value: StringProperty(name='Value')
+    name: StringProperty(name='Property', update=tag_config_update)
+    value: StringProperty(name='Value', update=tag_config_update)
 
     # value_type: EnumProperty(items=[
     #     ('STRING', 'String', 'String'),
@@ -29,6 +29,7 @@ class OperatorProperty(PropertyGroup):
 
 
 def correct_blidname(self, context):
+    tag_config_update()
     if self.bl_idname.startswith('bpy.ops.'):
         self.bl_idname = self.bl_idname[8:]
     if self.bl_idname.endswith('()'):
@@ -36,6 +37,7 @@ def correct_blidname(self, context):
 
 
 def correct_name(self, context):
+    tag_config_update()
     pref = get_pref()
     names = [item.name for item in pref.config_list if item.name == self.name and item.name != '']
     if len(names) != 1:
@@ -128,20 +130,20 @@ def get_operator_type():
 
 class ConfigItemProperty(PropertyGroup):
     # USE
-    use_config: BoolProperty(name='Use', default=True)
+    use_config: BoolProperty(name='Use', default=True, update=tag_config_update)
     # UI
     color_tag: EnumProperty(name='Color Tag',
-                            items=enum_color_tag_items)
+                            items=enum_color_tag_items, update=tag_config_update)
     # IO type
     io_type: EnumProperty(name='IO Type',
                           items=[('IMPORT', 'Import', '', 'IMPORT', 0), ('EXPORT', 'Export', '', 'EXPORT', 1)],
-                          default='IMPORT')
+                          default='IMPORT', update=tag_config_update)
     # information
     name: StringProperty(name='Preset Name', update=correct_name)
     description: StringProperty(name='Description',
-                                description='Show in the popup operator tips')
+                                description='Show in the popup operator tips', update=tag_config_update)
     # extension
-    extension: StringProperty(name='Extension')
+    extension: StringProperty(name='Extension', update=tag_config_update)
 
     # custom import match rule
     ###############################
@@ -151,13 +153,14 @@ class ConfigItemProperty(PropertyGroup):
                                     ('ENDSWITH', 'Endswith', ''),
                                     ('IN', 'Contain', ''),
                                     ('REGEX', 'Regex (Match or not)', ''), ],
-                             default='NONE', description='Matching rule of the name')
+                             default='NONE', description='Matching rule of the name', update=tag_config_update)
 
-    match_value: StringProperty(name='Match Value', default='')
+    match_value: StringProperty(name='Match Value', default='', update=tag_config_update)
 
     # custom export temp path
     temporary_directory: StringProperty(name='Temporary Directory', subtype='DIR_PATH',
-                                        description="Temporary Directory to store export files.\nIf empty, use blender's default temporary directory")
+                                        description="Temporary Directory to store export files.\nIf empty, use blender's default temporary directory",
+                                        update=tag_config_update)
 
     # remove grease pencil from default because this design is only allow one default importer
     operator_type: EnumProperty(
@@ -230,23 +233,23 @@ class ConfigItemProperty(PropertyGroup):
             None,
             ('CUSTOM', 'Custom', '', 'USER', 666),
         ],
-        default='DEFAULT_OBJ', )
+        default='DEFAULT_OBJ', update=tag_config_update)
 
     # custom operator
     bl_idname: StringProperty(name='Operator Identifier', update=correct_blidname)
     context: EnumProperty(name="Operator Context",
                           items=[("INVOKE_DEFAULT", "INVOKE_DEFAULT", ''),
                                  ("EXEC_DEFAULT", "EXEC_DEFAULT", ''), ],
-                          default='EXEC_DEFAULT')
+                          default='EXEC_DEFAULT', update=tag_config_update)
     context_area: EnumProperty(name="Area",
                                items=[
                                    ("VIEW_3D", "3D View", ''),
                                    ("IMAGE_EDITOR", "Image Editor", ''),
                                    ("NODE_EDITOR", "Node Editor", ''),
                                ],
-                               default='VIEW_3D')
+                               default='VIEW_3D', update=tag_config_update)
     prop_list: CollectionProperty(type=OperatorProperty)
-    show_prop_list: BoolProperty(name='Properties', default=True)
+    show_prop_list: BoolProperty(name='Properties', default=True)  # ui only, no config update
 
 
 def register():
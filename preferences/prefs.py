@@ -10,6 +10,7 @@ from bpy.props import (EnumProperty,
 from bpy.types import PropertyGroup
 
 from .. import __folder_name__
+from .utils import tag_config_update
 import rna_keymap_ui
 
 
@@ -35,6 +36,7 @@ class OperatorPropAction:
         elif self.action == 'REMOVE':
             item.prop_list.remove(self.prop_index)
 
+        tag_config_update()
         return {'FINISHED'}
 
 
@@ -105,6 +107,7 @@ class SPIO_OT_ConfigListAction:
             for i in range(old_index, new_index - 1):
                 bpy.ops.spio.config_list_move_up()
 
+        tag_config_update()
         return {'FINISHED'}
 
 
@@ -122,6 +125,7 @@ class SPIO_OT_ConfigListMove:
         neighbor = index + (-1 if self.action == 'UP' else 1)
         my_list.move(neighbor, index)
         self.move_index(context)
+        tag_config_update()
 
         return {'FINISHED'}
 
@@ -324,6 +328,15 @@ def update_category(self, context):
         self.report({'ERROR'}, f'Category change failed:\n{e}')
 
 
+def update_clipboard_watcher(self, context):
+    from ..clipboard.watcher import start_watcher, stop_watcher
+
+    if self.use_clipboard_watcher:
+        start_watcher()
+    else:
+        stop_watcher()
+
+
 from .data_config_prop import ConfigItemProperty
 
 
@@ -351,6 +364,24 @@ class SPIO_Preference(bpy.types.AddonPreferences):
                                 description="Force to use 'utf-8' to decode filepath \nOnly enable when your system coding 'utf-8'",
                                 default=False)
     cpp_obj_importer: BoolProperty(name='Use C++ obj importer', default=False)
+    use_clipboard_watcher: BoolProperty(name='Clipboard Watcher',
+                                        description='Watch the clipboard in background and prepare files before paste\n'
+                                                    'Windows only',
+                                        default=False, update=update_clipboard_watcher)
+    use_import_workers: BoolProperty(name='Parallel Import',
+                                     description='Import large pastes in background blender processes and append the result.\n'
+                                                 'Only for the default importers, used when pasting many files',
+                                     default=False)
+    import_worker_count: IntProperty(name='Workers',
+                                     description='Background blender processes, 0 for one less than the cpu count',
+                                     default=0, min=0, max=64)
+    use_import_cache: BoolProperty(name='Import Cache',
+                                   description='Keep what is imported from a file as a .blend library,\n'
+                                               'paste the same file again append from it instead of importing',
+                                   default=False)
+    import_cache_max_size: IntProperty(name='Cache Size (MB)',
+                                       description='Remove least recently used import results above this size',
+                                       default=4096, min=1)
     # addon
     asset_helper: BoolProperty(name='Asset Helper', default=True)
     # asset helper batch import pbr tags
@@ -368,10 +399,36 @@ class SPIO_Preference(bpy.types.AddonPreferences):
     post_push_to_clipboard: BoolProperty(name='Copy After Export',
                                          description='Copy files to clipboard after export models / images (Mac Only Support One file)',
                                          default=True)
+    # temp files
+    use_temp_eviction: BoolProperty(name='Clean Temp Files',
+                                    description='Remove least recently used files in spio_temp when over budget.\n'
+                                                'Only images of the open file are kept, other saved files may still use removed ones',
+                                    default=False)
+    temp_max_size: IntProperty(name='Max Size (MB)',
+                               description='Size budget of spio_temp, 0 for no limit',
+                               default=2048, min=0)
+    temp_max_age: IntProperty(name='Max Age (Days)',
+                              description='Remove files not used for this many days, 0 for no limit',
+                              default=7, min=0)
 
     # UI
     report_time: BoolProperty(name='Report Time',
                               description='Report import time', default=True)
+    use_trace: BoolProperty(name='Trace',
+                            description='Record where each import/export spend its time,\n'
+                                        'saved as chrome trace json (open with chrome://tracing or ui.perfetto.dev)',
+                            default=False)
+    trace_dir: StringProperty(name='Trace Folder',
+                              description='Folder of the trace json files, empty for ~/spio_trace',
+                              subtype='DIR_PATH', default='')
+    use_latency_stats: BoolProperty(name='Latency Stats',
+                                    description='Keep p50/p95/p99 time and throughput of each importer/exporter,\n'
+                                                'saved in ~/spio_cache/stats.json and shown in the sidebar',
+                                    default=True)
+    use_profiler: BoolProperty(name='Profiler',
+                               description='Show a button in the sidebar to profile the next Super IO operator\n'
+                                           'with cProfile and tracemalloc, reports are saved in ~/spio_profile',
+                               default=False)
 
     disable_warning_rules: BoolProperty(name='Close Warning Rules', default=False)
     # Preset
@@ -458,6 +515,19 @@ class SPIO_Preference(bpy.types.AddonPreferences):
             row = box.row(align=True)
             row.prop(self, 'cpp_obj_importer')
 
+            row = box.row(align=True)
+            row.prop(self, 'use_clipboard_watcher')
+
+            row = box.row(align=True)
+            row.prop(self, 'use_import_workers')
+            if self.use_import_workers:
+                box.prop(self, 'import_worker_count')
+
+            row = box.row(align=True)
+            row.prop(self, 'use_import_cache')
+            if self.use_import_cache:
+                box.prop(self, 'import_cache_max_size')
+
             #### PBR Tags ####
             box = box.box()
             subcol = box.column(align=True)
@@ -501,6 +571,14 @@ class SPIO_Preference(bpy.types.AddonPreferences):
             row = box.row(align=True)
             row.prop(self, 'post_push_to_clipboard')
 
+            box = col.box()
+            box.label(text='Temporary Files', icon="FILE_CACHE")
+            box.prop(self, 'use_temp_eviction')
+            sub = box.column()
+            sub.active = self.use_temp_eviction
+            sub.prop(self, 'temp_max_size')
+            sub.prop(self, 'temp_max_age')
+
         def draw_ui():
             box = col.box()
             box.label(text='User Interface', icon='WINDOW')
@@ -512,6 +590,20 @@ class SPIO_Preference(bpy.types.AddonPreferences):
             row.prop(self, 'report_time', text='')
             row.label(text='Report Time')
 
+            row = box.row(align=True)
+            row.prop(self, 'use_trace', text='')
+            row.label(text='Trace')
+            if self.use_trace:
+                box.prop(self, 'trace_dir')
+
+            row = box.row(align=True)
+            row.prop(self, 'use_latency_stats', text='')
+            row.label(text='Latency Stats')
+
+            row = box.row(align=True)
+            row.prop(self, 'use_profiler', text='')
+            row.label(text='Profiler')
+
             row = box.row(align=True)
             row.prop(self, 'disable_warning_rules', text='')
             row.label(text='Close Warning Rules')
@@ -1,8 +1,46 @@
 import bpy
+from bpy.app.handlers import persistent
 
 from .. import __folder_name__
 
+# bump every time a config is edited, so caches built from the config list know they are stale
+CONFIG_VERSION = 0
+
 
 def get_pref():
     """get preferences of this plugin"""
     return bpy.context.preferences.addons.get(__folder_name__).preferences
+
+
+def tag_config_update(self=None, context=None):
+    """mark the config list as changed, can be used as property update callback"""
+    global CONFIG_VERSION
+    CONFIG_VERSION += 1
+
+
+def get_config_version():
+    return CONFIG_VERSION
+
+
+@persistent
+def tag_config_update_on_load(*args):
+    """preferences can be replaced by a load without any property update"""
+    tag_config_update()
+
+
+# handlers after which the config list may have been replaced
+CONFIG_LOAD_HANDLERS = ('load_post', 'load_factory_preferences_post')
+
+
+def register_config_handlers():
+    for name in CONFIG_LOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name, None)
+        if handlers is not None and tag_config_update_on_load not in handlers:
+            handlers.append(tag_config_update_on_load)
+
+
+def unregister_config_handlers():
+    for name in CONFIG_LOAD_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name, None)
+        if handlers is not None and tag_config_update_on_load in handlers:
+            handlers.remove(tag_config_update_on_load)
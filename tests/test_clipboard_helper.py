@@ -0,0 +1,184 @@
+'''Helper protocol run against the python stand-in helper (SPIO_CLIPBOARD_BACKEND=stub)
+
+    python -m pytest tests
+'''
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.stub_bpy import load_addon
+
+addon = load_addon()
+helper_module = addon.module('clipboard.helper')
+clipboard_module = addon.module('clipboard.clipboard')
+
+# answer every request twice, first with a stale id, and print noise that is not a response
+MISMATCHED_HELPER = '''
+import json, sys
+print('not a response', flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if request['cmd'] == 'quit': break
+    for request_id in (request['id'] - 1, request['id'] + 100, request['id']):
+        print(json.dumps({'id': request_id, 'ok': True, 'result': {'id': request_id}, 'error': None}), flush=True)
+'''
+
+# never answer the first process, answer once the marker file exists
+HANG_ONCE_HELPER = '''
+import json, os, sys, time
+marker = sys.argv[1]
+hang = not os.path.exists(marker)
+open(marker, 'w').close()
+for line in sys.stdin:
+    request = json.loads(line)
+    if request['cmd'] == 'quit': break
+    if hang:
+        time.sleep(30)
+    print(json.dumps({'id': request['id'], 'ok': True, 'result': {'pid': os.getpid()}, 'error': None}), flush=True)
+'''
+
+HANG_HELPER = '''
+import sys, time
+for line in sys.stdin:
+    time.sleep(30)
+'''
+
+
+class HelperTestCase(unittest.TestCase):
+    def new_helper(self, args, timeout=helper_module.HELPER_TIMEOUT):
+        helper = helper_module.ClipboardHelper(args, timeout=timeout)
+        self.addCleanup(helper.stop)
+        return helper
+
+    def new_stub_helper(self):
+        return self.new_helper(clipboard_module.StubClipboard().get_helper_args())
+
+
+class TestStubBackend(HelperTestCase):
+    def setUp(self):
+        self.env = os.environ.get('SPIO_CLIPBOARD_BACKEND')
+        os.environ['SPIO_CLIPBOARD_BACKEND'] = 'stub'
+
+    def tearDown(self):
+        helper_module.stop_helpers()
+        if self.env is None:
+            os.environ.pop('SPIO_CLIPBOARD_BACKEND', None)
+        else:
+            os.environ['SPIO_CLIPBOARD_BACKEND'] = self.env
+
+    def test_backend_from_env(self):
+        self.assertIs(clipboard_module.get_backend(), clipboard_module.StubClipboard)
+
+    def test_push_pull_files(self):
+        backend = clipboard_module.get_backend()()
+        paths = [os.path.join(tempfile.gettempdir(), 'a.obj'), os.path.join(tempfile.gettempdir(), 'b c.fbx')]
+
+        count = backend.change_count()
+        backend.push_to_clipboard(paths)
+
+        self.assertEqual(backend.pull(), paths)
+        self.assertEqual(backend.change_count(), count + 1)
+
+    def test_push_pull_image(self):
+        backend = clipboard_module.get_backend()()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, 'src.png')
+            dst = os.path.join(temp_dir, 'dst.png')
+            with open(src, 'wb') as f:
+                f.write(b'pixels')
+
+            backend.push_pixel_to_clipboard(src)
+            backend.pull_image_from_clipboard(dst)
+
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), b'pixels')
+            self.assertEqual(backend.pull(), [])
+
+
+class TestHelperProcess(HelperTestCase):
+    def test_round_trip(self):
+        helper = self.new_stub_helper()
+        helper.request('push_files', paths=['x.obj'])
+
+        self.assertEqual(helper.request('pull_files'), {'files': ['x.obj']})
+
+    def test_error_response(self):
+        helper = self.new_stub_helper()
+
+        with self.assertRaises(helper_module.HelperError):
+            helper.request('unknown_command')
+        self.assertTrue(helper.is_alive())
+
+    def test_restart_after_kill(self):
+        helper = self.new_stub_helper()
+        pid = helper.request('ping')['pid']
+
+        helper.popen.kill()
+        helper.popen.wait()
+
+        self.assertNotEqual(helper.request('ping')['pid'], pid)
+        self.assertTrue(helper.is_alive())
+
+    def test_restart_when_stdin_closed(self):
+        helper = self.new_stub_helper()
+        helper.request('ping')
+        popen = helper.popen
+
+        # the process still run but the pipe is gone, the write fails and the helper restart
+        popen.stdin.close()
+        self.assertIn('pid', helper.request('ping'))
+        self.assertIsNot(helper.popen, popen)
+        popen.kill()
+        popen.wait()
+
+    def test_timeout_restart_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            marker = os.path.join(temp_dir, 'started')
+            helper = self.new_helper([sys.executable, '-c', HANG_ONCE_HELPER, marker], timeout=0.5)
+
+            start = time.perf_counter()
+            result = helper.request('ping')
+
+            self.assertEqual(result['pid'], helper.popen.pid)
+            self.assertLess(time.perf_counter() - start, 5)
+
+    def test_timeout_gives_up(self):
+        helper = self.new_helper([sys.executable, '-c', HANG_HELPER], timeout=0.3)
+
+        with self.assertRaisesRegex(helper_module.HelperError, 'did not answer'):
+            helper.request('ping')
+        self.assertFalse(helper.is_alive())
+
+    def test_stale_and_mismatched_ids(self):
+        helper = self.new_helper([sys.executable, '-c', MISMATCHED_HELPER], timeout=2)
+
+        for i in range(3):
+            request_id = helper.request_id + 1
+            self.assertEqual(helper.request('ping'), {'id': request_id})
+
+    def test_stale_response_after_timeout(self):
+        helper = self.new_stub_helper()
+        helper.request('ping')
+
+        # an answer of an older request that timed out is still in the queue
+        helper.responses.put({'id': helper.request_id, 'ok': True, 'result': {'stale': True}, 'error': None})
+
+        self.assertEqual(helper.request('pull_files'), {'files': []})
+
+    def test_stop(self):
+        helper = self.new_stub_helper()
+        helper.request('ping')
+        popen = helper.popen
+
+        helper.stop()
+
+        self.assertEqual(popen.wait(timeout=2), 0)  # quit, not killed
+        self.assertFalse(helper.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+'''Clipboard watcher thread against the python stand-in helper (SPIO_CLIPBOARD_BACKEND=stub)'''
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.stub_bpy import load_addon
+
+addon = load_addon()
+helper_module = addon.module('clipboard.helper')
+clipboard_module = addon.module('clipboard.clipboard')
+watcher_module = addon.module('clipboard.watcher')
+
+
+class TestClipboardWatcher(unittest.TestCase):
+    def setUp(self):
+        self.watcher = watcher_module.ClipboardWatcher(clipboard_module.StubClipboard)
+        self.addCleanup(helper_module.stop_helpers)
+        self.addCleanup(self.watcher.stop)
+
+    def get_result(self):
+        return self.watcher.results.get(timeout=watcher_module.WATCH_INTERVAL * 6)
+
+    def test_payload_on_change(self):
+        self.watcher.start()
+        self.get_result()  # first poll always build a payload
+
+        clipboard_module.StubClipboard().push_to_clipboard([__file__])
+        payload = self.get_result()
+
+        self.assertEqual(payload.file_list, [__file__])
+        self.assertEqual(payload.change_count, clipboard_module.StubClipboard().change_count())
+
+    def test_stop_join_thread(self):
+        self.watcher.start()
+        thread = self.watcher.thread
+
+        self.watcher.stop()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.watcher.thread)
+
+    def test_restart_single_loop(self):
+        self.watcher.start()
+        first_signal = self.watcher.stop_signal
+        self.watcher.stop()
+        self.watcher.start()
+
+        self.assertTrue(first_signal.is_set())
+        self.assertFalse(self.watcher.stop_signal.is_set())
+        self.get_result()
+
+        clipboard_module.StubClipboard().push_to_clipboard([__file__])
+        self.get_result()
+        time.sleep(watcher_module.WATCH_INTERVAL * 2)  # a second loop would push the same change
+        self.assertTrue(self.watcher.results.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
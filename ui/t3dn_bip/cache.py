@@ -0,0 +1,195 @@
+'''Persistent cache of downscaled previews.
+
+Images that are not BIP are decoded by Pillow and scaled down on every load. The result is kept as
+BIP2 files in settings.CACHE_DIR, one per part (icon or image), keyed by the absolute source path, file size,
+mtime, max size and part, so the next session reads them like any BIP file and icon requests never decode
+the image. The modification time of a cache file is its last use,
+the least recently used files are removed when the cache is above settings.CACHE_MAX_SIZE.
+'''
+import os
+import struct
+import hashlib
+from threading import Lock, get_ident
+from zlib import error as ZlibError
+from .converter import encode_bip2
+from .formats import BIP_FORMATS, MAGIC_LENGTH
+from .utils import load_file
+from . import settings
+
+VERSION = 2  # Bump when the cached pixels change.
+COMPRESS_LEVEL = 1  # Written by the reader threads on a miss, favor speed over size.
+
+_lock = Lock()
+_size = None  # Bytes in the cache folder, scanned on first store.
+_source_locks = {}  # Source path: [lock, users], so one thread decodes a source while the others wait.
+
+
+def get_key(filepath: str, max_size: tuple, part: str) -> str:
+    '''Cache key of a part (icon or image) of a source file, changes when the file does.
+
+    Raises:
+        OSError: If the file can not be accessed.
+    '''
+    stat = os.stat(filepath)
+    data = (f'{VERSION}|{os.path.abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}|'
+            f'{max_size[0]}x{max_size[1]}|{part}')
+
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def load_file_cached(filepath: str, max_size: tuple, icon: bool = True, image: bool = True) -> dict:
+    '''Like load_file, but read images that are not BIP from the cache, or store them on a miss.'''
+    if not settings.CACHE_DIR or _is_bip(filepath):
+        return load_file(filepath, max_size, icon, image)
+
+    paths = {
+        part: os.path.join(settings.CACHE_DIR, get_key(filepath, max_size, part) + '.bip')
+        for part, wanted in (('icon', icon), ('image', image)) if wanted
+    }
+
+    data, misses = _load_parts(paths)
+    if not misses:
+        return data
+
+    with _source_lock(os.path.abspath(filepath)):
+        # Another thread may have stored the parts while this one waited.
+        found, misses = _load_parts({part: paths[part] for part in misses})
+        data.update(found)
+        if not misses:
+            return data
+
+        # Decode only the missing parts.
+        decoded = load_file(filepath, max_size, 'icon' in misses, 'image' in misses)
+        for part in misses:
+            _store(paths[part], decoded[f'{part}_size'], decoded[f'{part}_pixels'])
+        data.update(decoded)
+
+    return data
+
+
+def clear():
+    '''Remove every cached preview.'''
+    global _size
+
+    with _lock:
+        for entry in _scan():
+            _remove(entry[2])
+        _size = None
+
+
+def _load_parts(paths: dict) -> tuple:
+    '''Read cached parts, return (data, parts that are not in the cache).'''
+    data = {}
+    misses = []
+    for part, path in paths.items():
+        try:
+            data.update(load_file(path, (0, 0), part == 'icon', part == 'image'))  # Already scaled down.
+        except (OSError, ValueError, AssertionError, struct.error, ZlibError):
+            misses.append(part)
+        else:
+            _touch(path)
+
+    return data, misses
+
+
+class _source_lock():
+    '''Hold the lock of a source file, the lock is dropped when no thread use it.'''
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def __enter__(self):
+        with _lock:
+            entry = _source_locks.setdefault(self.source, [Lock(), 0])
+            entry[1] += 1
+        entry[0].acquire()
+
+    def __exit__(self, type, value, traceback):
+        with _lock:
+            entry = _source_locks[self.source]
+            entry[0].release()
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _source_locks[self.source]
+
+
+def _is_bip(filepath: str) -> bool:
+    '''Check whether a file is BIP by its magic bytes.'''
+    with open(filepath, 'rb') as file:
+        magic = file.read(MAGIC_LENGTH)
+
+    return any(magic.startswith(spec.magic) for spec in BIP_FORMATS.values())
+
+
+def _touch(path: str):
+    '''Mark a cache file as recently used.'''
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _store(path: str, size: tuple, pixels):
+    '''Write a single image cache file, then remove the least recently used files above the budget.'''
+    global _size
+
+    try:
+        content = encode_bip2([(size, pixels)], COMPRESS_LEVEL)
+
+        os.makedirs(settings.CACHE_DIR, exist_ok=True)
+        temp_path = f'{path}.{get_ident()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    except (OSError, AssertionError, struct.error):
+        return
+
+    with _lock:
+        if _size is None:
+            _size = sum(entry[1] for entry in _scan())
+        else:
+            _size += len(content)
+
+        if _size > settings.CACHE_MAX_SIZE:
+            _size = _evict(settings.CACHE_MAX_SIZE)
+
+
+def _scan() -> list:
+    '''(last use, bytes, path) of the cache files.'''
+    entries = []
+    try:
+        with os.scandir(settings.CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith('.bip'): continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        pass
+
+    return entries
+
+
+def _evict(max_bytes: int) -> int:
+    '''Remove least recently used files until the cache fits, return the bytes left.'''
+    entries = sorted(_scan())
+    total = sum(entry[1] for entry in entries)
+
+    for last_use, size, path in entries:
+        if total <= max_bytes: break
+        if _remove(path):
+            total -= size
+
+    return total
+
+
+def _remove(path: str) -> bool:
+    '''Remove a file, it may be in use on Windows.'''
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    else:
+        return True
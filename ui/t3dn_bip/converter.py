@@ -0,0 +1,186 @@
+'''Convert images to BIP2, in parallel processes.
+
+BIP2 layout (big endian):
+    magic b'BIP2', image count (1 byte),
+    one (width 2 bytes, height 2 bytes, compressed length 4 bytes) entry per image,
+    then the zlib compressed RGBa pixels of each image, bottom row first.
+The reader uses the first image as icon and the last one as full size image.
+
+Only Pillow and the standard library are used here, no bpy, so the module can run in process pool
+workers and from the command line:
+
+    python -m t3dn_bip.converter input.png output.bip
+'''
+import os
+import sys
+import site
+import struct
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from zlib import compress
+
+USER_SITE = site.getusersitepackages()
+
+if USER_SITE not in sys.path:
+    sys.path.append(USER_SITE)
+
+BIP2_MAGIC = b'BIP2'
+ICON_SIZE = (32, 32)
+IMAGE_SIZE = (256, 256)
+COMPRESS_LEVEL = 9
+
+# Folder of the t3dn_bip package, workers import this module as t3dn_bip.converter from it.
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PACKAGE_NAME = os.path.basename(os.path.dirname(os.path.abspath(__file__)))
+
+
+def encode_bip2(images: list, level: int = COMPRESS_LEVEL) -> bytes:
+    '''Encode images to BIP2.
+
+    Args:
+        images: List of (size, RGBa bytes or buffer), icon first, full size image last.
+        level: zlib compression level.
+
+    Raises:
+        AssertionError: If there are no or too many images.
+        AssertionError: If pixel count does not match size.
+    '''
+    assert 0 < len(images) < 256, 'unexpected amount of images'
+
+    header = [BIP2_MAGIC, struct.pack('>B', len(images))]
+    blocks = []
+    for size, pixels in images:
+        assert memoryview(pixels).nbytes == size[0] * size[1] * 4, 'unexpected amount of pixels'
+
+        block = compress(pixels, level)
+        header.append(struct.pack('>HHI', size[0], size[1], len(block)))
+        blocks.append(block)
+
+    return b''.join(header + blocks)
+
+
+def convert_file(src: str, dst: str, icon_size: tuple = ICON_SIZE, image_size: tuple = IMAGE_SIZE) -> str:
+    '''Convert an image file to BIP2.
+
+    Args:
+        src: The input image, any format Pillow can open.
+        dst: The output file path, replaced if it exists.
+        icon_size: Size of the icon, the image is stretched to it like previews do.
+        image_size: Scale the full size image down to fit inside it.
+
+    Returns:
+        The output file path.
+    '''
+    from PIL import Image
+
+    with Image.open(src) as image:
+        image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        image = image.convert('RGBA').convert('RGBa')
+
+    scale = min(image_size[0] / image.size[0], image_size[1] / image.size[1], 1)
+    if scale < 1:
+        size = [max(int(n * scale), 1) for n in image.size]
+        image = image.resize(size=size, resample=Image.LANCZOS)
+
+    icon = image.resize(size=tuple(icon_size), resample=Image.LANCZOS)
+    data = encode_bip2([(icon.size, icon.tobytes()), (image.size, image.tobytes())])
+
+    temp_path = dst + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+    os.replace(temp_path, dst)
+
+    return dst
+
+
+def folder_jobs(directory: str, exts: tuple = ('.png', '.jpg', '.jpeg'), overwrite: bool = False) -> list:
+    '''(source, target) pairs of the images of a folder, targets are next to the sources.'''
+    jobs = []
+    for name in sorted(os.listdir(directory)):
+        base, ext = os.path.splitext(name)
+        if ext.lower() not in exts: continue
+
+        src = os.path.join(directory, name)
+        dst = os.path.join(directory, base + '.bip')
+        if not overwrite and os.path.isfile(dst) and os.path.getmtime(dst) >= os.path.getmtime(src):
+            continue
+
+        jobs.append((src, dst))
+
+    return jobs
+
+
+def _worker_convert_file():
+    '''convert_file of this module imported as t3dn_bip.converter, which workers import without bpy.'''
+    name = f'{_PACKAGE_NAME}.converter'
+    module = sys.modules.get(name)
+    if module is None:
+        sys.path.insert(0, _PACKAGE_DIR)
+        try:
+            module = importlib.import_module(name)
+        finally:
+            sys.path.remove(_PACKAGE_DIR)
+
+    return module.convert_file
+
+
+def convert_files(
+        jobs: list,
+        icon_size: tuple = ICON_SIZE,
+        image_size: tuple = IMAGE_SIZE,
+        max_workers: int = None,
+        executable: str = None,
+):
+    '''Convert (source, target) pairs in a process pool.
+
+    Args:
+        jobs: List of (source, target) file paths.
+        max_workers: Number of processes, one process converts in this process.
+        executable: Python used by the workers, sys.executable if None.
+
+    Yields:
+        (source, target, error) as they finish, error is an empty string on success.
+    '''
+    if not jobs: return
+
+    max_workers = max(min(max_workers or os.cpu_count() or 1, len(jobs)), 1)
+    if max_workers == 1:
+        for src, dst in jobs:
+            try:
+                convert_file(src, dst, icon_size, image_size)
+            except Exception as e:
+                yield src, dst, f'{type(e).__name__}: {e}'
+            else:
+                yield src, dst, ''
+        return
+
+    # a forked blender is not safe, workers are fresh pythons that import only this module
+    context = multiprocessing.get_context('spawn')
+    if executable:
+        context.set_executable(executable)
+
+    worker = _worker_convert_file()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=site.addsitedir, initargs=(_PACKAGE_DIR,)) as executor:
+        futures = {executor.submit(worker, src, dst, icon_size, image_size): (src, dst) for src, dst in jobs}
+        for future in as_completed(futures):
+            src, dst = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                yield src, dst, f'{type(e).__name__}: {e}'
+            else:
+                yield src, dst, ''
+
+
+def main(args: list):
+    if len(args) != 2:
+        print('usage: python -m t3dn_bip.converter input.png output.bip')
+        return 1
+
+    convert_file(args[0], args[1])
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,3 +1,5 @@
+import json
+import os
 from io import BytesIO
 from base64 import b64decode
 
@@ -69,10 +71,47 @@ def _run_test(test: bytes) -> bool:
         return True
 
 
-def test_formats():
-    '''Test which formats are supported by Pillow.'''
-    for spec in PIL_FORMATS.values():
-        spec.supported = all(map(_run_test, spec.tests))
+def _read_cache(cache_path: str) -> dict:
+    '''Read cached test results, keyed by Pillow version.'''
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_path: str, cache: dict):
+    '''Write cached test results, ignore errors.'''
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(cache, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+def test_formats(cache_path: str = None):
+    '''Test which formats are supported by Pillow.
+
+    Args:
+        cache_path: Reuse results of an earlier test with the same Pillow version.
+    '''
+    from PIL import __version__ as version
+
+    cache = _read_cache(cache_path) if cache_path else {}
+    results = cache.get(version)
+
+    if not isinstance(results, dict) or set(results) != set(PIL_FORMATS):
+        results = {name: all(map(_run_test, spec.tests)) for name, spec in PIL_FORMATS.items()}
+
+        if cache_path:
+            cache[version] = results
+            _write_cache(cache_path, cache)
+
+    for name, spec in PIL_FORMATS.items():
+        spec.supported = bool(results[name])
 
 
 def unsupported_formats() -> bool:
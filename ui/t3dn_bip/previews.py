@@ -3,29 +3,31 @@ import bpy.utils.previews
 from bpy.types import ImagePreview
 from threading import Event
 from typing import ItemsView, Iterator, KeysView, ValuesView
-from .utils import support_pillow, can_load, load_file
-from .formats import unsupported_formats
+from .utils import can_load, set_preview_pixels
+from .cache import load_file_cached
 from .threads import load_async
-from . import settings
 
 
 class ImagePreviewCollection:
     '''Dictionary-like class of previews.'''
 
-    def __init__(self, max_size: tuple = (128, 128), lazy_load: bool = True):
-        '''Create collection and start internal timer.'''
-        if settings.WARNINGS:
-            if not support_pillow():
-                pass
-
-            else:
-                unsupported = unsupported_formats()
-                if unsupported:
-                    pass
-
+    def __init__(
+            self,
+            max_size: tuple = (128, 128),
+            lazy_load: bool = True,
+            image_on_demand: bool = False,
+    ):
+        '''Create collection and start internal timer.
+
+        Pillow is imported by the first load that needs it, not here.
+        With image_on_demand (and lazy_load), load only decodes the icon,
+        the full size image is decoded by request_image.
+        '''
         self._collection = bpy.utils.previews.new()
         self._max_size = max_size
         self._lazy_load = lazy_load
+        self._image_on_demand = image_on_demand and lazy_load
+        self._image_sources = {}  # name: filepath, for previews without their image yet
 
         if self._lazy_load:
             self._abort_signal = None
@@ -48,6 +50,7 @@ class ImagePreviewCollection:
 
     def pop(self, key: str) -> ImagePreview:
         '''Remove preview with the given name and return it.'''
+        self._image_sources.pop(key, None)
         return self._collection.pop(key)
 
     def get(self, key: str, default=None) -> ImagePreview:
@@ -99,16 +102,38 @@ class ImagePreviewCollection:
 
         preview = self.new(name)
 
+        if self._image_on_demand:
+            self._image_sources[name] = filepath
+
         load_async(
             self._collection,
             name,
             filepath,
             self._max_size,
             self._get_abort_signal(),
+            image=not self._image_on_demand,
         )
 
         return preview
 
+    def request_image(self, name: str):
+        '''Decode the full size image of a preview loaded with image_on_demand.
+
+        Call it where the large preview is shown, only the first call of a preview does something.
+        '''
+        filepath = self._image_sources.pop(name, None)
+        if filepath is None:
+            return
+
+        load_async(
+            self._collection,
+            name,
+            filepath,
+            self._max_size,
+            self._get_abort_signal(),
+            icon=False,
+        )
+
     def _load_fallback(
             self,
             name: str,
@@ -126,18 +151,16 @@ class ImagePreviewCollection:
 
     def _load_eager(self, name: str, filepath: str) -> ImagePreview:
         '''Load image contents from file and load preview.'''
-        data = load_file(filepath, self._max_size)
+        data = load_file_cached(filepath, self._max_size)
 
         preview = self.new(name)
-        preview.icon_size = data['icon_size']
-        preview.icon_pixels = data['icon_pixels']
-        preview.image_size = data['image_size']
-        preview.image_pixels = data['image_pixels']
+        set_preview_pixels(preview, data)
 
         return preview
 
     def clear(self):
         '''Clear all previews.'''
+        self._image_sources.clear()
         if self._lazy_load:
             self._set_abort_signal()
 
@@ -145,6 +168,7 @@ class ImagePreviewCollection:
 
     def close(self):
         '''Close the collection and clear all previews.'''
+        self._image_sources.clear()
         if self._lazy_load:
             self._set_abort_signal()
 
@@ -167,9 +191,10 @@ class ImagePreviewCollection:
 def new(
         max_size: tuple = (128, 128),
         lazy_load: bool = True,
+        image_on_demand: bool = False,
 ) -> ImagePreviewCollection:
     '''Return a new preview collection.'''
-    return ImagePreviewCollection(max_size, lazy_load)
+    return ImagePreviewCollection(max_size, lazy_load, image_on_demand)
 
 
 def remove(collection: ImagePreviewCollection):
@@ -1,3 +1,5 @@
+import os
+
 # Print warnings about which features are supported.
 WARNINGS = True
 
@@ -6,3 +8,12 @@ USE_MAGIC = False
 
 # Max number of threads used for loading image contents.
 MAX_THREADS = 4
+
+# Cache of the Pillow format test per Pillow version, None to test every session.
+FORMAT_CACHE = os.path.join(os.path.expanduser('~'), 'spio_cache', 'bip_formats.json')
+
+# Cache of downscaled previews of images that are not BIP, None to disable.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), 'spio_cache', 'previews')
+
+# Bytes the preview cache can use, least recently used previews are removed above it.
+CACHE_MAX_SIZE = 256 * 1024 * 1024
@@ -5,7 +5,8 @@ from threading import Thread, Event
 from time import time
 from traceback import print_exc
 from multiprocessing import cpu_count
-from .utils import load_file, tag_redraw
+from .utils import set_preview_pixels, tag_redraw
+from .cache import load_file_cached
 from . import settings
 
 _pending = 0
@@ -21,7 +22,7 @@ def _read_thread(stop_signal: Event):
         # Try to get the next item from the read queue. Wait up to 1 second.
         try:
             results = _queue_read.get(block=True, timeout=1.0)
-            collection, name, filepath, max_size, abort_signal = results
+            collection, name, filepath, max_size, parts, abort_signal = results
         except:
             continue
 
@@ -29,7 +30,7 @@ def _read_thread(stop_signal: Event):
         data = None
         if not abort_signal.is_set():
             try:
-                data = load_file(filepath, max_size)
+                data = load_file_cached(filepath, max_size, *parts)
             except:
                 print_exc()
 
@@ -62,11 +63,7 @@ def _emplace_timer():
         # Move data to preview object.
         if not abort_signal.is_set() and name in collection:
             try:
-                preview = collection[name]
-                preview.icon_size = data['icon_size']
-                preview.icon_pixels = data['icon_pixels']
-                preview.image_size = data['image_size']
-                preview.image_pixels = data['image_pixels']
+                set_preview_pixels(collection[name], data)
             except:
                 print_exc()
             else:
@@ -100,6 +97,8 @@ def load_async(
     filepath: str,
     max_size: tuple,
     abort_signal: Event,
+    icon: bool = True,
+    image: bool = True,
 ):
     '''Load image asynchronously. Needs to be called on the main thread.'''
     global _pending
@@ -109,7 +108,7 @@ def load_async(
     _pending += 1
 
     # Queue for reading.
-    _queue_read.put((collection, name, filepath, max_size, abort_signal))
+    _queue_read.put((collection, name, filepath, max_size, (icon, image), abort_signal))
 
     # Start read threads if they're not running.
     if not _thread_stop_signal:
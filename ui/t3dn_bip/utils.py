@@ -1,13 +1,15 @@
 import bpy
 import io
 import sys
+import mmap
+import struct
 import site
 import subprocess
 import importlib.util
 from pathlib import Path
 from zlib import decompress
-from array import array
-from .formats import test_formats, BIP_FORMATS, PIL_FORMATS, MAGIC_LENGTH
+from threading import Lock
+from .formats import test_formats, unsupported_formats, BIP_FORMATS, PIL_FORMATS, MAGIC_LENGTH
 from . import settings
 
 USER_SITE = site.getusersitepackages()
@@ -16,37 +18,50 @@ if USER_SITE not in sys.path:
     sys.path.append(USER_SITE)
 
 Image = None
+_pillow_imported = False
+_pillow_lock = Lock()
 
 
 def _import_pillow():
     '''Import Pillow and test which formats are supported.'''
     global Image
+    global _pillow_imported
 
-    try:
-        from PIL import Image
-    except:
-        pass
-    else:
-        test_formats()
+    with _pillow_lock:
+        _pillow_imported = True
+        if Image:
+            return
 
+        try:
+            from PIL import Image
+        except:
+            pass
+        else:
+            test_formats(settings.FORMAT_CACHE)
 
-_import_pillow()
+            if settings.WARNINGS and unsupported_formats():
+                print(f'BIP: Pillow can not load {", ".join(unsupported_formats())}')
 
 
 def support_pillow() -> bool:
-    '''Check whether Pillow is installed.'''
-    if not Image and 'PIL' in sys.modules:
+    '''Check whether Pillow is installed, import it on the first call.'''
+    if not _pillow_imported or (not Image and 'PIL' in sys.modules):
         _import_pillow()
 
     return bool(Image)
 
 
+def get_python_executable() -> str:
+    '''Python of Blender, sys.executable is Blender itself before 2.92.'''
+    if 'python' in Path(sys.executable).stem.lower():
+        return sys.executable
+
+    return bpy.app.binary_path_python
+
+
 def install_pillow() -> bool:
     '''Click Install to auto install, tutorial to check tutorial image Pillow and import the Image module.'''
-    if 'python' in Path(sys.executable).stem.lower():
-        exe = sys.executable
-    else:
-        exe = bpy.app.binary_path_python
+    exe = get_python_executable()
 
     args = [exe, '-m', 'ensurepip', '--user', '--upgrade', '--default-pip']
     if subprocess.call(args=args, timeout=600):
@@ -116,15 +131,22 @@ def can_load(filepath: str) -> bool:
     return False
 
 
-def load_file(filepath: str, max_size: tuple) -> dict:
+_BIP2_HEADER = struct.Struct('>4sB')
+_BIP2_ENTRY_SIZE = 8
+
+
+def load_file(filepath: str, max_size: tuple, icon: bool = True, image: bool = True) -> dict:
     '''Load image preview data from file.
 
     Args:
         filepath: The input file path.
         max_size: Scale images above this size down.
+        icon: Load the icon.
+        image: Load the full size image.
 
     Returns:
-        A dictionary with icon_size, icon_pixels, image_size, image_pixels.
+        A dictionary with icon_size, icon_pixels and/or image_size, image_pixels.
+        Pixels are 32 bit memoryviews on the decoded bytes.
 
     Raises:
         AssertionError: If pixel data type is not 32 bit.
@@ -135,78 +157,106 @@ def load_file(filepath: str, max_size: tuple) -> dict:
         magic = bip.read(MAGIC_LENGTH)
 
         if magic.startswith(BIP_FORMATS['BIP2'].magic):
-            bip.seek(len(BIP_FORMATS['BIP2'].magic), io.SEEK_SET)
+            return _load_bip2(bip, max_size, icon, image)
+
+    if support_pillow():
+        with Image.open(filepath) as source:
+            source = source.transpose(Image.FLIP_TOP_BOTTOM)
+            source = source.convert('RGBA').convert('RGBa')
+
+            data = {}
+            if image:
+                if _should_resize(source.size, max_size):
+                    source = _resize_image(source, max_size)
+
+                data['image_size'] = source.size
+                data['image_pixels'] = _as_pixels(source.tobytes(), source.size)
+
+            if icon:
+                if _should_resize(source.size, (32, 32)):
+                    source = source.resize(size=(32, 32))
+
+                data['icon_size'] = source.size
+                data['icon_pixels'] = _as_pixels(source.tobytes(), source.size)
+
+            return data
+
+    raise ValueError('input is not a supported file format')
+
+
+def _load_bip2(bip: io.BufferedReader, max_size: tuple, icon: bool = True, image: bool = True) -> dict:
+    '''Decode the first (icon) and/or last (image) block of an open BIP2 file.
 
-            count = int.from_bytes(bip.read(1), 'big')
+    The file is memory mapped, blocks are decompressed from the mapping without reading them
+    into Python bytes first, and the decompressed bytes are viewed as pixels without a copy.
+    '''
+    data = {}
+
+    with mmap.mmap(bip.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            _, count = _BIP2_HEADER.unpack_from(view)
             assert count > 0, 'the file contains no images'
 
-            icon_size = [int.from_bytes(bip.read(2), 'big') for _ in range(2)]
-            icon_length = int.from_bytes(bip.read(4), 'big')
-            bip.seek(8 * (count - 2), io.SEEK_CUR)
-            image_size = [int.from_bytes(bip.read(2), 'big') for _ in range(2)]
-            image_length = int.from_bytes(bip.read(4), 'big')
-
-            icon_content = decompress(bip.read(icon_length))
-            bip.seek(-image_length, io.SEEK_END)
-            image_content = decompress(bip.read(image_length))
-
-            if support_pillow() and _should_resize(image_size, max_size):
-                image = Image.frombytes('RGBa', image_size, image_content)
-                image = _resize_image(image, max_size)
-                image_size = image.size
-                image_content = image.tobytes()
-
-            icon_pixels = array('i', icon_content)
-            assert icon_pixels.itemsize == 4, 'unexpected bytes per pixel'
-            length = icon_size[0] * icon_size[1]
-            assert len(icon_pixels) == length, 'unexpected amount of pixels'
-
-            image_pixels = array('i', image_content)
-            assert image_pixels.itemsize == 4, 'unexpected bytes per pixel'
-            length = image_size[0] * image_size[1]
-            assert len(image_pixels) == length, 'unexpected amount of pixels'
-
-            return {
-                'icon_size': icon_size,
-                'icon_pixels': icon_pixels,
-                'image_size': image_size,
-                'image_pixels': image_pixels,
-            }
+            # One (width, height, length) entry per image.
+            table = struct.unpack_from('>' + 'HHI' * count, view, _BIP2_HEADER.size)
+            icon_size, icon_length = list(table[0:2]), table[2]
+            image_size, image_length = list(table[-3:-1]), table[-1]
 
-    if support_pillow():
-        with Image.open(filepath) as image:
-            image = image.transpose(Image.FLIP_TOP_BOTTOM)
-            image = image.convert('RGBA').convert('RGBa')
+            if icon:
+                icon_start = _BIP2_HEADER.size + _BIP2_ENTRY_SIZE * count
+                with view[icon_start:icon_start + icon_length] as block:
+                    icon_content = decompress(block, 0, icon_size[0] * icon_size[1] * 4)
 
-            if _should_resize(image.size, max_size):
-                image = _resize_image(image, max_size)
+                data['icon_size'] = icon_size
+                data['icon_pixels'] = _as_pixels(icon_content, icon_size)
 
-            image_pixels = array('i', image.tobytes())
-            assert image_pixels.itemsize == 4, 'unexpected bytes per pixel'
-            length = image.size[0] * image.size[1]
-            assert len(image_pixels) == length, 'unexpected amount of pixels'
+            if image:
+                with view[len(view) - image_length:] as block:
+                    image_content = decompress(block, 0, image_size[0] * image_size[1] * 4)
+        finally:
+            view.release()
 
-            data = {
-                'icon_size': image.size,
-                'icon_pixels': image_pixels,
-                'image_size': image.size,
-                'image_pixels': image_pixels,
-            }
+    if image:
+        if _should_resize(image_size, max_size) and support_pillow():
+            source = Image.frombuffer('RGBa', image_size, image_content, 'raw', 'RGBa', 0, 1)
+            source = _resize_image(source, max_size)
+            image_size = list(source.size)
+            image_content = source.tobytes()
 
-            if _should_resize(image.size, (32, 32)):
-                icon = image.resize(size=(32, 32))
+        data['image_size'] = image_size
+        data['image_pixels'] = _as_pixels(image_content, image_size)
 
-                icon_pixels = array('i', icon.tobytes())
-                assert icon_pixels.itemsize == 4, 'unexpected bytes per pixel'
-                length = icon.size[0] * icon.size[1]
-                assert len(icon_pixels) == length, 'unexpected amount of pixels'
+    return data
 
-                data['icon_size'] = icon.size
-                data['icon_pixels'] = icon_pixels
 
-            return data
+def _as_pixels(content: bytes, size: tuple) -> memoryview:
+    '''View RGBa bytes as 32 bit pixels, without a copy.'''
+    assert len(content) == size[0] * size[1] * 4, 'unexpected amount of pixels'
 
-    raise ValueError('input is not a supported file format')
+    pixels = memoryview(content).cast('i')
+    assert pixels.itemsize == 4, 'unexpected bytes per pixel'
+
+    return pixels
+
+
+def set_preview_pixels(preview: 'bpy.types.ImagePreview', data: dict):
+    '''Move loaded data into a preview, buffers are passed to Blender in one call when supported.'''
+    if 'icon_pixels' in data:
+        preview.icon_size = data['icon_size']
+        _set_pixels(preview, 'icon_pixels', data['icon_pixels'])
+
+    if 'image_pixels' in data:
+        preview.image_size = data['image_size']
+        _set_pixels(preview, 'image_pixels', data['image_pixels'])
+
+
+def _set_pixels(preview: 'bpy.types.ImagePreview', attr: str, pixels: memoryview):
+    '''Set a pixel array with foreach_set, which reads the buffer directly.'''
+    try:
+        getattr(preview, attr).foreach_set(pixels)
+    except (AttributeError, TypeError):
+        setattr(preview, attr, pixels)
 
 
 def _should_resize(size: tuple, max_size: tuple) -> bool:
@@ -74,6 +74,58 @@ class SPIO_PT_ImportPanel(SidebarSetup, bpy.types.Panel):
         row.operator("wm.super_export", icon_value=G_ICON_ID['export'])
         row.separator()
 
+        if get_pref().use_import_cache:
+            from ..ops.import_cache import get_import_cache
+            size = get_import_cache().get_draw_size()
+            size_text = f'{round(size / 1024 / 1024, 1)} MB' if size is not None else '...'
+            row = layout.row(align=True)
+            row.label(text=f'Import Cache {size_text}', icon='FILE_CACHE')
+            row.operator('spio.purge_import_cache', text='', icon='TRASH')
+
+        if get_pref().use_profiler:
+            from ..ops.profiler import PROFILER
+            row = layout.row(align=True)
+            row.operator('spio.profile_next', icon='REC', depress=PROFILER.armed)
+            row.operator('spio.open_profile_report', text='', icon='TEXT')
+
+
+class SPIO_PT_LatencyPanel(SidebarSetup, bpy.types.Panel):
+    bl_label = 'Latency'
+    bl_parent_id = 'SPIO_PT_ImportPanel'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_pref().use_latency_stats
+
+    def draw_header(self, context):
+        self.layout.operator('spio.reset_latency_stats', text='', icon='TRASH', emboss=False)
+
+    def draw(self, context):
+        from ..ops.latency_stats import get_summary
+
+        layout = self.layout
+        summary = get_summary()
+        if len(summary) == 0:
+            layout.label(text=f'No import/export yet in Blender {bpy.app.version_string}')
+            return
+
+        for key, stats in sorted(summary.items()):
+            path_type, ext, bl_idname = key.split('|', 2)
+
+            box = layout.box()
+            row = box.row()
+            row.label(text=f'{ext.upper()}  {path_type.replace("_", " ").title()}')
+            row.label(text=f'{stats["count"]} calls')
+            box.label(text=bl_idname)
+
+            col = box.column(align=True)
+            col.label(text=f'Per file  p50 {stats["p50"]:.3f}s   p95 {stats["p95"]:.3f}s   p99 {stats["p99"]:.3f}s')
+            col.label(text=f'{stats["files_per_s"]:.2f} files/s   {stats["mb_per_s"]:.2f} MB/s')
+            if 'prev_p50' in stats:
+                col.label(text=f'Blender {stats["prev_version"]}: p50 {stats["prev_p50"]:.3f}s',
+                          icon='TIME')
+
 
 class SPIO_PT_AssetHelper(SidebarSetup, bpy.types.Panel):
     bl_label = 'Asset Helper'
@@ -112,6 +164,7 @@ panels = (
     SPIO_PT_PrefPanel_283,
     SPIO_PT_PrefPanel_300,
     SPIO_PT_ImportPanel,
+    SPIO_PT_LatencyPanel,
     SPIO_PT_AssetHelper,
 )
 
@@ -123,6 +176,7 @@ def register():
         bpy.utils.register_class(SPIO_PT_PrefPanel_300)
 
     bpy.utils.register_class(SPIO_PT_ImportPanel)
+    bpy.utils.register_class(SPIO_PT_LatencyPanel)
     bpy.utils.register_class(SPIO_PT_AssetHelper)
 
 
@@ -132,6 +186,7 @@ def unregister():
     else:
         bpy.utils.unregister_class(SPIO_PT_PrefPanel_300)
 
+    bpy.utils.unregister_class(SPIO_PT_LatencyPanel)
     bpy.utils.unregister_class(SPIO_PT_ImportPanel)
     bpy.utils.unregister_class(SPIO_PT_AssetHelper)
 